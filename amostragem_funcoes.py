@@ -0,0 +1,253 @@
+"""
+Amostragem das funções da calculadora de matemática para gráficos.
+
+Dados os coeficientes, o intervalo de x e um orçamento de pontos, a função é
+avaliada de uma vez sobre arrays NumPy. A grade começa uniforme, recebe os
+pontos notáveis (raízes, vértice, assíntotas) e é refinada onde a curva se
+afasta da reta entre pontos vizinhos: a cada rodada os pontos médios de todos
+os segmentos são avaliados juntos e os de maior desvio entram na grade, até
+esgotar o orçamento ou a curva ficar dentro da tolerância.
+
+Os pontos saem no formato compacto de ``matrizes`` (float64 em base64), com
+``NaN`` onde a função não está definida.
+"""
+
+import math
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from calc_matematica import abscissa_do_vertice
+from matrizes import buffer_compacto
+
+Coeficientes = Dict[str, float]
+
+# Desvio máximo, relativo à amplitude de y, para um segmento ser considerado reto
+_TOLERANCIA = 1e-3
+
+# Rodadas de refinamento (cada uma pode dividir todos os segmentos)
+_MAX_RODADAS = 60
+
+
+class Caracteristicas(NamedTuple):
+    """Pontos notáveis de uma função."""
+    raizes: Tuple[float, ...] = ()
+    vertice: Optional[Tuple[float, float]] = None
+    assintotas_verticais: Tuple[float, ...] = ()
+    assintotas_horizontais: Tuple[float, ...] = ()
+    # Início do domínio (exclusivo), quando a função não é definida para todo x
+    dominio_minimo: Optional[float] = None
+
+
+class Funcao(NamedTuple):
+    """Função amostrável: seus coeficientes, a avaliação vetorizada e os pontos notáveis."""
+    coeficientes: Tuple[str, ...]
+    expressao: str
+    avaliar: Callable[[Coeficientes, np.ndarray], np.ndarray]
+    caracteristicas: Callable[[Coeficientes], Caracteristicas]
+
+
+def _raizes_2_grau(a: float, b: float, c: float) -> Tuple[float, ...]:
+    """Raízes reais de ax² + bx + c, pela forma que evita cancelamento."""
+    if a == 0:
+        return () if b == 0 else (-c / b,)
+    delta = b * b - 4 * a * c
+    if delta < 0:
+        return ()
+    q = -(b + math.copysign(math.sqrt(delta), b)) / 2
+    if q == 0:
+        return (0.0,)
+    return tuple(sorted({q / a, c / q}))
+
+
+def _1_grau(k: Coeficientes) -> Caracteristicas:
+    return Caracteristicas(raizes=() if k['ax'] == 0 else (-k['b'] / k['ax'],))
+
+
+def _2_grau(k: Coeficientes) -> Caracteristicas:
+    a, b, c = k['ax2'], k['bx'], k['c']
+    if a == 0:
+        return Caracteristicas(raizes=_raizes_2_grau(a, b, c))
+    xv = abscissa_do_vertice(a, b)
+    return Caracteristicas(raizes=_raizes_2_grau(a, b, c), vertice=(xv, a * xv * xv + b * xv + c))
+
+
+def _exponencial(k: Coeficientes) -> Caracteristicas:
+    if k['b'] <= 0:
+        raise ValueError("A base b da função exponencial deve ser positiva.")
+    return Caracteristicas(assintotas_horizontais=() if k['b'] == 1 or k['a'] == 0 else (0.0,))
+
+
+def _logaritmica(k: Coeficientes) -> Caracteristicas:
+    if k['b'] <= 0 or k['b'] == 1:
+        raise ValueError("A base b do logaritmo deve ser positiva e diferente de 1.")
+    return Caracteristicas(raizes=(1.0,), assintotas_verticais=(0.0,), dominio_minimo=0.0)
+
+
+FUNCOES: Dict[str, Funcao] = {
+    'funcao_do_1_grau': Funcao(
+        ('ax', 'b'), 'f(x) = ax·x + b',
+        lambda k, x: k['ax'] * x + k['b'], _1_grau),
+    'funcao_do_2_grau': Funcao(
+        ('ax2', 'bx', 'c'), 'f(x) = ax2·x² + bx·x + c',
+        lambda k, x: (k['ax2'] * x + k['bx']) * x + k['c'], _2_grau),
+    'funcao_exponencial': Funcao(
+        ('a', 'b'), 'f(x) = a·b^x',
+        lambda k, x: k['a'] * np.power(k['b'], x), _exponencial),
+    'funcao_logaritmica': Funcao(
+        ('b',), 'f(x) = log_b(x)',
+        lambda k, x: np.log(x) / math.log(k['b']), _logaritmica),
+}
+
+
+def _coeficientes(funcao: Funcao, tipo_calculo: str, valores: Dict[str, Any]) -> Coeficientes:
+    coeficientes = {}
+    for chave, valor in valores.items():
+        if valor is None or valor == '':
+            continue
+        if chave not in funcao.coeficientes:
+            raise ValueError(f"Parâmetro '{chave}' não é aceito por '{tipo_calculo}'. "
+                             f"Coeficientes: {', '.join(funcao.coeficientes)}.")
+        try:
+            coeficientes[chave] = float(valor)
+        except (TypeError, ValueError):
+            raise ValueError(f"Valor inválido para {chave}: {valor}")
+        if not math.isfinite(coeficientes[chave]):
+            raise ValueError(f"Valor inválido para {chave}: {valor}")
+    faltando = [c for c in funcao.coeficientes if c not in coeficientes]
+    if faltando:
+        raise ValueError(f"Informe os coeficientes: {', '.join(faltando)}.")
+    return coeficientes
+
+
+def _intervalo(intervalo: Optional[Dict[str, Any]]) -> Tuple[float, float]:
+    if not isinstance(intervalo, dict):
+        raise ValueError("Informe o intervalo de x no formato {'inicio': ..., 'fim': ...}.")
+    try:
+        inicio, fim = float(intervalo['inicio']), float(intervalo['fim'])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("O intervalo deve ter 'inicio' e 'fim' numéricos.")
+    if not (math.isfinite(inicio) and math.isfinite(fim)) or inicio >= fim:
+        raise ValueError("O intervalo deve ser finito, com 'inicio' menor que 'fim'.")
+    return inicio, fim
+
+
+def _avaliar(funcao: Funcao, coeficientes: Coeficientes, x: np.ndarray) -> np.ndarray:
+    """Avalia a função trocando valores fora do domínio ou infinitos por NaN."""
+    with np.errstate(all='ignore'):
+        y = np.asarray(funcao.avaliar(coeficientes, x), dtype=float)
+    y = np.broadcast_to(y, x.shape).copy()
+    y[~np.isfinite(y)] = np.nan
+    return y
+
+
+def _grade_inicial(inicio: float, fim: float, pontos: int, carac: Caracteristicas) -> np.ndarray:
+    """Grade uniforme com os pontos notáveis e pontos concentrados junto às assíntotas verticais."""
+    largura = fim - inicio
+    partes = [np.linspace(inicio, fim, max(pontos // 2, 2))]
+    notaveis = list(carac.raizes)
+    if carac.vertice is not None:
+        notaveis.append(carac.vertice[0])
+    partes.append(np.array([x for x in notaveis if inicio < x < fim], dtype=float))
+    for assintota in carac.assintotas_verticais:
+        # Espaçamento geométrico dos dois lados, dentro do intervalo
+        distancias = np.geomspace(largura * 1e-9, largura, max(pontos // 8, 2))
+        for lado in (-1, 1):
+            perto = assintota + lado * distancias
+            partes.append(perto[(perto > inicio) & (perto < fim)])
+    x = np.unique(np.concatenate(partes))
+    if carac.dominio_minimo is not None:
+        x = x[x > carac.dominio_minimo]
+    return x
+
+
+def _refinar(funcao: Funcao, coeficientes: Coeficientes, x: np.ndarray, pontos: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Insere pontos médios nos segmentos que mais se afastam de uma reta, até o orçamento."""
+    y = _avaliar(funcao, coeficientes, x)
+    for _ in range(_MAX_RODADAS):
+        restantes = pontos - x.size
+        if restantes <= 0:
+            break
+        medios = (x[:-1] + x[1:]) / 2
+        # Segmentos que já não podem ser divididos em float64
+        divisiveis = (medios > x[:-1]) & (medios < x[1:])
+        y_medios = _avaliar(funcao, coeficientes, medios)
+
+        # Desvios medidos em relação à amplitude de y (ou ao seu módulo, se a curva for constante)
+        finitos = y[np.isfinite(y)]
+        escala = 1.0
+        if finitos.size:
+            escala = float(np.ptp(finitos)) or max(float(np.max(np.abs(finitos))), 1.0)
+        with np.errstate(invalid='ignore'):
+            desvio = np.abs(y_medios - (y[:-1] + y[1:]) / 2) / escala
+        # Fronteira do domínio: um lado definido e o outro não
+        definidos = np.isfinite(y[:-1]) + np.isfinite(y[1:]) + np.isfinite(y_medios)
+        desvio = np.where(np.isnan(desvio), np.where((definidos > 0) & (definidos < 3), np.inf, 0.0), desvio)
+        desvio[~divisiveis] = 0.0
+
+        candidatos = np.flatnonzero(desvio > _TOLERANCIA)
+        if candidatos.size == 0:
+            break
+        if candidatos.size > restantes:
+            candidatos = candidatos[np.argpartition(desvio[candidatos], -restantes)[-restantes:]]
+        candidatos.sort()
+        x = np.insert(x, candidatos + 1, medios[candidatos])
+        y = np.insert(y, candidatos + 1, y_medios[candidatos])
+    return x, y
+
+
+def amostrar(tipo_calculo: str, intervalo: Dict[str, Any], pontos: int,
+             max_pontos: int = 5000, **valores) -> Dict[str, Any]:
+    """
+    Amostra uma função para desenhar o seu gráfico.
+
+    Args:
+        tipo_calculo (str): Função a amostrar (funcao_do_1_grau, funcao_do_2_grau,
+            funcao_exponencial ou funcao_logaritmica)
+        intervalo (Dict[str, Any]): Faixa de x no formato {'inicio', 'fim'}
+        pontos (int): Orçamento de pontos da amostra
+        max_pontos (int): Limite do orçamento
+        **valores: Coeficientes da função
+
+    Returns:
+        Dict[str, Any]: Pontos x e y em formato compacto, os pontos notáveis e a expressão
+    """
+    funcao = FUNCOES.get(tipo_calculo)
+    if funcao is None:
+        raise ValueError(f"Função '{tipo_calculo}' não pode ser amostrada. Opções: {', '.join(FUNCOES)}.")
+    try:
+        pontos = int(pontos)
+    except (TypeError, ValueError):
+        raise ValueError("O número de pontos deve ser um inteiro.")
+    if not 2 <= pontos <= max_pontos:
+        raise ValueError(f"O número de pontos deve estar entre 2 e {max_pontos}.")
+
+    coeficientes = _coeficientes(funcao, tipo_calculo, valores)
+    inicio, fim = _intervalo(intervalo)
+    carac = funcao.caracteristicas(coeficientes)
+    if carac.dominio_minimo is not None and fim <= carac.dominio_minimo:
+        raise ValueError(f"O intervalo está fora do domínio da função (x > {carac.dominio_minimo:g}).")
+
+    x = _grade_inicial(inicio, fim, pontos, carac)
+    if x.size > pontos:
+        # Orçamento muito pequeno para a grade inicial: fica uma subamostra espaçada
+        x = x[np.unique(np.linspace(0, x.size - 1, pontos).round().astype(int))]
+    x, y = _refinar(funcao, coeficientes, x, pontos)
+
+    def dentro(valores_x: Tuple[float, ...]) -> List[float]:
+        return [v for v in valores_x if inicio <= v <= fim]
+
+    return {
+        'expressao': funcao.expressao,
+        'coeficientes': coeficientes,
+        'pontos': int(x.size),
+        'x': buffer_compacto(x),
+        'y': buffer_compacto(y),
+        'raizes': dentro(carac.raizes),
+        'vertice': ({'x': carac.vertice[0], 'y': carac.vertice[1]}
+                    if carac.vertice is not None and inicio <= carac.vertice[0] <= fim else None),
+        'assintotas': {
+            'verticais': dentro(carac.assintotas_verticais),
+            'horizontais': list(carac.assintotas_horizontais),
+        },
+    }
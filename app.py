@@ -2,8 +2,8 @@
 Aplicação principal do CalcLab.
 """
 
-from typing import Dict, Any, Optional
-from flask import Flask, render_template, request, jsonify, Response, redirect, url_for, flash, session, send_file
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from flask import Flask, render_template, request, jsonify, Response, redirect, url_for, flash, session, send_file, g, has_request_context, abort
 from datetime import datetime, timedelta
 from werkzeug.exceptions import NotFound, BadRequest
 import config
@@ -12,15 +12,20 @@ import calc_fisica as calc_fis
 import calc_quimica as calc_qui
 import json
 import os
+import time
 from werkzeug.security import generate_password_hash, check_password_hash
 import logging
-from pymongo import MongoClient
 from dotenv import load_dotenv
 from functools import wraps
-from bson.objectid import ObjectId
 import sqlite3
-import pytz
-import shutil
+from banco_dados import PoolConexoes
+from cache_calculos import criar_cache_calculos
+import metricas
+from perfilador import Perfilador
+from aquecimento import preaquecer
+from backup import AgendadorBackup
+from exportacao_usuarios import gerar_csv, gerar_jsonl
+from paginacao_usuarios import ORDENACOES, CursorInvalido, PaginaUsuarios, criar_indices, listar_usuarios
 from chatbot_logic import chatbot
 
 # Carrega variáveis de ambiente
@@ -46,11 +51,27 @@ ADMIN_PASSWORD = "123456"  # Em produção, use uma senha mais segura
 
 print('Banco de dados será criado em:', os.path.abspath(DATABASE))
 
+# Conexões reaproveitadas entre requisições neste processo
+db_pool = PoolConexoes(
+    DATABASE,
+    tamanho=config.BANCO_POOL_TAMANHO,
+    busy_timeout=config.BANCO_BUSY_TIMEOUT,
+    mmap_size=config.BANCO_MMAP_SIZE,
+    fabrica=metricas.ConexaoMedida if config.METRICAS_ATIVAS else sqlite3.Connection
+)
+
 def get_db():
-    """Conecta ao banco de dados SQLite"""
-    db = sqlite3.connect(DATABASE)
-    db.row_factory = sqlite3.Row
-    return db
+    """Retorna a conexão SQLite do contexto atual, emprestada do pool"""
+    if 'db' not in g:
+        g.db = db_pool.adquirir()
+    return g.db
+
+@app.teardown_appcontext
+def close_db(exception: Optional[BaseException] = None) -> None:
+    """Devolve a conexão do contexto ao pool"""
+    db = g.pop('db', None)
+    if db is not None:
+        db_pool.devolver(db)
 
 def get_brazil_time():
     """Retorna o horário atual do Brasil (UTC-3)"""
@@ -93,8 +114,10 @@ def init_db():
             db.execute('INSERT INTO admins (username, password) VALUES (?, ?)', ('admin', 'admin123'))
             logger.info("Admin padrão criado com sucesso")
         
+        # Índices da listagem paginada de usuários
+        criar_indices(db)
+        
         db.commit()
-        db.close()
         logger.info("Banco de dados inicializado com sucesso")
     except Exception as e:
         logger.error(f"Erro ao inicializar banco de dados: {str(e)}")
@@ -137,6 +160,149 @@ def index() -> str:
     print("DEBUG: Session contents:", dict(session))  # Debug print
     return render_template('index.html')
 
+# Cache dos resultados das calculadoras, conforme CACHE_TYPE
+calc_cache = criar_cache_calculos(
+    config.CACHE_TYPE,
+    validade=config.CACHE_DEFAULT_TIMEOUT,
+    tamanho_maximo=config.CACHE_THRESHOLD,
+    caminho_sqlite=config.CACHE_SQLITE_BANCO
+)
+
+def _perfil_solicitado() -> bool:
+    """Administradores podem pedir o perfil de uma requisição com o cabeçalho X-CalcLab-Profile: 1"""
+    return (has_request_context() and bool(session.get('is_admin'))
+            and request.headers.get('X-CalcLab-Profile') == '1')
+
+# Perfilamento opcional dos cálculos, por amostragem ou a pedido
+perfilador = Perfilador(
+    config.PERFIL_PASTA,
+    ativo=config.PERFIL_ATIVO,
+    amostragem=config.PERFIL_AMOSTRAGEM,
+    manter=config.PERFIL_MANTER,
+    formato=config.PERFIL_FORMATO,
+    solicitado=_perfil_solicitado
+)
+
+@metricas.medir_calculo('matematica', calc_mat.REGISTRO)
+@calc_cache.memorizar('matematica')
+@perfilador.perfilar('matematica')
+def _processar_matematica(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Executa um cálculo de matemática e devolve o corpo da resposta e o status HTTP."""
+    tipo_calculo = data.get('tipo_calculo')
+    valores = {k: v for k, v in data.items() if k != 'tipo_calculo'}
+
+    try:
+        resultado, unidades = calc_mat.calculate_matematica(tipo_calculo, **valores)
+        # Matrizes e vetores seguem como JSON; escalares viram texto com a unidade
+        resultado_formatado = {
+            k: v if isinstance(v, (list, dict)) else f"{v} {unidades.get(k, '')}"
+            for k, v in resultado.items()
+        }
+        return {'resultado': resultado_formatado}, 200
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    except Exception as e:
+        logger.exception("Erro inesperado no cálculo de matemática")
+        return {'error': 'Ocorreu um erro inesperado ao calcular.'}, 500
+
+@metricas.medir_calculo('fisica', calc_fis.REGISTRO)
+@calc_cache.memorizar('fisica', ignorar_listas=True)
+@perfilador.perfilar('fisica')
+def _processar_fisica(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Executa um cálculo de física e devolve o corpo da resposta e o status HTTP."""
+    try:
+        tipo_calculo = data.get('tipo_calculo')
+        if not tipo_calculo:
+            return {'error': 'Tipo de cálculo não especificado'}, 400
+
+        # Remove o tipo_calculo dos dados para passar para a função de cálculo
+        valores = {k: v for k, v in data.items() if k != 'tipo_calculo'}
+
+        # Listas seguem pelo modo vetorizado, com os elementos inválidos de cada validação
+        if calc_fis.tem_vetor(valores):
+            resultado, unidades, invalidos = calc_fis.calculate_fisica_vetorizado(
+                tipo_calculo, max_pontos=config.VARREDURA_MAX_PONTOS, **valores
+            )
+            return {
+                'resultado': {variavel: _lista_json(valor) for variavel, valor in resultado.items()},
+                'unidades': unidades,
+                'invalidos': {mensagem: _lista_json(mascara) for mensagem, mascara in invalidos.items()}
+            }, 200
+
+        # Chama a função de cálculo apropriada (o registro converte os valores para float)
+        resultado, unidades = calc_fis.calculate_fisica(tipo_calculo, **valores)
+
+        # Formata o resultado com as unidades
+        resultado_formatado = {}
+        for variavel, valor in resultado.items():
+            unidade = unidades.get(variavel, '')
+            resultado_formatado[variavel] = f"{valor:.5f} {unidade}".strip()
+
+        return {'resultado': resultado_formatado}, 200
+
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    except Exception as e:
+        return {'error': f'Erro ao processar cálculo: {str(e)}'}, 500
+
+@metricas.medir_calculo('quimica', calc_qui.REGISTRO)
+@calc_cache.memorizar('quimica')
+@perfilador.perfilar('quimica')
+def _processar_quimica(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Executa um cálculo de química e devolve o corpo da resposta e o status HTTP."""
+    tipo_calculo = data.get('tipo_calculo')
+    valores = {k: v for k, v in data.items() if k != 'tipo_calculo'}
+
+    try:
+        resultado, unidades = calc_qui.calculate_quimica(tipo_calculo, **valores)
+
+        # Formatação simplificada dos resultados
+        resultado_formatado = ""
+        for variavel, valor in resultado.items():
+            unidade = unidades.get(variavel, '')
+            # Simplifica o nome da variável
+            nome_variavel = variavel.split(' da ')[-1].split(' do ')[-1].split(' de ')[-1]
+            # Formata números com 1 casa decimal se for float
+            if isinstance(valor, float):
+                valor_formatado = f"{valor:.1f}"
+            else:
+                valor_formatado = str(valor)
+            # Adiciona a unidade apenas se ela existir
+            if unidade:
+                resultado_formatado += f"{nome_variavel}: {valor_formatado}{unidade}\n"
+            else:
+                resultado_formatado += f"{nome_variavel}: {valor_formatado}\n"
+
+        # Retorna o texto formatado dentro de um JSON válido
+        return {'resultado': resultado_formatado.strip()}, 200
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    except Exception as e:
+        logger.exception("Erro inesperado no cálculo de química")
+        return {'error': 'Ocorreu um erro inesperado ao calcular.'}, 500
+
+def _processar_lote(itens: List[Any], processar: Callable[[Dict[str, Any]], Tuple[Dict[str, Any], int]]) -> Response:
+    """Executa uma lista de cálculos e devolve os resultados na mesma ordem.
+
+    Cada item recebe o próprio resultado ou erro, de modo que uma falha
+    não interrompe o restante do lote.
+    """
+    if not itens:
+        return jsonify({'error': 'O lote de cálculos está vazio.'}), 400
+    if len(itens) > config.BATCH_MAX_ITENS:
+        return jsonify({'error': f'O lote excede o limite de {config.BATCH_MAX_ITENS} cálculos.'}), 400
+
+    resultados = []
+    for item in itens:
+        if not isinstance(item, dict):
+            corpo, status = {'error': 'Item do lote inválido: esperado um objeto JSON.'}, 400
+        else:
+            corpo, status = processar(item)
+        corpo['status'] = status
+        resultados.append(corpo)
+
+    return jsonify({'resultados': resultados})
+
 @app.route('/matematica', methods=['GET', 'POST'])
 # @login_required # Temporariamente desativado para edição
 def matematica():
@@ -145,58 +311,93 @@ def matematica():
         if not data:
             return jsonify({'error': 'Requisição inválida: dados JSON não encontrados'}), 400
 
-        tipo_calculo = data.get('tipo_calculo')
-        valores = {k: v for k, v in data.items() if k != 'tipo_calculo'}
-        
-        try:
-            resultado, unidades = calc_mat.calculate_matematica(tipo_calculo, **valores)
-            resultado_formatado = {
-                k: f"{v} {unidades.get(k, '')}" for k, v in resultado.items()
-            }
-            return jsonify({'resultado': resultado_formatado})
-        except ValueError as e:
-            return jsonify({'error': str(e)}), 400
-        except Exception as e:
-            logger.exception("Erro inesperado no cálculo de matemática")
-            return jsonify({'error': 'Ocorreu um erro inesperado ao calcular.'}), 500
+        # Uma lista de itens é tratada como um lote de cálculos
+        if isinstance(data, list):
+            return _processar_lote(data, _processar_matematica)
+
+        corpo, status = _processar_matematica(data)
+        return jsonify(corpo), status
     return render_template('matematica.html')
 
 @app.route('/fisica', methods=['GET', 'POST'])
 # @login_required # Temporariamente desativado para edição
 def fisica():
     if request.method == 'POST':
-        try:
-            data = request.get_json()
-            if not data:
-                return jsonify({'error': 'Dados não fornecidos'}), 400
-
-            tipo_calculo = data.get('tipo_calculo')
-            if not tipo_calculo:
-                return jsonify({'error': 'Tipo de cálculo não especificado'}), 400
-
-            # Remove o tipo_calculo dos dados para passar para a função de cálculo
-            valores = {k: v for k, v in data.items() if k != 'tipo_calculo'}
-
-            # Converte os valores para float
-            valores = {k: float(v) if v is not None and v != '' else None for k, v in valores.items()}
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Dados não fornecidos'}), 400
 
-            # Chama a função de cálculo apropriada
-            resultado, unidades = calc_fis.calculate_fisica(tipo_calculo, **valores)
+        # Uma lista de itens é tratada como um lote de cálculos
+        if isinstance(data, list):
+            return _processar_lote(data, _processar_fisica)
 
-            # Formata o resultado com as unidades
-            resultado_formatado = {}
-            for variavel, valor in resultado.items():
-                unidade = unidades.get(variavel, '')
-                resultado_formatado[variavel] = f"{valor:.5f} {unidade}".strip()
+        corpo, status = _processar_fisica(data)
+        return jsonify(corpo), status
 
-            return jsonify({'resultado': resultado_formatado})
+    return render_template('fisica.html')
 
-        except ValueError as e:
-            return jsonify({'error': str(e)}), 400
-        except Exception as e:
-            return jsonify({'error': f'Erro ao processar cálculo: {str(e)}'}), 500
+def _lista_json(array) -> list:
+    """Converte um array NumPy em listas aninhadas, trocando NaN por None."""
+    import numpy as np  # já carregado pelo modo vetorizado que gerou o array
+    if array.dtype == bool:
+        return array.tolist()
+    return np.where(np.isnan(array), None, array).tolist()
+
+@app.route('/fisica/varredura', methods=['POST'])
+def fisica_varredura():
+    """Gera a tabela de resultados de uma fórmula de física variando até duas entradas."""
+    data = request.get_json()
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Dados não fornecidos'}), 400
+
+    tipo_calculo = data.get('tipo_calculo')
+    if not tipo_calculo:
+        return jsonify({'error': 'Tipo de cálculo não especificado'}), 400
+
+    valores = {k: v for k, v in data.items() if k not in ('tipo_calculo', 'varredura')}
+    try:
+        eixos, resultado, unidades, invalidos = calc_fis.calculate_fisica_varredura(
+            tipo_calculo, data.get('varredura'), max_pontos=config.VARREDURA_MAX_PONTOS, **valores
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception("Erro inesperado na varredura de física")
+        return jsonify({'error': f'Erro ao processar varredura: {str(e)}'}), 500
+
+    # Os eixos vão como lista para deixar explícita a ordem das dimensões da grade
+    return jsonify({
+        'eixos': [{'variavel': variavel, 'valores': _lista_json(eixo)} for variavel, eixo in eixos.items()],
+        'resultado': {variavel: _lista_json(valor) for variavel, valor in resultado.items()},
+        'unidades': unidades,
+        'invalidos': {mensagem: _lista_json(mascara) for mensagem, mascara in invalidos.items()}
+    })
+
+@app.route('/matematica/amostrar', methods=['POST'])
+def matematica_amostrar():
+    """Amostra uma função da calculadora de matemática para desenhar o seu gráfico."""
+    data = request.get_json()
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Requisição inválida: dados JSON não encontrados'}), 400
+
+    tipo_calculo = data.get('tipo_calculo')
+    if not tipo_calculo:
+        return jsonify({'error': 'Tipo de cálculo não especificado'}), 400
+
+    valores = {k: v for k, v in data.items() if k not in ('tipo_calculo', 'intervalo', 'pontos')}
+    try:
+        from amostragem_funcoes import amostrar
+        amostra = amostrar(
+            tipo_calculo, data.get('intervalo'), data.get('pontos', config.AMOSTRAGEM_PONTOS_PADRAO),
+            max_pontos=config.AMOSTRAGEM_MAX_PONTOS, **valores
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.exception("Erro inesperado na amostragem de função")
+        return jsonify({'error': f'Erro ao amostrar função: {str(e)}'}), 500
 
-    return render_template('fisica.html')
+    return jsonify(amostra)
 
 @app.route('/quimica', methods=['GET', 'POST'])
 # @login_required # Temporariamente desativado para edição
@@ -206,36 +407,12 @@ def quimica():
         if not data:
             return jsonify({'error': 'Requisição inválida: dados JSON não encontrados'}), 400
 
-        tipo_calculo = data.get('tipo_calculo')
-        valores = {k: v for k, v in data.items() if k != 'tipo_calculo'}
-        
-        try:
-            resultado, unidades = calc_qui.calculate_quimica(tipo_calculo, **valores)
-            
-            # Formatação simplificada dos resultados
-            resultado_formatado = ""
-            for variavel, valor in resultado.items():
-                unidade = unidades.get(variavel, '')
-                # Simplifica o nome da variável
-                nome_variavel = variavel.split(' da ')[-1].split(' do ')[-1].split(' de ')[-1]
-                # Formata números com 1 casa decimal se for float
-                if isinstance(valor, float):
-                    valor_formatado = f"{valor:.1f}"
-                else:
-                    valor_formatado = str(valor)
-                # Adiciona a unidade apenas se ela existir
-                if unidade:
-                    resultado_formatado += f"{nome_variavel}: {valor_formatado}{unidade}\n"
-                else:
-                    resultado_formatado += f"{nome_variavel}: {valor_formatado}\n"
-            
-            # Retorna o texto formatado dentro de um JSON válido
-            return jsonify({'resultado': resultado_formatado.strip()})
-        except ValueError as e:
-            return jsonify({'error': str(e)}), 400
-        except Exception as e:
-            logger.exception("Erro inesperado no cálculo de química")
-            return jsonify({'error': 'Ocorreu um erro inesperado ao calcular.'}), 500
+        # Uma lista de itens é tratada como um lote de cálculos
+        if isinstance(data, list):
+            return _processar_lote(data, _processar_quimica)
+
+        corpo, status = _processar_quimica(data)
+        return jsonify(corpo), status
     return render_template('quimica.html')
 
 @app.route('/contato')
@@ -253,7 +430,6 @@ def criar_conta():
         db = get_db()
         nome_usuario = request.form.get('nome_usuario')
         if db.execute('SELECT id FROM usuarios WHERE nome_usuario = ?', (nome_usuario,)).fetchone():
-            db.close()
             flash('Este nome de usuário já está em uso.', 'error')
             return redirect(url_for('criar_conta'))
         # Coletar todos os campos do formulário
@@ -269,7 +445,6 @@ def criar_conta():
             (nome_usuario, senha, email, nome_completo, data_nascimento, serie, materia_dificuldade)
         )
         db.commit()
-        db.close()
         flash('Conta criada com sucesso! Faça login para continuar.', 'success')
         return redirect(url_for('login'))
     return render_template('criar_conta.html')
@@ -296,7 +471,6 @@ def login():
         # Regular user login logic
         conn = get_db()
         user = conn.execute('SELECT * FROM usuarios WHERE nome_usuario = ?', (username_input,)).fetchone()
-        conn.close()
         
         if user and check_password_hash(user['senha'], password_input):
             session['user_id'] = user['id']
@@ -325,7 +499,6 @@ def esqueceu_senha():
 def minha_conta():
     db = get_db()
     user = db.execute('SELECT * FROM usuarios WHERE id = ?', (session['user_id'],)).fetchone()
-    db.close()
     
     if not user:
         session.pop('user_id', None)
@@ -342,7 +515,6 @@ def editar_conta():
     user = db.execute('SELECT * FROM usuarios WHERE id = ?', (session['user_id'],)).fetchone()
     
     if not user:
-        db.close()
         session.pop('user_id', None)
         session.pop('nome_usuario', None)
         flash('Usuário não encontrado.', 'error')
@@ -364,11 +536,9 @@ def editar_conta():
             )
         
         db.commit()
-        db.close()
         flash('Dados atualizados com sucesso!', 'success')
         return redirect(url_for('minha_conta'))
     
-    db.close()
     return render_template('editar_conta.html', usuario=dict(user))
 
 @app.route('/verificar-usuario', methods=['POST'])
@@ -379,7 +549,6 @@ def verificar_usuario():
         
         db = get_db()
         usuario = db.execute('SELECT id FROM usuarios WHERE nome_usuario = ?', (nome_usuario,)).fetchone()
-        db.close()
         
         if usuario:
             return jsonify({'exists': True})
@@ -400,7 +569,6 @@ def admin_login():
         try:
             db = get_db()
             admin = db.execute('SELECT * FROM admins WHERE username = ?', (username,)).fetchone()
-            db.close()
             
             if admin and admin['password'] == password:
                 session['is_admin'] = True
@@ -417,19 +585,63 @@ def admin_login():
     
     return render_template('admin_login.html')
 
+def _listar_usuarios_pagina(colunas: List[str]) -> Tuple[Dict[str, Any], PaginaUsuarios]:
+    """Lê busca, ordenação e cursores da query string e busca a página de usuários.
+
+    Returns:
+        Tuple[Dict[str, Any], PaginaUsuarios]: Filtros aplicados e a página encontrada.
+    """
+    ordem = request.args.get('ordem', 'id')
+    filtros = {
+        'busca': request.args.get('busca', '').strip(),
+        'ordem': ordem if ordem in ORDENACOES else 'id',
+        'dir': 'desc' if request.args.get('dir') == 'desc' else 'asc',
+    }
+    pagina = listar_usuarios(
+        get_db(), colunas,
+        busca=filtros['busca'],
+        ordem=filtros['ordem'],
+        descendente=filtros['dir'] == 'desc',
+        apos=request.args.get('apos'),
+        antes=request.args.get('antes'),
+        limite=config.ADMIN_USUARIOS_POR_PAGINA
+    )
+    return filtros, pagina
+
 @app.route('/admin/usuarios')
 @admin_required
 def admin_usuarios():
     try:
-        db = get_db()
-        usuarios = db.execute('SELECT id, nome_usuario, email, created_at FROM usuarios').fetchall()
-        db.close()
-        return render_template('admin_usuarios.html', usuarios=usuarios)
+        filtros, pagina = _listar_usuarios_pagina(['id', 'nome_usuario', 'email', 'created_at'])
+        return render_template('admin_usuarios.html', usuarios=pagina.usuarios, pagina=pagina, filtros=filtros)
+    except CursorInvalido:
+        abort(400)
     except Exception as e:
         logger.error(f"Erro ao listar usuários: {str(e)}")
         flash('Erro ao carregar lista de usuários.', 'error')
         return redirect(url_for('admin_login'))
 
+def _resposta_exportacao(gerador, mimetype: str, extensao: str) -> Response:
+    """Resposta em streaming para a exportação de usuários"""
+    nome_arquivo = f"usuarios_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extensao}"
+    return Response(
+        gerador,
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={nome_arquivo}'}
+    )
+
+@app.route('/admin/usuarios/exportar.csv')
+@admin_required
+def admin_exportar_usuarios_csv():
+    """Exporta a tabela de usuários em CSV, lida em lotes"""
+    return _resposta_exportacao(gerar_csv(db_pool.conexao), 'text/csv', 'csv')
+
+@app.route('/admin/usuarios/exportar.jsonl')
+@admin_required
+def admin_exportar_usuarios_jsonl():
+    """Exporta a tabela de usuários em JSON Lines, lida em lotes"""
+    return _resposta_exportacao(gerar_jsonl(db_pool.conexao), 'application/x-ndjson', 'jsonl')
+
 @app.route('/admin/logout')
 def admin_logout():
     session.pop('is_admin', None)
@@ -457,32 +669,13 @@ def secret_admin_dashboard():
         return redirect(url_for('secret_admin'))
     
     try:
-        db = get_db()
-        usuarios = db.execute('SELECT id, nome_usuario, email, nome_completo, data_nascimento, serie, materia_dificuldade, created_at FROM usuarios').fetchall()
-        db.close()
-        
-        # Converte os timestamps para o formato brasileiro
-        usuarios_formatados = []
-        for usuario in usuarios:
-            usuario_dict = dict(usuario)
-            # Formatar data de nascimento se existir
-            if usuario_dict.get('data_nascimento'):
-                try:
-                    dt_nasc = datetime.strptime(usuario_dict['data_nascimento'], '%Y-%m-%d')
-                    usuario_dict['data_nascimento'] = dt_nasc.strftime('%d/%m/%Y')
-                except:
-                    pass
-            # Formatar data de cadastro
-            if usuario_dict['created_at']:
-                try:
-                    dt = datetime.strptime(usuario_dict['created_at'], '%Y-%m-%d %H:%M:%S')
-                    dt = dt - timedelta(hours=3)
-                    usuario_dict['created_at'] = dt.strftime('%d/%m/%Y %H:%M:%S')
-                except:
-                    pass
-            usuarios_formatados.append(usuario_dict)
-        
-        return render_template('secret_admin_dashboard.html', usuarios=usuarios_formatados)
+        filtros, pagina = _listar_usuarios_pagina([
+            'id', 'nome_usuario', 'email', 'nome_completo', 'data_nascimento',
+            'serie', 'materia_dificuldade', 'created_at'
+        ])
+        return render_template('secret_admin_dashboard.html', usuarios=pagina.usuarios, pagina=pagina, filtros=filtros)
+    except CursorInvalido:
+        abort(400)
     except Exception as e:
         logger.error(f"Erro ao listar usuários: {str(e)}")
         flash('Erro ao carregar lista de usuários.', 'error')
@@ -517,38 +710,80 @@ def chatbot_endpoint():
         logger.error(f"Erro no chatbot: {str(e)}")
         return jsonify({'response': 'Desculpe, ocorreu um erro. Tente novamente.'}), 500
 
-def backup_database():
-    """Faz backup do banco de dados"""
-    try:
-        if os.path.exists(DATABASE):
-            backup_dir = 'backups'
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_file = os.path.join(backup_dir, f'calclab_{timestamp}.db')
-            
-            shutil.copy2(DATABASE, backup_file)
-            logger.info(f"Backup criado: {backup_file}")
-            
-            # Mantém apenas os últimos 5 backups
-            backups = sorted([f for f in os.listdir(backup_dir) if f.startswith('calclab_')])
-            if len(backups) > 5:
-                for old_backup in backups[:-5]:
-                    os.remove(os.path.join(backup_dir, old_backup))
-    except Exception as e:
-        logger.error(f"Erro ao fazer backup: {str(e)}")
+@app.route('/chatbot/estatisticas')
+@admin_required
+def chatbot_estatisticas():
+    """Estatísticas de respostas e do cache do chatbot neste processo"""
+    return jsonify({'cache_respostas': chatbot.cache_stats(), 'respostas': chatbot.answer_stats()})
+
+@app.route('/admin/cache/estatisticas')
+@admin_required
+def cache_estatisticas():
+    """Acertos e falhas do cache de resultados das calculadoras"""
+    return jsonify({'cache_calculos': calc_cache.estatisticas()})
+
+@app.route('/admin/banco/estatisticas')
+@admin_required
+def banco_estatisticas():
+    """Estatísticas do pool de conexões SQLite neste processo"""
+    return jsonify({'pool': db_pool.estatisticas()})
+
+@app.route('/admin/perfis')
+@admin_required
+def admin_perfis():
+    """Perfis de cálculo mais lentos entre os gravados recentemente"""
+    return render_template('admin_perfis.html', perfis=perfilador.mais_lentos(), perfilador=perfilador)
+
+@app.route('/admin/perfis/<arquivo>')
+@admin_required
+def admin_baixar_perfil(arquivo: str):
+    """Baixa um perfil gravado"""
+    caminho = perfilador.caminho(arquivo)
+    if caminho is None:
+        abort(404)
+    return send_file(os.path.abspath(caminho), as_attachment=True, download_name=arquivo)
 
 @app.before_request
-def before_request():
-    """Executado antes de cada requisição"""
-    # Faz backup do banco de dados a cada 24 horas
-    if not hasattr(app, 'last_backup'):
-        app.last_backup = datetime.now()
-    
-    if (datetime.now() - app.last_backup) > timedelta(hours=24):
-        backup_database()
-        app.last_backup = datetime.now()
+def iniciar_medicao() -> None:
+    """Marca o início da requisição para as métricas de latência"""
+    g.inicio_requisicao = time.perf_counter()
+
+@app.after_request
+def registrar_medicao(response: Response) -> Response:
+    """Registra latência, contagem e erros da requisição, rotulados pela rota"""
+    inicio = g.pop('inicio_requisicao', None)
+    if config.METRICAS_ATIVAS and inicio is not None and request.endpoint != 'metrics':
+        rota = request.url_rule.rule if request.url_rule else 'desconhecida'
+        status = str(response.status_code)
+        metricas.LATENCIA_REQUISICAO.observar(time.perf_counter() - inicio, rota, request.method)
+        metricas.REQUISICOES.incrementar(rota, request.method, status)
+        if response.status_code >= 400:
+            metricas.ERROS.incrementar(rota, status)
+    return response
+
+def _metricas_instantaneas():
+    """Valores atuais do pool de conexões e dos caches, exportados junto com as métricas"""
+    for chave, valor in db_pool.estatisticas().items():
+        yield 'calclab_db_pool', 'gauge', 'Estado do pool de conexões SQLite.', {'estado': chave}, valor
+    estatisticas_calculos = calc_cache.estatisticas()
+    for resultado in ('acertos', 'falhas'):
+        yield ('calclab_cache_calculos_total', 'counter', 'Consultas ao cache de resultados das calculadoras.',
+               {'resultado': resultado}, estatisticas_calculos[resultado])
+    estatisticas_chatbot = chatbot.cache_stats()
+    for resultado in ('acertos', 'falhas'):
+        yield ('calclab_cache_chatbot_total', 'counter', 'Consultas ao cache de respostas do chatbot.',
+               {'resultado': resultado}, estatisticas_chatbot[resultado])
+
+metricas.REGISTRO.coletor(_metricas_instantaneas)
+
+@app.route('/metrics')
+def metrics() -> Response:
+    """Métricas deste processo no formato texto do Prometheus"""
+    if not config.METRICAS_ATIVAS:
+        return Response('Métricas desativadas.\n', status=404, mimetype='text/plain')
+    if config.METRICAS_TOKEN and request.headers.get('Authorization') != f'Bearer {config.METRICAS_TOKEN}':
+        return Response('Não autorizado.\n', status=401, mimetype='text/plain')
+    return Response(metricas.REGISTRO.exportar(), mimetype='text/plain; version=0.0.4; charset=utf-8')
 
 # Manipuladores de erro para retornar JSON para requisições de API
 @app.errorhandler(400)
@@ -572,7 +807,32 @@ def internal_error(error):
     return render_template('500.html'), 500
 
 # Inicializa o banco de dados quando a aplicação inicia
-init_db()
+with app.app_context():
+    init_db()
+
+# Pré-aquecimento opcional, pensado para o gunicorn --preload (ver aquecimento.py)
+if config.PREAQUECER:
+    preaquecer(config.PREAQUECER_MODULOS, {
+        'templates': lambda: [app.jinja_env.get_template(nome) for nome in app.jinja_env.list_templates()],
+        'fisica': lambda: calc_fis.calculate_fisica('velocidade_media', deslocamento=10, tempo=2),
+        'fisica_vetorizada': lambda: calc_fis.calculate_fisica_vetorizado('velocidade_media', deslocamento=[10, 20], tempo=2),
+        'quimica': lambda: calc_qui.calculate_quimica(
+            'balanceamento', equacao_reagentes='CH4 + O2', equacao_produtos='CO2 + H2O'),
+    })
+
+# Conexões abertas na inicialização não podem ser herdadas pelos workers após o fork
+db_pool.fechar()
+
+# Backups periódicos do banco em segundo plano, fora do caminho das requisições
+backup_scheduler = AgendadorBackup(
+    DATABASE,
+    intervalo=config.BACKUP_INTERVALO_HORAS * 3600,
+    pasta=config.BACKUP_PASTA,
+    comprimir=config.BACKUP_COMPRIMIR,
+    manter=config.BACKUP_MANTER
+)
+if config.BACKUP_ATIVO:
+    backup_scheduler.iniciar()
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Pré-aquecimento do app para implantações com ``gunicorn --preload``.
+
+Os módulos pesados (NumPy, o modo vetorizado de física, o cliente da OpenAI e
+o SymPy de reserva do balanceamento) são importados só no primeiro uso, o que
+encurta a partida a frio. Com ``PREAQUECER`` ativo o ``app.py`` faz o caminho
+inverso: importa esses módulos, compila os templates e executa um cálculo de
+cada área já na inicialização. Com ``--preload`` isso acontece uma única vez
+no processo mestre, antes do fork, e os workers herdam as páginas já
+carregadas em vez de pagar o custo na primeira requisição de cada um.
+"""
+
+import importlib
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def importar_modulos(modulos: Iterable[str]) -> Dict[str, float]:
+    """
+    Importa os módulos indicados, medindo cada um.
+
+    Args:
+        modulos (Iterable[str]): Nomes dos módulos; os ausentes no ambiente são ignorados
+
+    Returns:
+        Dict[str, float]: Milissegundos gastos por módulo (0 se já estava carregado)
+    """
+    tempos = {}
+    for nome in modulos:
+        inicio = time.perf_counter()
+        try:
+            importlib.import_module(nome)
+        except ImportError as e:
+            logger.warning(f"Pré-aquecimento: módulo '{nome}' indisponível ({e})")
+            continue
+        tempos[nome] = (time.perf_counter() - inicio) * 1000
+    return tempos
+
+
+def preaquecer(modulos: Iterable[str], tarefas: Dict[str, Callable[[], Any]]) -> Dict[str, float]:
+    """
+    Importa os módulos pesados e executa as tarefas de aquecimento.
+
+    Falhas numa tarefa são registradas e não impedem a inicialização.
+
+    Args:
+        modulos (Iterable[str]): Módulos a importar antecipadamente
+        tarefas (Dict[str, Callable[[], Any]]): Tarefas nomeadas (cálculos de exemplo, templates...)
+
+    Returns:
+        Dict[str, float]: Milissegundos gastos por módulo e por tarefa
+    """
+    tempos = importar_modulos(modulos)
+    for nome, tarefa in tarefas.items():
+        inicio = time.perf_counter()
+        try:
+            tarefa()
+        except Exception as e:
+            logger.warning(f"Pré-aquecimento: tarefa '{nome}' falhou ({e})")
+            continue
+        tempos[nome] = (time.perf_counter() - inicio) * 1000
+    resumo = ', '.join(f'{nome} {ms:.1f} ms' for nome, ms in tempos.items())
+    logger.info(f"Pré-aquecimento concluído em {sum(tempos.values()):.1f} ms: {resumo}")
+    return tempos
@@ -0,0 +1,169 @@
+"""
+Backup do banco SQLite em segundo plano.
+
+Usa a API de backup do SQLite (``sqlite3.Connection.backup``) copiando poucas
+páginas por vez, então a cópia é consistente e os escritores não ficam
+bloqueados durante todo o processo. Um ``AgendadorBackup`` roda numa thread
+daemon e só faz um novo backup quando o mais recente da pasta já passou do
+intervalo; com vários processos do gunicorn, uma trava de arquivo garante que
+apenas um deles faça a cópia.
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PREFIXO = 'calclab_'
+
+
+def listar_backups(pasta: str) -> List[str]:
+    """Caminhos dos backups existentes, do mais antigo para o mais recente."""
+    if not os.path.isdir(pasta):
+        return []
+    nomes = sorted(
+        nome for nome in os.listdir(pasta)
+        if nome.startswith(PREFIXO) and (nome.endswith('.db') or nome.endswith('.db.gz'))
+    )
+    return [os.path.join(pasta, nome) for nome in nomes]
+
+
+def aplicar_retencao(pasta: str, manter: int) -> None:
+    """Remove os backups mais antigos, mantendo apenas os ``manter`` mais recentes."""
+    backups = listar_backups(pasta)
+    for antigo in backups[:-manter] if manter > 0 else backups:
+        os.remove(antigo)
+
+
+def fazer_backup(caminho_banco: str, pasta: str = 'backups', comprimir: bool = False,
+                 manter: int = 5, paginas: int = 256, pausa: float = 0.005) -> str:
+    """
+    Copia o banco de forma consistente para a pasta de backups.
+
+    Args:
+        caminho_banco (str): Banco SQLite de origem
+        pasta (str): Pasta onde os backups são guardados
+        comprimir (bool): Grava o backup compactado com gzip (.db.gz)
+        manter (int): Quantidade de backups mantidos
+        paginas (int): Páginas copiadas por etapa
+        pausa (float): Segundos entre as etapas, liberando o banco para outros acessos
+
+    Returns:
+        str: Caminho do backup criado
+    """
+    os.makedirs(pasta, exist_ok=True)
+    nome = f"{PREFIXO}{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+    temporario = os.path.join(pasta, nome + '.tmp')
+    final = os.path.join(pasta, nome + '.gz' if comprimir else nome)
+
+    try:
+        origem = sqlite3.connect(caminho_banco)
+        try:
+            destino = sqlite3.connect(temporario)
+            try:
+                origem.backup(destino, pages=paginas, sleep=pausa)
+            finally:
+                destino.close()
+        finally:
+            origem.close()
+
+        if comprimir:
+            with open(temporario, 'rb') as entrada, gzip.open(final, 'wb') as saida:
+                shutil.copyfileobj(entrada, saida)
+            os.remove(temporario)
+        else:
+            os.replace(temporario, final)
+    except Exception:
+        # Nem o .tmp nem um .gz pela metade podem ficar na pasta: a retenção não enxerga o
+        # primeiro e trataria o segundo como um backup válido
+        for parcial in (temporario, final) if comprimir else (temporario,):
+            if os.path.exists(parcial):
+                os.remove(parcial)
+        raise
+
+    aplicar_retencao(pasta, manter)
+    return final
+
+
+class AgendadorBackup:
+    """Thread que faz backups periódicos do banco fora do caminho das requisições."""
+
+    def __init__(self, caminho_banco: str, intervalo: float = 24 * 3600, pasta: str = 'backups',
+                 comprimir: bool = False, manter: int = 5, verificacao: float = 600):
+        """
+        Args:
+            caminho_banco (str): Banco SQLite de origem
+            intervalo (float): Segundos entre backups
+            pasta (str): Pasta onde os backups são guardados
+            comprimir (bool): Compacta os backups com gzip
+            manter (int): Quantidade de backups mantidos
+            verificacao (float): Segundos entre verificações de backup pendente
+        """
+        self.caminho_banco = caminho_banco
+        self.intervalo = intervalo
+        self.pasta = pasta
+        self.comprimir = comprimir
+        self.manter = manter
+        self.verificacao = verificacao
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def ultimo_backup(self) -> Optional[float]:
+        """Horário (epoch) do backup mais recente, se houver."""
+        backups = listar_backups(self.pasta)
+        return os.path.getmtime(backups[-1]) if backups else None
+
+    def pendente(self) -> bool:
+        """Indica se já passou o intervalo desde o último backup."""
+        ultimo = self.ultimo_backup()
+        return ultimo is None or time.time() - ultimo >= self.intervalo
+
+    def executar_se_pendente(self) -> Optional[str]:
+        """Faz o backup se ele estiver pendente e nenhum outro processo o estiver fazendo."""
+        if not os.path.exists(self.caminho_banco) or not self.pendente():
+            return None
+        os.makedirs(self.pasta, exist_ok=True)
+        with open(os.path.join(self.pasta, '.backup.lock'), 'w') as trava:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(trava, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return None
+            # Outro processo pode ter terminado um backup enquanto esperávamos
+            if not self.pendente():
+                return None
+            arquivo = fazer_backup(self.caminho_banco, self.pasta, self.comprimir, self.manter)
+            logger.info(f"Backup criado: {arquivo}")
+            return arquivo
+
+    def _laco(self) -> None:
+        while not self._parar.is_set():
+            try:
+                self.executar_se_pendente()
+            except Exception as e:
+                logger.error(f"Erro ao fazer backup: {str(e)}")
+            self._parar.wait(self.verificacao)
+
+    def iniciar(self) -> None:
+        """Inicia a thread de backup, se ainda não estiver rodando."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._laco, name='backup-sqlite', daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        """Sinaliza o fim da thread de backup."""
+        self._parar.set()
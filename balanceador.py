@@ -0,0 +1,222 @@
+"""
+Balanceamento exato de equações químicas com aritmética inteira.
+
+Monta a matriz de composição (elementos x compostos, produtos com sinal
+negativo) e calcula seu espaço nulo por eliminação de Gauss-Jordan livre de
+frações: as linhas são combinadas por multiplicação cruzada e reduzidas pelo
+MDC, de modo que tudo fica em inteiros do Python, sem sympy.
+
+``balancear_com_cache`` guarda os resultados por equação canônica (compostos
+de cada lado ordenados, sem espaços) num cache LRU em memória e, se
+``config.BALANCEAMENTO_CACHE_BANCO`` estiver definido, numa tabela SQLite
+compartilhada entre os processos do gunicorn e entre reinícios.
+"""
+
+import logging
+import sqlite3
+from functools import reduce
+from math import gcd
+from typing import Dict, List, Optional, Sequence, Tuple
+import config
+from cache import CacheLRU
+from formulas_quimicas import contagem_elementos
+
+logger = logging.getLogger(__name__)
+
+
+class ErroBalanceamento(ValueError):
+    """A equação não admite um balanceamento único com coeficientes positivos."""
+
+
+def _reduzir(linha: List[int]) -> List[int]:
+    """Divide a linha pelo MDC de seus elementos."""
+    divisor = reduce(gcd, linha, 0)
+    if divisor > 1:
+        return [valor // divisor for valor in linha]
+    return linha
+
+
+def _escalonar(matriz: List[List[int]], colunas: int) -> Tuple[List[List[int]], List[int]]:
+    """Forma escalonada reduzida inteira; retorna as linhas não nulas e as colunas pivô."""
+    linhas = [linha[:] for linha in matriz]
+    pivos: List[int] = []
+    atual = 0
+    for coluna in range(colunas):
+        pivo = next((i for i in range(atual, len(linhas)) if linhas[i][coluna] != 0), None)
+        if pivo is None:
+            continue
+        linhas[atual], linhas[pivo] = linhas[pivo], linhas[atual]
+        base = linhas[atual]
+        for i, linha in enumerate(linhas):
+            if i != atual and linha[coluna] != 0:
+                a, b = base[coluna], linha[coluna]
+                linhas[i] = _reduzir([a * x - b * y for x, y in zip(linha, base)])
+        linhas[atual] = _reduzir(base)
+        pivos.append(coluna)
+        atual += 1
+        if atual == len(linhas):
+            break
+    return linhas[:atual], pivos
+
+
+def balancear(reagentes: Sequence[str], produtos: Sequence[str]) -> List[int]:
+    """
+    Calcula os menores coeficientes inteiros positivos que balanceiam a equação.
+
+    Args:
+        reagentes (Sequence[str]): Fórmulas dos reagentes, sem coeficientes
+        produtos (Sequence[str]): Fórmulas dos produtos, sem coeficientes
+
+    Returns:
+        List[int]: Coeficientes na ordem reagentes + produtos
+    """
+    compostos = list(reagentes) + list(produtos)
+    composicoes = [contagem_elementos(composto) for composto in compostos]
+
+    elementos = sorted({elemento for composicao in composicoes for elemento in composicao})
+    faltando = set(elementos) - {e for c in composicoes[:len(reagentes)] for e in c}
+    faltando |= set(elementos) - {e for c in composicoes[len(reagentes):] for e in c}
+    if faltando:
+        raise ErroBalanceamento(
+            f"O(s) elemento(s) {', '.join(sorted(faltando))} aparece(m) em apenas um lado da equação."
+        )
+
+    sinais = [1] * len(reagentes) + [-1] * len(produtos)
+    matriz = [
+        [sinal * composicao.get(elemento, 0) for composicao, sinal in zip(composicoes, sinais)]
+        for elemento in elementos
+    ]
+    linhas, pivos = _escalonar(matriz, len(compostos))
+
+    livres = [coluna for coluna in range(len(compostos)) if coluna not in pivos]
+    if not livres:
+        raise ErroBalanceamento("A equação não pode ser balanceada com os compostos fornecidos.")
+    if len(livres) > 1:
+        raise ErroBalanceamento(
+            f"A equação admite {len(livres)} balanceamentos independentes; "
+            "separe-a em reações mais simples para obter um resultado único."
+        )
+
+    # Fixa a variável livre no MMC dos pivôs para que todas as demais sejam inteiras
+    livre = livres[0]
+    fator = reduce(lambda x, y: x * y // gcd(x, y), (abs(linha[pivo]) for linha, pivo in zip(linhas, pivos)), 1)
+    coeficientes = [0] * len(compostos)
+    coeficientes[livre] = fator
+    for linha, pivo in zip(linhas, pivos):
+        coeficientes[pivo] = -linha[livre] * fator // linha[pivo]
+
+    coeficientes = _reduzir(coeficientes)
+    if all(c <= 0 for c in coeficientes):
+        coeficientes = [-c for c in coeficientes]
+    if any(c <= 0 for c in coeficientes):
+        raise ErroBalanceamento("Não existe balanceamento com todos os coeficientes positivos para esta equação.")
+    return coeficientes
+
+
+def _canonizar(reagentes: Sequence[str], produtos: Sequence[str]) -> Tuple[str, List[int]]:
+    """
+    Monta a chave canônica da equação.
+
+    Returns:
+        Tuple[str, List[int]]: Chave e, para cada composto na ordem recebida,
+        sua posição na ordem canônica
+    """
+    compostos = [''.join(c.split()) for c in list(reagentes) + list(produtos)]
+    n = len(reagentes)
+    ordem = sorted(range(n), key=lambda i: compostos[i]) + sorted(range(n, len(compostos)), key=lambda i: compostos[i])
+    posicoes = [0] * len(compostos)
+    for posicao, indice in enumerate(ordem):
+        posicoes[indice] = posicao
+    chave = '+'.join(compostos[i] for i in ordem[:n]) + '=' + '+'.join(compostos[i] for i in ordem[n:])
+    return chave, posicoes
+
+
+class _TabelaBalanceamentos:
+    """Persistência dos balanceamentos numa tabela SQLite."""
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self.ativa = True
+        try:
+            with self._conectar() as db:
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS balanceamentos ('
+                    'chave TEXT PRIMARY KEY, coeficientes TEXT NOT NULL, '
+                    'criado_em TEXT DEFAULT CURRENT_TIMESTAMP)'
+                )
+        except sqlite3.Error as e:
+            self._desativar(e)
+
+    def _conectar(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.caminho, timeout=5)
+
+    def _desativar(self, erro: Exception) -> None:
+        # Sem persistência o cache continua funcionando só em memória
+        logger.warning(f"Cache de balanceamentos em SQLite desativado: {erro}")
+        self.ativa = False
+
+    def obter(self, chave: str) -> Optional[List[int]]:
+        if not self.ativa:
+            return None
+        try:
+            db = self._conectar()
+            try:
+                linha = db.execute('SELECT coeficientes FROM balanceamentos WHERE chave = ?', (chave,)).fetchone()
+            finally:
+                db.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao ler o cache de balanceamentos: {e}")
+            return None
+        return [int(c) for c in linha[0].split(',')] if linha else None
+
+    def guardar(self, chave: str, coeficientes: List[int]) -> None:
+        if not self.ativa:
+            return
+        try:
+            with self._conectar() as db:
+                db.execute(
+                    'INSERT OR REPLACE INTO balanceamentos (chave, coeficientes) VALUES (?, ?)',
+                    (chave, ','.join(map(str, coeficientes)))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao gravar o cache de balanceamentos: {e}")
+
+
+_cache = CacheLRU(config.BALANCEAMENTO_CACHE_TAMANHO)
+_tabela = _TabelaBalanceamentos(config.BALANCEAMENTO_CACHE_BANCO) if config.BALANCEAMENTO_CACHE_BANCO else None
+
+
+def balancear_com_cache(reagentes: Sequence[str], produtos: Sequence[str]) -> List[int]:
+    """
+    Igual a ``balancear``, consultando antes o cache em memória e o SQLite.
+
+    Args:
+        reagentes (Sequence[str]): Fórmulas dos reagentes, sem coeficientes
+        produtos (Sequence[str]): Fórmulas dos produtos, sem coeficientes
+
+    Returns:
+        List[int]: Coeficientes na ordem reagentes + produtos
+    """
+    chave, posicoes = _canonizar(reagentes, produtos)
+    canonicos = _cache.obter(chave)
+    if canonicos is None:
+        canonicos = _tabela.obter(chave) if _tabela else None
+        if canonicos is None:
+            coeficientes = balancear(reagentes, produtos)
+            canonicos = [0] * len(coeficientes)
+            for indice, posicao in enumerate(posicoes):
+                canonicos[posicao] = coeficientes[indice]
+            if _tabela:
+                _tabela.guardar(chave, canonicos)
+        _cache.guardar(chave, canonicos)
+    return [canonicos[posicao] for posicao in posicoes]
+
+
+def estatisticas_cache() -> Dict[str, float]:
+    """Estatísticas do cache em memória de balanceamentos."""
+    return _cache.estatisticas()
+
+
+def limpar_cache() -> None:
+    """Esvazia o cache em memória (a tabela SQLite é mantida)."""
+    _cache.limpar()
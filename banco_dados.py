@@ -0,0 +1,110 @@
+"""
+Pool de conexões SQLite por processo.
+
+As conexões são abertas uma vez, configuradas (WAL, ``synchronous=NORMAL``,
+``busy_timeout`` e ``mmap_size``) e reaproveitadas entre requisições. O
+``app.py`` empresta uma conexão por contexto de aplicação (``flask.g``) e a
+devolve no teardown; código fora de requisições usa ``pool.conexao()``.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Type
+
+
+class PoolConexoes:
+    """Conjunto de conexões SQLite reutilizáveis para um mesmo arquivo."""
+
+    def __init__(self, caminho: str, tamanho: int = 4, busy_timeout: int = 5000,
+                 mmap_size: int = 64 * 1024 * 1024, fabrica: Type[sqlite3.Connection] = sqlite3.Connection):
+        """
+        Args:
+            caminho (str): Caminho do banco SQLite
+            tamanho (int): Máximo de conexões ociosas mantidas abertas
+            busy_timeout (int): Milissegundos de espera quando o banco está travado
+            mmap_size (int): Bytes do arquivo mapeados em memória (0 desativa)
+            fabrica (Type[sqlite3.Connection]): Classe das conexões (ex.: uma que mede as consultas)
+        """
+        self.caminho = caminho
+        self.tamanho = tamanho
+        self.busy_timeout = busy_timeout
+        self.mmap_size = mmap_size
+        self.fabrica = fabrica
+        self._ociosas: List[sqlite3.Connection] = []
+        self._trava = threading.Lock()
+        self._criadas = 0
+        self._reutilizadas = 0
+        self._descartadas = 0
+        self._em_uso = 0
+
+    def _abrir(self) -> sqlite3.Connection:
+        # A conexão pode ser devolvida por uma thread e emprestada a outra,
+        # mas nunca é usada por duas ao mesmo tempo
+        conexao = sqlite3.connect(self.caminho, timeout=self.busy_timeout / 1000, check_same_thread=False,
+                                  factory=self.fabrica)
+        conexao.row_factory = sqlite3.Row
+        conexao.execute('PRAGMA journal_mode=WAL')
+        conexao.execute('PRAGMA synchronous=NORMAL')
+        conexao.execute(f'PRAGMA busy_timeout={int(self.busy_timeout)}')
+        conexao.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
+        return conexao
+
+    def adquirir(self) -> sqlite3.Connection:
+        """Empresta uma conexão ociosa ou abre uma nova."""
+        with self._trava:
+            self._em_uso += 1
+            if self._ociosas:
+                self._reutilizadas += 1
+                return self._ociosas.pop()
+            self._criadas += 1
+        try:
+            return self._abrir()
+        except Exception:
+            with self._trava:
+                self._em_uso -= 1
+            raise
+
+    def devolver(self, conexao: sqlite3.Connection) -> None:
+        """Devolve a conexão ao pool, desfazendo transações deixadas abertas."""
+        try:
+            if conexao.in_transaction:
+                conexao.rollback()
+            reaproveitar = True
+        except sqlite3.Error:
+            reaproveitar = False
+        with self._trava:
+            self._em_uso -= 1
+            if reaproveitar and len(self._ociosas) < self.tamanho:
+                self._ociosas.append(conexao)
+                return
+            self._descartadas += 1
+        conexao.close()
+
+    @contextmanager
+    def conexao(self) -> Iterator[sqlite3.Connection]:
+        """Empresta uma conexão durante o bloco ``with``."""
+        conexao = self.adquirir()
+        try:
+            yield conexao
+        finally:
+            self.devolver(conexao)
+
+    def fechar(self) -> None:
+        """Fecha todas as conexões ociosas."""
+        with self._trava:
+            ociosas, self._ociosas = self._ociosas, []
+        for conexao in ociosas:
+            conexao.close()
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Conexões criadas, reutilizadas, descartadas, em uso e ociosas."""
+        with self._trava:
+            return {
+                'criadas': self._criadas,
+                'reutilizadas': self._reutilizadas,
+                'descartadas': self._descartadas,
+                'em_uso': self._em_uso,
+                'ociosas': len(self._ociosas),
+                'capacidade': self.tamanho,
+            }
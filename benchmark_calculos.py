@@ -0,0 +1,415 @@
+"""
+Benchmark das calculadoras registradas.
+
+Percorre os registros de ``calc_matematica``, ``calc_fisica`` e
+``calc_quimica`` e monta, para cada cálculo, um caso por direção de
+resolução (qual campo fica como incógnita). Os valores vêm de
+``VALORES_PADRAO`` e ``EXEMPLOS``; direções que falham com essas entradas são
+listadas como ignoradas, de modo que um cálculo novo entra no benchmark sem
+alterar este arquivo.
+
+Cada caso passa pelo mesmo caminho das rotas (``calculate_<área>``, com
+conversão e validação do registro) e mede:
+
+- latência por chamada (``timeit``: mínimo, mediana e p95 das rodadas);
+- memória alocada por chamada (``tracemalloc``: pico e memória retida).
+
+Uso:
+
+    python benchmark_calculos.py --saida base.json
+    python benchmark_calculos.py --comparar base.json --tolerancia 0.15
+
+Com ``--comparar``, casos cuja latência mínima ou pico de memória piorarem
+além da tolerância são marcados como regressão e o script termina com código 1.
+"""
+
+import argparse
+import array
+import base64
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# O benchmark não deve gravar no banco do app
+os.environ.setdefault('BALANCEAMENTO_CACHE_BANCO', '')
+
+import balanceador  # noqa: E402
+import calc_fisica  # noqa: E402
+import calc_matematica  # noqa: E402
+import calc_quimica  # noqa: E402
+
+AREAS = {
+    'matematica': (calc_matematica.REGISTRO, calc_matematica.calculate_matematica),
+    'fisica': (calc_fisica.REGISTRO, calc_fisica.calculate_fisica),
+    'quimica': (calc_quimica.REGISTRO, calc_quimica.calculate_quimica),
+}
+
+# Segundos de cada rodada de medição
+DURACAO_RODADA = 0.01
+
+# Valor usado para um campo numérico sem valor próprio
+VALOR_NUMERICO = 2.0
+
+# Valores representativos por nome de campo, válidos em qualquer cálculo
+VALORES_PADRAO: Dict[str, Any] = {
+    'angulo': 30.0,
+    'razao_da_pg': 0.5,
+    'probabilidade': 0.25,
+    'casos_favoraveis': 1.0,
+    'casos_possiveis': 4.0,
+    'n': 5.0,
+    'coeficiente': 0.3,
+    'equacao_reagentes': 'H2 + O2',
+    'equacao_produtos': 'H2O',
+    'elemento': 'Ferro',
+    'acido_ou_base': 'ácido',
+    'modo': 'auto',
+}
+
+
+def _buffer_matriz(ordem: int) -> Dict[str, Any]:
+    """Matriz quadrada bem condicionada no formato compacto (base64, float64)."""
+    valores = array.array('d', (
+        1.0 if i == j else ((i * 7 + j * 3) % 11) / (11.0 * ordem)
+        for i in range(ordem) for j in range(ordem)
+    ))
+    if sys.byteorder != 'little':
+        valores.byteswap()
+    return {'forma': [ordem, ordem], 'tipo': 'float64', 'dados': base64.b64encode(valores.tobytes()).decode('ascii')}
+
+
+MATRIZ_PEQUENA = [[2, -1, 0], [-1, 2, -1], [0, -1, 2]]
+MATRIZ_GRANDE = _buffer_matriz(200)
+
+# Entradas completas para cálculos que precisam de valores específicos; cada
+# exemplo vira um caso próprio (as direções de resolução partem do primeiro)
+EXEMPLOS: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {
+    ('quimica', 'balanceamento'): {
+        'simples': {'equacao_reagentes': 'H2 + O2', 'equacao_produtos': 'H2O'},
+        'combustao': {'equacao_reagentes': 'C8H18 + O2', 'equacao_produtos': 'CO2 + H2O'},
+        'redox': {'equacao_reagentes': 'KMnO4 + HCl', 'equacao_produtos': 'KCl + MnCl2 + H2O + Cl2'},
+        'parenteses': {'equacao_reagentes': 'Ca3(PO4)2 + SiO2 + C',
+                       'equacao_produtos': 'CaSiO3 + P4 + CO'},
+    },
+    ('quimica', 'excesso'): {
+        'padrao': {'equacao_reagentes': '2H2, O2', 'equacao_produtos': '2H2O', 'massa_disponivel': 10.0},
+    },
+    ('quimica', 'pilha_de_daniels'): {
+        'padrao': {'equacao_reagentes': 'Zn, Zn2+', 'equacao_produtos': 'Cu2+, Cu',
+                   'concentracao_dos_reagentes': 1.0, 'concentracao_dos_produtos': 0.1},
+    },
+    ('matematica', 'fatorial'): {
+        'tabela': {'n': 20.0},
+        'exato': {'n': 3000.0},
+        'lgamma': {'n': 1e9},
+    },
+    ('matematica', 'combinacao_simples'): {
+        'exato': {'n': 52.0, 'k': 5.0},
+        'grande': {'n': 1e5, 'k': 2000.0},
+        'lgamma': {'n': 1e12, 'k': 5e5},
+    },
+    ('matematica', 'determinante_da_matriz'): {
+        'exata': {'matriz': MATRIZ_PEQUENA},
+        'numerica': {'matriz': MATRIZ_PEQUENA, 'modo': 'numerico'},
+        'grande': {'matriz': MATRIZ_GRANDE},
+    },
+    ('matematica', 'multiplicacao_de_matriz'): {
+        'exata': {'matriz_a': MATRIZ_PEQUENA, 'matriz_b': MATRIZ_PEQUENA},
+        'grande': {'matriz_a': MATRIZ_GRANDE, 'matriz_b': MATRIZ_GRANDE},
+    },
+    ('matematica', 'inversa_da_matriz'): {
+        'exata': {'matriz': MATRIZ_PEQUENA},
+        'grande': {'matriz': MATRIZ_GRANDE},
+    },
+    ('matematica', 'posto_da_matriz'): {
+        'exata': {'matriz': MATRIZ_PEQUENA},
+        'grande': {'matriz': MATRIZ_GRANDE},
+    },
+    ('matematica', 'sistema_linear'): {
+        'exata': {'matriz': MATRIZ_PEQUENA, 'vetor_b': [1, 0, 1]},
+        'grande': {'matriz': MATRIZ_GRANDE, 'vetor_b': [1.0] * 200},
+    },
+    ('quimica', 'equilibrio_ionico'): {
+        'padrao': {'acido_ou_base': 'ácido', 'constante_de_equilibrio': 1.8e-5, 'concentracao_incial': 0.1},
+    },
+}
+
+
+class Caso:
+    """Uma chamada de cálculo com entradas fixas."""
+
+    def __init__(self, area: str, tipo_calculo: str, entradas: Dict[str, Any], variante: str):
+        self.area = area
+        self.tipo_calculo = tipo_calculo
+        self.entradas = entradas
+        self.variante = variante
+        self.identificador = f'{area}/{tipo_calculo}[{variante}]'
+
+    def chamada(self) -> Callable[[], Any]:
+        calcular = AREAS[self.area][1]
+        tipo_calculo, entradas = self.tipo_calculo, self.entradas
+        return lambda: calcular(tipo_calculo, **entradas)
+
+
+@contextlib.contextmanager
+def _silencioso() -> Iterator[None]:
+    """Descarta os prints de depuração das calculadoras e impede leituras de ``input()``."""
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+            yield
+    finally:
+        sys.stdin = stdin
+
+
+def _valores_base(area: str, tipo_calculo: str, parametros: Tuple[str, ...],
+                  campos_texto) -> Dict[str, Dict[str, Any]]:
+    exemplos = EXEMPLOS.get((area, tipo_calculo))
+    if exemplos:
+        return exemplos
+    valores = {}
+    for parametro in parametros:
+        padrao = VALORES_PADRAO.get(parametro)
+        if padrao is None:
+            padrao = 'H2O' if parametro in campos_texto else VALOR_NUMERICO
+        valores[parametro] = padrao
+    return {'padrao': valores}
+
+
+def descobrir_casos(filtro: str = '') -> Tuple[List[Caso], List[Dict[str, str]]]:
+    """
+    Monta os casos de todos os cálculos registrados.
+
+    Para cada cálculo tenta deixar cada campo como incógnita e também enviar
+    todos os campos; ficam as variantes que executam sem erro.
+
+    Args:
+        filtro (str): Só inclui casos cujo identificador contém este texto
+
+    Returns:
+        Tuple[List[Caso], List[Dict[str, str]]]: Casos válidos e cálculos ignorados com o motivo
+    """
+    casos: List[Caso] = []
+    ignorados: List[Dict[str, str]] = []
+    for area, (registro, calcular) in AREAS.items():
+        for tipo_calculo in registro:
+            calculo = registro[tipo_calculo]
+            exemplos = _valores_base(area, tipo_calculo, calculo.parametros, calculo.campos_texto)
+            candidatos = []
+            for indice, (nome, valores) in enumerate(exemplos.items()):
+                candidatos.append((nome, valores))
+                if indice == 0:
+                    for incognita in calculo.parametros:
+                        if incognita in calculo.campos_texto:
+                            continue
+                        candidatos.append((
+                            f'incognita={incognita}',
+                            {campo: valor for campo, valor in valores.items() if campo != incognita}
+                        ))
+            erro = None
+            validos = 0
+            for variante, entradas in candidatos:
+                caso = Caso(area, tipo_calculo, entradas, variante)
+                if filtro and filtro not in caso.identificador:
+                    continue
+                try:
+                    with _silencioso():
+                        caso.chamada()()
+                except Exception as e:
+                    erro = str(e)
+                    continue
+                casos.append(caso)
+                validos += 1
+            if not validos and erro is not None:
+                ignorados.append({'calculo': f'{area}/{tipo_calculo}', 'erro': erro})
+    return casos, ignorados
+
+
+def _percentil(valores: List[float], fracao: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(fracao * (len(ordenados) - 1))))]
+
+
+def medir(caso: Caso, repeticoes: int = 15, amostras_memoria: int = 5, frio: bool = False) -> Dict[str, Any]:
+    """
+    Mede latência e alocações de um caso.
+
+    Args:
+        caso (Caso): Caso a medir
+        repeticoes (int): Rodadas do ``timeit``; cada rodada dura cerca de ``DURACAO_RODADA``
+        amostras_memoria (int): Chamadas medidas com ``tracemalloc``
+        frio (bool): Esvazia o cache de balanceamento antes de cada chamada
+
+    Returns:
+        Dict[str, Any]: Latências em microssegundos e alocações em bytes
+    """
+    chamada = caso.chamada()
+    if frio:
+        quente = chamada
+
+        def chamada():
+            balanceador.limpar_cache()
+            return quente()
+
+    with _silencioso():
+        temporizador = timeit.Timer(chamada)
+        numero = max(1, int(DURACAO_RODADA / max(temporizador.timeit(number=1), 1e-7)))
+        # Uma rodada de aquecimento antes das medidas
+        temporizador.timeit(number=numero)
+        rodadas = [total / numero * 1e6 for total in temporizador.repeat(repeat=repeticoes, number=numero)]
+
+        picos, retidos = [], []
+        tracemalloc.start()
+        try:
+            for _ in range(amostras_memoria):
+                tracemalloc.reset_peak()
+                antes = tracemalloc.get_traced_memory()[0]
+                chamada()
+                atual, pico = tracemalloc.get_traced_memory()
+                picos.append(pico - antes)
+                retidos.append(atual - antes)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'area': caso.area,
+        'tipo_calculo': caso.tipo_calculo,
+        'variante': caso.variante,
+        'entradas': caso.entradas,
+        'chamadas_por_rodada': numero,
+        'minimo_us': round(min(rodadas), 3),
+        'mediana_us': round(statistics.median(rodadas), 3),
+        'p95_us': round(_percentil(rodadas, 0.95), 3),
+        'pico_bytes': int(statistics.median(picos)),
+        'retido_bytes': int(statistics.median(retidos)),
+    }
+
+
+def executar(filtro: str = '', repeticoes: int = 15, frio: bool = False) -> Dict[str, Any]:
+    """Descobre e mede todos os casos, devolvendo o relatório completo."""
+    casos, ignorados = descobrir_casos(filtro)
+    resultados = {}
+    for caso in casos:
+        resultados[caso.identificador] = medir(caso, repeticoes=repeticoes, frio=frio)
+        print(f"{caso.identificador:<70} {resultados[caso.identificador]['mediana_us']:>12.2f} µs",
+              file=sys.stderr)
+    return {
+        'gerado_em': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pythonhashseed': os.environ.get('PYTHONHASHSEED'),
+        'plataforma': platform.platform(),
+        'repeticoes': repeticoes,
+        'frio': frio,
+        'casos': resultados,
+        'ignorados': ignorados,
+    }
+
+
+def comparar(atual: Dict[str, Any], base: Dict[str, Any], tolerancia: float = 0.15,
+             tolerancia_memoria: float = 0.10, minimo_us: float = 2.0) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compara dois relatórios caso a caso.
+
+    Args:
+        atual (Dict[str, Any]): Relatório da execução atual
+        base (Dict[str, Any]): Relatório salvo como referência
+        tolerancia (float): Aumento relativo da latência mínima aceito (0,15 = 15%)
+        tolerancia_memoria (float): Aumento relativo do pico de memória aceito
+        minimo_us (float): Diferença absoluta abaixo da qual a latência é tratada como ruído
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Regressões, melhorias, casos novos e removidos
+    """
+    regressoes, melhorias = [], []
+    casos_atuais, casos_base = atual['casos'], base['casos']
+    for identificador, medida in casos_atuais.items():
+        referencia = casos_base.get(identificador)
+        if referencia is None:
+            continue
+        # O mínimo das rodadas é menos sensível a ruído do sistema que a mediana
+        razao = medida['minimo_us'] / referencia['minimo_us'] if referencia['minimo_us'] else 1.0
+        diferenca = medida['minimo_us'] - referencia['minimo_us']
+        memoria = (medida['pico_bytes'] / referencia['pico_bytes']) if referencia['pico_bytes'] else 1.0
+        linha = {
+            'caso': identificador,
+            'minimo_base_us': referencia['minimo_us'],
+            'minimo_us': medida['minimo_us'],
+            'razao': round(razao, 3),
+            'pico_base_bytes': referencia['pico_bytes'],
+            'pico_bytes': medida['pico_bytes'],
+        }
+        if (razao > 1 + tolerancia and diferenca > minimo_us) or memoria > 1 + tolerancia_memoria:
+            regressoes.append(linha)
+        elif razao < 1 - tolerancia and -diferenca > minimo_us:
+            melhorias.append(linha)
+    return {
+        'regressoes': regressoes,
+        'melhorias': melhorias,
+        'novos': sorted(set(casos_atuais) - set(casos_base)),
+        'removidos': sorted(set(casos_base) - set(casos_atuais)),
+    }
+
+
+def _imprimir_comparacao(resultado: Dict[str, List[Any]]) -> None:
+    for titulo, chave in (('Regressões', 'regressoes'), ('Melhorias', 'melhorias')):
+        print(f'\n{titulo}: {len(resultado[chave])}')
+        for linha in resultado[chave]:
+            print(f"  {linha['caso']:<68} {linha['minimo_base_us']:>10.2f} -> {linha['minimo_us']:>10.2f} µs "
+                  f"(x{linha['razao']:.2f}), pico {linha['pico_base_bytes']} -> {linha['pico_bytes']} B")
+    for titulo, chave in (('Casos novos', 'novos'), ('Casos removidos', 'removidos')):
+        if resultado[chave]:
+            print(f'\n{titulo}: ' + ', '.join(resultado[chave]))
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark das calculadoras registradas.')
+    parser.add_argument('--saida', help='Arquivo JSON onde o relatório é gravado')
+    parser.add_argument('--comparar', metavar='BASE', help='Relatório de referência para detectar regressões')
+    parser.add_argument('--filtro', default='', help="Só mede casos cujo identificador contém o texto (ex.: 'quimica/')")
+    parser.add_argument('--repeticoes', type=int, default=15, help='Rodadas do timeit por caso')
+    parser.add_argument('--tolerancia', type=float, default=0.15, help='Aumento relativo da latência mínima aceito')
+    parser.add_argument('--tolerancia-memoria', type=float, default=0.10, help='Aumento relativo do pico de memória aceito')
+    parser.add_argument('--minimo-us', type=float, default=2.0, help='Diferença de latência tratada como ruído (µs)')
+    parser.add_argument('--frio', action='store_true', help='Esvazia o cache de balanceamento antes de cada chamada')
+    args = parser.parse_args(argumentos)
+
+    relatorio = executar(args.filtro, args.repeticoes, args.frio)
+    print(f"\n{len(relatorio['casos'])} casos medidos, {len(relatorio['ignorados'])} cálculos ignorados")
+    for ignorado in relatorio['ignorados']:
+        print(f"  ignorado {ignorado['calculo']}: {ignorado['erro']}")
+
+    codigo = 0
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        if args.filtro:
+            base['casos'] = {caso: medida for caso, medida in base['casos'].items() if args.filtro in caso}
+        if base.get('frio') != relatorio['frio']:
+            print('\nAviso: a referência e esta execução diferem em --frio; as latências não são comparáveis.')
+        resultado = comparar(relatorio, base, args.tolerancia, args.tolerancia_memoria, args.minimo_us)
+        relatorio['comparacao'] = {'base': args.comparar, **resultado}
+        _imprimir_comparacao(resultado)
+        codigo = 1 if resultado['regressoes'] else 0
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    return codigo
+
+
+if __name__ == '__main__':
+    # A semente do hash muda o layout dos dicionários e a latência entre execuções;
+    # fixá-la torna os relatórios comparáveis
+    if 'PYTHONHASHSEED' not in os.environ:
+        os.environ['PYTHONHASHSEED'] = '0'
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+    sys.exit(main())
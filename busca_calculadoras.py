@@ -0,0 +1,211 @@
+"""
+Busca de calculadoras por palavras-chave.
+
+Monta, uma única vez, um índice invertido ``termo -> {calculadora: peso}`` a
+partir de ``config.CALCULATORS`` (nome, título, descrição e variáveis de cada
+cálculo, além do título da categoria). A pergunta é normalizada (minúsculas,
+sem acentos), quebrada em palavras inteiras e cada palavra é procurada no
+índice, então o custo é linear no tamanho do texto e "área" não casa mais
+dentro de outras palavras.
+
+O peso guardado em cada entrada já é a contribuição BM25 do termo para a
+calculadora (frequências ponderadas por campo), de modo que pontuar uma
+pergunta é só somar as entradas dos seus termos.
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+_PALAVRA = re.compile(r'[a-z0-9]+')
+
+# Palavras sem valor para a busca
+PALAVRAS_VAZIAS = frozenset({
+    'a', 'o', 'as', 'os', 'um', 'uma', 'uns', 'umas', 'de', 'da', 'do', 'das', 'dos',
+    'e', 'em', 'no', 'na', 'nos', 'nas', 'por', 'para', 'pra', 'com', 'sem', 'que',
+    'qual', 'quais', 'como', 'se', 'ao', 'aos', 'eu', 'me', 'meu', 'minha', 'isso',
+    'esse', 'essa', 'este', 'esta', 'ou', 'ja', 'mais', 'menos', 'muito', 'ser',
+    'calcular', 'calculo', 'calcula', 'calculadora', 'quero', 'preciso', 'sei',
+    'valor', 'usar', 'uso', 'fazer', 'faco', 'tenho', 'dado', 'dados', 'entre',
+})
+
+# Parâmetros do BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Peso de cada campo do catálogo na frequência do termo
+PESOS = {
+    'nome': 3.0,
+    'titulo': 3.0,
+    'variaveis': 2.0,
+    'descricao': 1.0,
+    'categoria': 1.0,
+}
+
+
+def normalizar(texto: str) -> str:
+    """Converte para minúsculas e remove acentos."""
+    decomposto = unicodedata.normalize('NFKD', texto.lower())
+    return ''.join(c for c in decomposto if not unicodedata.combining(c))
+
+
+# Sufixos removidos para aproximar verbos e substantivos ('balancear', 'balanceamento')
+_SUFIXOS = ('amento', 'imento', 'acao', 'icao', 'ar', 'er', 'ir')
+
+
+def _radical(palavra: str) -> str:
+    """Reduz plurais simples e alguns sufixos ('velocidades' -> 'velocidade', 'dilatar' -> 'dilat')."""
+    if len(palavra) > 4 and palavra.endswith('oes'):
+        palavra = palavra[:-3] + 'ao'
+    elif len(palavra) > 3 and palavra.endswith('s') and not palavra.endswith('ss'):
+        palavra = palavra[:-1]
+    for sufixo in _SUFIXOS:
+        if palavra.endswith(sufixo) and len(palavra) - len(sufixo) >= 4:
+            return palavra[:-len(sufixo)]
+    return palavra
+
+
+def tokenizar(texto: str) -> List[str]:
+    """Quebra o texto em termos normalizados, sem palavras vazias."""
+    return [
+        _radical(palavra)
+        for palavra in _PALAVRA.findall(normalizar(texto.replace('_', ' ')))
+        if palavra not in PALAVRAS_VAZIAS and (len(palavra) > 1 or palavra.isdigit())
+    ]
+
+
+class Sugestao(NamedTuple):
+    """Calculadora sugerida para uma pergunta."""
+    area: str
+    nome: str
+    titulo: str
+    variaveis: Tuple[str, ...]
+    pontuacao: float
+
+    def como_dict(self) -> Dict:
+        """Formato usado pelo chatbot em ``analyze_input``."""
+        return {
+            'category': self.area,
+            'name': self.nome,
+            'title': self.titulo,
+            'params': list(self.variaveis),
+            'score': round(self.pontuacao, 3),
+        }
+
+
+class IndiceCalculadoras:
+    """Índice invertido sobre o catálogo de calculadoras."""
+
+    def __init__(self, catalogo: Dict):
+        """
+        Args:
+            catalogo (Dict): Catálogo no formato de ``config.CALCULATORS``
+        """
+        self._documentos: List[Tuple[str, str, str, Tuple[str, ...]]] = []
+        frequencias: List[Dict[str, float]] = []
+
+        for area, dados_area in catalogo.items():
+            for categoria in dados_area.get('categories', {}).values():
+                for nome, calculo in categoria.get('calculations', {}).items():
+                    variaveis = tuple(calculo.get('variables', ()))
+                    self._documentos.append((area, nome, calculo.get('title', nome), variaveis))
+                    campos = {
+                        'nome': nome,
+                        'titulo': calculo.get('title', ''),
+                        'variaveis': ' '.join(variaveis),
+                        'descricao': calculo.get('description', ''),
+                        'categoria': categoria.get('title', ''),
+                    }
+                    # Frequência de cada termo ponderada pelo campo em que aparece
+                    frequencia: Dict[str, float] = defaultdict(float)
+                    for campo, texto in campos.items():
+                        for termo in tokenizar(texto):
+                            frequencia[termo] += PESOS[campo]
+                    frequencias.append(frequencia)
+
+        self._posicoes = {(area, nome): posicao for posicao, (area, nome, _, _) in enumerate(self._documentos)}
+        total = len(frequencias)
+        comprimentos = [sum(frequencia.values()) for frequencia in frequencias]
+        medio = sum(comprimentos) / total if total else 1.0
+        documentos_por_termo: Dict[str, int] = defaultdict(int)
+        for frequencia in frequencias:
+            for termo in frequencia:
+                documentos_por_termo[termo] += 1
+
+        self._idf: Dict[str, float] = {
+            termo: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for termo, df in documentos_por_termo.items()
+        }
+        self._indice: Dict[str, Dict[int, float]] = defaultdict(dict)
+        for documento, frequencia in enumerate(frequencias):
+            normalizacao = BM25_K1 * (1 - BM25_B + BM25_B * comprimentos[documento] / medio)
+            for termo, tf in frequencia.items():
+                self._indice[termo][documento] = self._idf[termo] * tf * (BM25_K1 + 1) / (tf + normalizacao)
+        self._indice = dict(self._indice)
+
+    def __len__(self) -> int:
+        return len(self._documentos)
+
+    def pontuar(self, termos: Iterable[str]) -> Dict[int, float]:
+        """Pontuação BM25 de cada calculadora que contém algum termo distinto da consulta."""
+        pontuacoes: Dict[int, float] = defaultdict(float)
+        for termo in set(termos):
+            for documento, peso in self._indice.get(termo, {}).items():
+                pontuacoes[documento] += peso
+        return pontuacoes
+
+    def buscar(self, texto: str, limite: int = 5) -> List[Sugestao]:
+        """
+        Retorna as calculadoras mais relevantes para o texto.
+
+        Args:
+            texto (str): Pergunta do usuário
+            limite (int): Número máximo de sugestões
+
+        Returns:
+            List[Sugestao]: Sugestões da mais para a menos relevante
+        """
+        pontuacoes = self.pontuar(tokenizar(texto))
+        # Empates ficam na ordem do catálogo
+        melhores = sorted(pontuacoes.items(), key=lambda item: (-item[1], item[0]))[:limite]
+        return [Sugestao(*self._documentos[documento], pontuacao) for documento, pontuacao in melhores]
+
+    def confianca(self, texto: str, sugestoes: List[Sugestao]) -> float:
+        """
+        Confiança na primeira sugestão, entre 0 e 1.
+
+        Combina a cobertura da pergunta (fração do IDF dos termos conhecidos
+        presentes na primeira sugestão) com a distância de pontuação para a
+        segunda colocada.
+        """
+        if not sugestoes:
+            return 0.0
+        termos = {termo for termo in tokenizar(texto) if termo in self._idf}
+        primeira = self._posicoes[(sugestoes[0].area, sugestoes[0].nome)]
+        total = sum(self._idf[termo] for termo in termos)
+        coberto = sum(self._idf[termo] for termo in termos if primeira in self._indice[termo])
+        segunda = sugestoes[1].pontuacao if len(sugestoes) > 1 else 0.0
+        return (coberto / total) * (1 - math.exp(-(sugestoes[0].pontuacao - segunda) / 2))
+
+
+class IndicePalavrasChave:
+    """Associa termos a categorias de palavras-chave (ex.: 'voltagem' -> 'eletricidade')."""
+
+    def __init__(self, palavras_chave: Dict[str, Iterable[str]]):
+        self._categorias = list(palavras_chave)
+        self._indice: Dict[str, List[int]] = defaultdict(list)
+        for posicao, (categoria, palavras) in enumerate(palavras_chave.items()):
+            for palavra in palavras:
+                for termo in tokenizar(palavra):
+                    if posicao not in self._indice[termo]:
+                        self._indice[termo].append(posicao)
+        self._indice = dict(self._indice)
+
+    def encontrar(self, texto: str) -> List[str]:
+        """Categorias cujas palavras aparecem no texto, na ordem em que foram declaradas."""
+        encontradas = set()
+        for termo in tokenizar(texto):
+            encontradas.update(self._indice.get(termo, ()))
+        return [self._categorias[posicao] for posicao in sorted(encontradas)]
@@ -0,0 +1,84 @@
+"""
+Cache LRU em memória, seguro para threads.
+
+Usado pelos módulos que repetem o mesmo trabalho para as mesmas entradas
+(balanceamento de equações, respostas do chatbot, resultados de cálculos).
+Cada processo do gunicorn tem a sua própria instância; quem precisar
+compartilhar entre processos persiste por fora (ver ``balanceador``).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Sentinela para distinguir "não encontrado" de um valor None armazenado
+_AUSENTE = object()
+
+
+class CacheLRU:
+    """Mapeamento limitado que descarta o item usado há mais tempo, com validade opcional."""
+
+    def __init__(self, tamanho_maximo: int = 1024, validade: Optional[float] = None):
+        """
+        Args:
+            tamanho_maximo (int): Número máximo de itens mantidos
+            validade (Optional[float]): Segundos até um item expirar (None = não expira)
+        """
+        if tamanho_maximo <= 0:
+            raise ValueError("O tamanho máximo do cache deve ser positivo.")
+        self.tamanho_maximo = tamanho_maximo
+        self.validade = validade
+        self._itens: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave: Hashable, padrao: Any = None) -> Any:
+        """Retorna o valor da chave, ou ``padrao`` se ela não existir ou tiver expirado."""
+        with self._trava:
+            item = self._itens.get(chave, _AUSENTE)
+            if item is not _AUSENTE:
+                valor, expira_em = item
+                if self.validade is None or expira_em > time.monotonic():
+                    self._itens.move_to_end(chave)
+                    self.acertos += 1
+                    return valor
+                del self._itens[chave]
+            self.falhas += 1
+            return padrao
+
+    def guardar(self, chave: Hashable, valor: Any) -> None:
+        """Armazena o valor, descartando o item mais antigo se o cache estiver cheio."""
+        expira_em = time.monotonic() + self.validade if self.validade is not None else 0.0
+        with self._trava:
+            self._itens[chave] = (valor, expira_em)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+
+    def __contains__(self, chave: Hashable) -> bool:
+        with self._trava:
+            item = self._itens.get(chave, _AUSENTE)
+            return item is not _AUSENTE and (self.validade is None or item[1] > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def limpar(self) -> None:
+        """Esvazia o cache e zera as estatísticas."""
+        with self._trava:
+            self._itens.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Acertos, falhas, taxa de acerto e ocupação do cache."""
+        total = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': self.acertos / total if total else 0.0,
+            'tamanho': len(self._itens),
+            'capacidade': self.tamanho_maximo,
+        }
@@ -0,0 +1,220 @@
+"""
+Cache dos resultados das calculadoras.
+
+A chave é ``(área, tipo_calculo, entradas normalizadas)``: campos vazios são
+descartados, números são comparados pelo valor ("2", 2 e "2.0" são a mesma
+entrada) e textos perdem os espaços das pontas. Só respostas de sucesso são
+guardadas. Áreas em que listas geram respostas do tamanho da entrada (física
+vetorizada) podem pedir que requisições com listas não passem pelo cache.
+
+O armazenamento segue ``config.CACHE_TYPE``, com os mesmos nomes do
+Flask-Caching:
+
+- ``SimpleCache``: LRU em memória, um por processo;
+- ``SQLiteCache``: tabela SQLite num arquivo local, compartilhada por todos
+  os processos do gunicorn;
+- ``NullCache``: desativa o cache.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cache import CacheLRU
+
+# Resposta de um dispatcher: corpo e status HTTP
+Resposta = Tuple[Dict[str, Any], int]
+
+
+def _normalizar_valor(valor: Any) -> Any:
+    if isinstance(valor, bool):
+        return valor
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    if isinstance(valor, str):
+        texto = valor.strip()
+        try:
+            return float(texto)
+        except ValueError:
+            return texto
+    return valor
+
+
+def chave_calculo(area: str, dados: Dict[str, Any]) -> str:
+    """Monta a chave do cache para uma requisição de cálculo."""
+    entradas = sorted(
+        (campo, _normalizar_valor(valor))
+        for campo, valor in dados.items()
+        if campo != 'tipo_calculo' and valor is not None and valor != ''
+    )
+    return json.dumps([area, dados.get('tipo_calculo'), entradas], ensure_ascii=False, sort_keys=True, default=str)
+
+
+class ArmazenamentoMemoria:
+    """Armazenamento LRU em memória, exclusivo do processo."""
+
+    def __init__(self, tamanho_maximo: int, validade: float):
+        self._cache = CacheLRU(tamanho_maximo, validade or None)
+
+    def obter(self, chave: str) -> Optional[Resposta]:
+        return self._cache.obter(chave)
+
+    def guardar(self, chave: str, resposta: Resposta) -> None:
+        self._cache.guardar(chave, resposta)
+
+    def limpar(self) -> None:
+        self._cache.limpar()
+
+    def tamanho(self) -> int:
+        return len(self._cache)
+
+
+class ArmazenamentoSQLite:
+    """Armazenamento numa tabela SQLite local, compartilhado entre processos."""
+
+    def __init__(self, caminho: str, tamanho_maximo: int, validade: float):
+        self.caminho = caminho
+        self.tamanho_maximo = tamanho_maximo
+        self.validade = validade
+        self._local = threading.local()
+        self._insercoes = 0
+        with self._conexao() as db:
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS cache_calculos ('
+                'chave TEXT PRIMARY KEY, resposta TEXT NOT NULL, expira_em REAL NOT NULL)'
+            )
+            db.execute('CREATE INDEX IF NOT EXISTS idx_cache_calculos_expira_em ON cache_calculos (expira_em)')
+
+    def _conexao(self) -> sqlite3.Connection:
+        # Uma conexão por thread, mantida aberta
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.caminho, timeout=5)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db = db
+        return db
+
+    def obter(self, chave: str) -> Optional[Resposta]:
+        linha = self._conexao().execute(
+            'SELECT resposta FROM cache_calculos WHERE chave = ? AND expira_em > ?',
+            (chave, time.time())
+        ).fetchone()
+        if linha is None:
+            return None
+        corpo, status = json.loads(linha[0])
+        return corpo, status
+
+    def guardar(self, chave: str, resposta: Resposta) -> None:
+        agora = time.time()
+        expira_em = agora + self.validade if self.validade else float('inf')
+        with self._conexao() as db:
+            db.execute(
+                'INSERT OR REPLACE INTO cache_calculos (chave, resposta, expira_em) VALUES (?, ?, ?)',
+                (chave, json.dumps(resposta, ensure_ascii=False), expira_em)
+            )
+        # A cada cem inserções, remove expirados e, acima do limite, os que vencem primeiro
+        self._insercoes += 1
+        if self._insercoes % 100 == 0:
+            self.podar()
+
+    def podar(self) -> None:
+        """Remove os resultados expirados e o excedente acima do tamanho máximo."""
+        with self._conexao() as db:
+            db.execute('DELETE FROM cache_calculos WHERE expira_em <= ?', (time.time(),))
+            db.execute(
+                'DELETE FROM cache_calculos WHERE chave IN ('
+                'SELECT chave FROM cache_calculos ORDER BY expira_em DESC LIMIT -1 OFFSET ?)',
+                (self.tamanho_maximo,)
+            )
+
+    def limpar(self) -> None:
+        with self._conexao() as db:
+            db.execute('DELETE FROM cache_calculos')
+
+    def tamanho(self) -> int:
+        return self._conexao().execute('SELECT COUNT(*) FROM cache_calculos').fetchone()[0]
+
+
+class CacheCalculos:
+    """Cache na frente dos dispatchers de cálculo, com contadores de acertos e falhas."""
+
+    def __init__(self, armazenamento=None):
+        """
+        Args:
+            armazenamento: ``ArmazenamentoMemoria``, ``ArmazenamentoSQLite`` ou None (desativado)
+        """
+        self.armazenamento = armazenamento
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def memorizar(self, area: str, ignorar_listas: bool = False
+                  ) -> Callable[[Callable[[Dict[str, Any]], Resposta]], Callable[[Dict[str, Any]], Resposta]]:
+        """
+        Decorador que consulta o cache antes de executar o dispatcher da área.
+
+        Args:
+            area (str): Área da calculadora, parte da chave
+            ignorar_listas (bool): Executa sem cache as requisições com alguma lista
+                nas entradas, cujas respostas crescem com o tamanho da lista
+        """
+        def decorador(processar: Callable[[Dict[str, Any]], Resposta]) -> Callable[[Dict[str, Any]], Resposta]:
+            @wraps(processar)
+            def envolvido(dados: Dict[str, Any]) -> Resposta:
+                if self.armazenamento is None:
+                    return processar(dados)
+                if ignorar_listas and any(isinstance(valor, (list, tuple)) for valor in dados.values()):
+                    return processar(dados)
+                chave = chave_calculo(area, dados)
+                resposta = self.armazenamento.obter(chave)
+                with self._trava:
+                    if resposta is None:
+                        self.falhas += 1
+                    else:
+                        self.acertos += 1
+                if resposta is not None:
+                    # Cópia para que quem chama possa alterar o corpo (ex.: status no lote)
+                    return dict(resposta[0]), resposta[1]
+                corpo, status = processar(dados)
+                if status == 200:
+                    self.armazenamento.guardar(chave, (dict(corpo), status))
+                return corpo, status
+            return envolvido
+        return decorador
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Acertos e falhas deste processo e ocupação do armazenamento."""
+        total = self.acertos + self.falhas
+        return {
+            'tipo': type(self.armazenamento).__name__ if self.armazenamento else None,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': self.acertos / total if total else 0.0,
+            'tamanho': self.armazenamento.tamanho() if self.armazenamento else 0,
+        }
+
+
+def criar_cache_calculos(tipo: str, validade: float, tamanho_maximo: int, caminho_sqlite: str) -> CacheCalculos:
+    """
+    Cria o cache conforme ``CACHE_TYPE``.
+
+    Args:
+        tipo (str): 'SimpleCache', 'SQLiteCache' ou 'NullCache'
+        validade (float): Segundos até um resultado expirar (0 = não expira)
+        tamanho_maximo (int): Máximo de resultados guardados
+        caminho_sqlite (str): Arquivo usado pelo 'SQLiteCache'
+
+    Returns:
+        CacheCalculos: Cache pronto para decorar os dispatchers
+    """
+    if tipo == 'SimpleCache':
+        return CacheCalculos(ArmazenamentoMemoria(tamanho_maximo, validade))
+    if tipo == 'SQLiteCache':
+        return CacheCalculos(ArmazenamentoSQLite(caminho_sqlite, tamanho_maximo, validade))
+    if tipo == 'NullCache':
+        return CacheCalculos(None)
+    raise ValueError(f"CACHE_TYPE '{tipo}' não suportado. Opções: SimpleCache, SQLiteCache, NullCache")
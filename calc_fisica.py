@@ -1,5 +1,19 @@
-from typing import Dict, List, Union, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Union, Optional, Tuple
 import math
+import sys
+from registro_calculos import Ramos, RegistroCalculos, Resultado
+
+# O NumPy só é importado pelos modos vetorizado e de varredura
+if TYPE_CHECKING:
+    import numpy as np
+
+def _eh_vetor(valor) -> bool:
+    """Indica se o valor é uma lista, tupla ou array NumPy."""
+    if isinstance(valor, (list, tuple)):
+        return True
+    # Sem o NumPy carregado não existe ndarray a testar
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(valor, numpy.ndarray)
 
 def calculate_fisica(tipo_calculo: str, **kwargs) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
@@ -12,866 +26,926 @@ def calculate_fisica(tipo_calculo: str, **kwargs) -> Tuple[Dict[str, float], Dic
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: Resultado do cálculo e suas unidades
     """
-    # Mapeamento de tipos de cálculo para suas respectivas funções
-    calculos = {
-        'velocidade_media': velocidade_media,
-        'movimento_uniforme': movimento_uniforme,
-        'movimento_uniformemente_variado': movimento_uniformemente_variado,
-        'equacao_torricelli': equacao_torricelli,
-        'principio_fundamental_dinamica': principio_fundamental_dinamica,
-        'forca_peso': forca_peso,
-        'forca_atrito': forca_atrito,
-        'trabalho_forca_constante': trabalho_forca_constante,
-        'energia_cinetica': energia_cinetica,
-        'energia_potencial': energia_potencial,
-        'energia_potencial_elastica': energia_potencial_elastica,
-        'potencia': potencia,
-        'pressao': pressao,
-        'pressao_hidrostatica': pressao_hidrostatica,
-        'empuxo': empuxo,
-        'dilatacao_linear': dilatacao_linear,
-        'equacao_fundamental_calorimetria': equacao_fundamental_calorimetria,
-        'primeira_lei_termodinamica': primeira_lei_termodinamica,
-        'equacao_dos_espelhos_e_lentes': equacao_dos_espelhos_e_lentes,
-        'aumento_da_imagem': aumento_da_imagem,
-        'velocidade_onda': velocidade_onda,
-        'lei_ohm': lei_ohm,
-        'potencia_eletrica': potencia_eletrica,
-        'forca_entre_cargas_eletricas': forca_entre_cargas_eletricas,
-        'energia_potencial_elastica': energia_potencial_elastica,
-        'energia_mecanica': energia_mecanica
-    }
+    # Sem as máscaras, um NaN no resultado não diria qual validação falhou
+    if tem_vetor(kwargs):
+        raise ValueError("Listas e arrays devem ser calculados com calculate_fisica_vetorizado, "
+                         "que também retorna os elementos inválidos.")
     
-    # Verifica se o tipo de cálculo existe
-    if tipo_calculo not in calculos:
-        raise ValueError(f"Tipo de cálculo '{tipo_calculo}' não encontrado.")
-    
-    # Converte os valores de string para float
-    valores = {}
-    for chave, valor in kwargs.items():
-        if valor is not None and valor != '':
-            try:
-                valores[chave] = float(valor)
-            except ValueError:
-                raise ValueError(f"Valor inválido para {chave}: {valor}")
+    return REGISTRO.executar(tipo_calculo, kwargs)
+
+def tem_vetor(valores: Dict[str, object]) -> bool:
+    """Indica se algum dos valores é uma lista, tupla ou array NumPy."""
+    return any(_eh_vetor(valor) for valor in valores.values())
+
+def calculate_fisica_vetorizado(
+    tipo_calculo: str, max_pontos: Optional[int] = None, **kwargs
+) -> Tuple[Dict[str, 'np.ndarray'], Dict[str, str], Dict[str, 'np.ndarray']]:
+    """
+    Calcula resultados de física sobre arrays, sem laço Python por elemento.
     
-    # Executa o cálculo
+    Args:
+        tipo_calculo (str): Tipo de cálculo a ser realizado
+        max_pontos (Optional[int]): Número máximo de elementos do resultado
+        **kwargs: Valores conhecidos como escalares, listas ou arrays NumPy
+        
+    Returns:
+        Tuple[Dict[str, np.ndarray], Dict[str, str], Dict[str, np.ndarray]]: Resultado
+        do cálculo, suas unidades e as máscaras dos elementos inválidos por mensagem
+    """
+    from calc_fisica_vetorizado import calcular_vetorizado
+    return calcular_vetorizado(tipo_calculo, max_pontos, **kwargs)
+
+def _eixo_varredura(variavel: str, especificacao: Dict[str, float]) -> Tuple[int, Callable[[], 'np.ndarray']]:
+    """
+    Interpreta a especificação de uma variável varrida sem alocar o eixo.
+
+    Returns:
+        Tuple[int, Callable[[], np.ndarray]]: Número de valores do eixo e a função que o gera
+    """
+    import numpy as np
+    if not isinstance(especificacao, dict):
+        raise ValueError(f"Especificação de varredura inválida para {variavel}.")
     try:
-        resultado, unidades = calculos[tipo_calculo](**valores)
-        if not isinstance(resultado, dict) or not isinstance(unidades, dict):
-            raise ValueError('Função de cálculo deve retornar dois dicionários.')
-        return resultado, unidades
-    except Exception as e:
-        raise ValueError(f"Erro ao executar cálculo: {str(e)}")
+        if 'valores' in especificacao:
+            valores = especificacao['valores']
+            if not isinstance(valores, (list, tuple)) or not valores:
+                raise ValueError(f"A varredura de {variavel} não gerou valores.")
+            return len(valores), lambda: np.asarray(valores, dtype=float)
+        inicio = float(especificacao['inicio'])
+        fim = float(especificacao['fim'])
+        if not (math.isfinite(inicio) and math.isfinite(fim)):
+            raise ValueError(f"O início e o fim da varredura de {variavel} devem ser finitos.")
+        if 'passos' in especificacao:
+            passos = int(especificacao['passos'])
+            if passos < 1:
+                raise ValueError(f"O número de passos de {variavel} deve ser positivo.")
+            return passos, lambda: np.linspace(inicio, fim, passos)
+        if 'passo' in especificacao:
+            passo = float(especificacao['passo'])
+            if not passo > 0 or not math.isfinite(passo):
+                raise ValueError(f"O passo de {variavel} deve ser maior que zero.")
+            # Tolerância para incluir o fim quando ele cai exatamente num passo
+            passo = passo if fim >= inicio else -passo
+            parada = fim + passo * 1e-9
+            # Mesmo tamanho que o np.arange vai gerar
+            razao = (parada - inicio) / passo
+            if not math.isfinite(razao):
+                raise ValueError(f"O passo de {variavel} é pequeno demais para o intervalo.")
+            tamanho = max(math.ceil(razao), 0)
+            return tamanho, lambda: np.arange(inicio, parada, passo)
+        raise ValueError(f"Informe 'passos' ou 'passo' para a varredura de {variavel}.")
+    except (KeyError, TypeError):
+        raise ValueError(f"A varredura de {variavel} exige 'inicio' e 'fim' ou uma lista em 'valores'.")
+
+def calculate_fisica_varredura(
+    tipo_calculo: str,
+    varredura: Dict[str, Dict[str, float]],
+    max_pontos: int = 10000,
+    **kwargs
+) -> Tuple[Dict[str, 'np.ndarray'], Dict[str, 'np.ndarray'], Dict[str, str], Dict[str, 'np.ndarray']]:
+    """
+    Gera a tabela de resultados variando uma ou duas entradas de uma fórmula.
+    
+    Args:
+        tipo_calculo (str): Tipo de cálculo a ser realizado
+        varredura (Dict[str, Dict[str, float]]): Variáveis varridas e suas faixas, no
+            formato {'inicio', 'fim', 'passos'}, {'inicio', 'fim', 'passo'} ou {'valores'}
+        max_pontos (int): Número máximo de pontos da grade
+        **kwargs: Valores fixos das demais variáveis conhecidas
+        
+    Returns:
+        Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict[str, str], Dict[str, np.ndarray]]:
+        Eixos da varredura, resultado na grade, unidades e máscaras dos pontos inválidos
+    """
+    if not varredura or len(varredura) > 2:
+        raise ValueError("A varredura deve ter uma ou duas variáveis.")
+    repetidas = set(varredura) & {k for k, v in kwargs.items() if v is not None and v != ''}
+    if repetidas:
+        raise ValueError(f"Variáveis varridas não podem ter valor fixo: {', '.join(sorted(repetidas))}")
+
+    # O limite é conferido pelos tamanhos, antes de alocar qualquer eixo
+    especificacoes = {variavel: _eixo_varredura(variavel, especificacao) for variavel, especificacao in varredura.items()}
+    total_pontos = math.prod(tamanho for tamanho, _ in especificacoes.values())
+    if total_pontos > max_pontos:
+        raise ValueError(f"A varredura gera {total_pontos} pontos; o limite é {max_pontos}.")
 
+    try:
+        eixos = {variavel: gerar() for variavel, (_, gerar) in especificacoes.items()}
+    except TypeError:
+        raise ValueError("Os valores da varredura devem ser números.")
+    for variavel, eixo in eixos.items():
+        if eixo.ndim != 1 or eixo.size == 0:
+            raise ValueError(f"A varredura de {variavel} não gerou valores.")
+
+    # Duas variáveis formam uma grade: linhas seguem a primeira, colunas a segunda
+    import numpy as np
+    grade = np.meshgrid(*eixos.values(), indexing='ij')
+    valores = dict(kwargs)
+    valores.update(zip(eixos, grade))
+
+    resultado, unidades, invalidos = calculate_fisica_vetorizado(tipo_calculo, **valores)
+    return eixos, resultado, unidades, invalidos
+
+# Cada cálculo tem um ramo por incógnita, que recebe só os valores conhecidos.
+# A função pública com a assinatura completa (usada pelas calculadoras Tk)
+# é declarada com @Ramos, que encontra a incógnita e chama o ramo dela.
+
+def _velocidade_media__velocidade_media(deslocamento: float, tempo: float) -> Resultado:
+    if tempo == 0:
+        raise ValueError("Tempo não pode ser zero para calcular a velocidade média.")
+    return {'velocidade_media': deslocamento / tempo}, {'velocidade_media': 'm/s'}
+
+def _velocidade_media__deslocamento(velocidade_media: float, tempo: float) -> Resultado:
+    return {'deslocamento': velocidade_media * tempo}, {'deslocamento': 'm'}
+
+def _velocidade_media__tempo(velocidade_media: float, deslocamento: float) -> Resultado:
+    if velocidade_media == 0:
+        raise ValueError("Velocidade média não pode ser zero para calcular o tempo.")
+    return {'tempo': deslocamento / velocidade_media}, {'tempo': 's'}
+
+@Ramos("Erro na Velocidade Média", {
+    'velocidade_media': _velocidade_media__velocidade_media,
+    'deslocamento': _velocidade_media__deslocamento,
+    'tempo': _velocidade_media__tempo,
+})
 def velocidade_media(
     velocidade_media: Optional[float] = None,
     deslocamento: Optional[float] = None,
     tempo: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'velocidade_media': velocidade_media, 'deslocamento': deslocamento, 'tempo': tempo}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        if velocidade_media is None:
-            if tempo == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a velocidade média.")
-            velocidade_media = deslocamento / tempo
-            return {'velocidade_media': velocidade_media}, {'velocidade_media': 'm/s'}
-        elif deslocamento is None:
-            deslocamento = velocidade_media * tempo
-            return {'deslocamento': deslocamento}, {'deslocamento': 'm'}
-        else: # tempo is None
-            if velocidade_media == 0:
-                raise ValueError("Velocidade média não pode ser zero para calcular o tempo.")
-            tempo = deslocamento / velocidade_media
-            return {'tempo': tempo}, {'tempo': 's'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Velocidade Média: {str(e)}")
-
+) -> Resultado:
+    """Velocidade média: v = Δs / Δt"""
+
+def _movimento_uniforme__posicao_final(posicao_inicial: float, tempo: float, velocidade: float) -> Resultado:
+    return {'posicao_final': posicao_inicial + velocidade * tempo}, {'posicao_final': 'm'}
+
+def _movimento_uniforme__posicao_inicial(posicao_final: float, tempo: float, velocidade: float) -> Resultado:
+    return {'posicao_inicial': posicao_final - velocidade * tempo}, {'posicao_inicial': 'm'}
+
+def _movimento_uniforme__tempo(posicao_final: float, posicao_inicial: float, velocidade: float) -> Resultado:
+    if velocidade == 0:
+        raise ValueError("Velocidade não pode ser zero para calcular o tempo.")
+    tempo = (posicao_final - posicao_inicial) / velocidade
+    if tempo < 0:
+        raise ValueError("Tempo negativo não é fisicamente possível.")
+    return {'tempo': tempo}, {'tempo': 's'}
+
+def _movimento_uniforme__velocidade(posicao_final: float, posicao_inicial: float, tempo: float) -> Resultado:
+    if tempo == 0:
+        raise ValueError("Tempo não pode ser zero para calcular a velocidade.")
+    return {'velocidade': (posicao_final - posicao_inicial) / tempo}, {'velocidade': 'm/s'}
+
+@Ramos("Erro no Movimento Uniforme", {
+    'posicao_final': _movimento_uniforme__posicao_final,
+    'posicao_inicial': _movimento_uniforme__posicao_inicial,
+    'tempo': _movimento_uniforme__tempo,
+    'velocidade': _movimento_uniforme__velocidade,
+})
 def movimento_uniforme(
     posicao_final: Optional[float] = None,
     posicao_inicial: Optional[float] = None,
     tempo: Optional[float] = None,
     velocidade: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'posicao_final': posicao_final, 'posicao_inicial': posicao_inicial, 'tempo': tempo, 'velocidade': velocidade}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if posicao_final is None:
-            posicao_final = posicao_inicial + velocidade * tempo
-            return {'posicao_final': posicao_final}, {'posicao_final': 'm'}
-        elif posicao_inicial is None:
-            posicao_inicial = posicao_final - velocidade * tempo
-            return {'posicao_inicial': posicao_inicial}, {'posicao_inicial': 'm'}
-        elif tempo is None:
-            if velocidade == 0:
-                raise ValueError("Velocidade não pode ser zero para calcular o tempo.")
-            tempo = (posicao_final - posicao_inicial) / velocidade
-            if tempo < 0:
-                raise ValueError("Tempo negativo não é fisicamente possível.")
-            return {'tempo': tempo}, {'tempo': 's'}
-        else: # velocidade is None
-            if tempo == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a velocidade.")
-            velocidade = (posicao_final - posicao_inicial) / tempo
-            return {'velocidade': velocidade}, {'velocidade': 'm/s'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no Movimento Uniforme: {str(e)}")
-
+) -> Resultado:
+    """Movimento uniforme: s = s0 + v·t"""
+
+def _muv__posicao_final(posicao_inicial: float, velocidade_inicial: float, tempo: float, aceleracao: float) -> Resultado:
+    posicao_final = posicao_inicial + velocidade_inicial * tempo + (aceleracao * tempo**2) / 2
+    return {'posicao_final': posicao_final}, {'posicao_final': 'm'}
+
+def _muv__posicao_inicial(posicao_final: float, velocidade_inicial: float, tempo: float, aceleracao: float) -> Resultado:
+    posicao_inicial = posicao_final - velocidade_inicial * tempo - (aceleracao * tempo**2) / 2
+    return {'posicao_inicial': posicao_inicial}, {'posicao_inicial': 'm'}
+
+def _muv__velocidade_inicial(posicao_final: float, posicao_inicial: float, tempo: float, aceleracao: float) -> Resultado:
+    if tempo == 0:
+        raise ValueError("Tempo não pode ser zero para calcular a velocidade inicial.")
+    velocidade_inicial = (posicao_final - posicao_inicial - (aceleracao * tempo**2) / 2) / tempo
+    return {'velocidade_inicial': velocidade_inicial}, {'velocidade_inicial': 'm/s'}
+
+def _muv__tempo(posicao_final: float, posicao_inicial: float, velocidade_inicial: float, aceleracao: float) -> Resultado:
+    # Resolve equação quadrática
+    a = aceleracao/2
+    b = velocidade_inicial
+    c = posicao_inicial - posicao_final
+
+    if a == 0 and b == 0: # Caso degenerado
+        raise ValueError("Não é possível calcular o tempo com os valores fornecidos (aceleração e velocidade inicial são zero).")
+
+    if a == 0: # Equação linear
+        tempo = -c / b
+        if tempo < 0:
+            raise ValueError("Tempo negativo não é fisicamente possível.")
+        return {'tempo': tempo}, {'tempo': 's'}
+
+    delta = b**2 - 4*a*c
+    if delta < 0:
+        raise ValueError("Não há solução real para o tempo com os valores fornecidos.")
+
+    tempo1 = (-b + math.sqrt(delta))/(2*a)
+    tempo2 = (-b - math.sqrt(delta))/(2*a)
+
+    # Retorna o tempo positivo, se houver
+    if tempo1 >= 0 and tempo2 >= 0:
+        return {'tempo': min(tempo1, tempo2)}, {'tempo': 's'} # Retorna o menor tempo positivo
+    elif tempo1 >= 0:
+        return {'tempo': tempo1}, {'tempo': 's'}
+    elif tempo2 >= 0:
+        return {'tempo': tempo2}, {'tempo': 's'}
+    raise ValueError("Não há tempos positivos válidos com os valores fornecidos.")
+
+def _muv__aceleracao(posicao_final: float, posicao_inicial: float, velocidade_inicial: float, tempo: float) -> Resultado:
+    if tempo == 0:
+        raise ValueError("Tempo não pode ser zero para calcular a aceleração.")
+    aceleracao = 2*(posicao_final - posicao_inicial - velocidade_inicial * tempo)/tempo**2
+    return {'aceleracao': aceleracao}, {'aceleracao': 'm/s²'}
+
+@Ramos("Erro no MUV", {
+    'posicao_final': _muv__posicao_final,
+    'posicao_inicial': _muv__posicao_inicial,
+    'velocidade_inicial': _muv__velocidade_inicial,
+    'tempo': _muv__tempo,
+    'aceleracao': _muv__aceleracao,
+})
 def movimento_uniformemente_variado(
     posicao_final: Optional[float] = None,
     posicao_inicial: Optional[float] = None,
     velocidade_inicial: Optional[float] = None,
     tempo: Optional[float] = None,
     aceleracao: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'posicao_final': posicao_final, 'posicao_inicial': posicao_inicial, 
-                  'velocidade_inicial': velocidade_inicial, 'tempo': tempo, 'aceleracao': aceleracao}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente quatro valores devem ser fornecidos para calcular o quinto.")
-        
-        if posicao_final is None:
-            posicao_final = posicao_inicial + velocidade_inicial * tempo + (aceleracao * tempo**2) / 2
-            return {'posicao_final': posicao_final}, {'posicao_final': 'm'}
-        elif posicao_inicial is None:
-            posicao_inicial = posicao_final - velocidade_inicial * tempo - (aceleracao * tempo**2) / 2
-            return {'posicao_inicial': posicao_inicial}, {'posicao_inicial': 'm'}
-        elif velocidade_inicial is None:
-            if tempo == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a velocidade inicial.")
-            velocidade_inicial = (posicao_final - posicao_inicial - (aceleracao * tempo**2) / 2) / tempo
-            return {'velocidade_inicial': velocidade_inicial}, {'velocidade_inicial': 'm/s'}
-        elif tempo is None:
-            # Resolve equação quadrática
-            a = aceleracao/2
-            b = velocidade_inicial
-            c = posicao_inicial - posicao_final
-
-            if a == 0 and b == 0: # Caso degenerado
-                 raise ValueError("Não é possível calcular o tempo com os valores fornecidos (aceleração e velocidade inicial são zero).")
-
-            if a == 0: # Equação linear
-                if b == 0:
-                    raise ValueError("Não é possível calcular o tempo. Velocidade inicial não pode ser zero se aceleração é zero.")
-                tempo = -c / b
-                if tempo < 0:
-                    raise ValueError("Tempo negativo não é fisicamente possível.")
-                return {'tempo': tempo}, {'tempo': 's'}
-
-            delta = b**2 - 4*a*c
-            if delta < 0:
-                raise ValueError("Não há solução real para o tempo com os valores fornecidos.")
-            
-            tempo1 = (-b + math.sqrt(delta))/(2*a)
-            tempo2 = (-b - math.sqrt(delta))/(2*a)
-            
-            # Retorna o tempo positivo, se houver
-            if tempo1 >= 0 and tempo2 >= 0:
-                return {'tempo': min(tempo1, tempo2)}, {'tempo': 's'} # Retorna o menor tempo positivo
-            elif tempo1 >= 0:
-                return {'tempo': tempo1}, {'tempo': 's'}
-            elif tempo2 >= 0:
-                return {'tempo': tempo2}, {'tempo': 's'}
-            else:
-                raise ValueError("Não há tempos positivos válidos com os valores fornecidos.")
-        else:
-            if tempo == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a aceleração.")
-            aceleracao = 2*(posicao_final - posicao_inicial - velocidade_inicial * tempo)/tempo**2
-            return {'aceleracao': aceleracao}, {'aceleracao': 'm/s²'}
-
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no MUV: {str(e)}")
-
+) -> Resultado:
+    """MUV: s = s0 + v0·t + a·t²/2"""
+
+def _torricelli__velocidade_final(velocidade_inicial: float, aceleracao: float, deslocamento: float) -> Resultado:
+    if aceleracao == 0:
+        raise ValueError("Aceleração não pode ser zero para calcular a velocidade final.")
+    vf2 = velocidade_inicial**2 + 2 * aceleracao * deslocamento
+    if vf2 < 0:
+        raise ValueError("Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo).")
+    return {'velocidade_final': math.sqrt(vf2)}, {'velocidade_final': 'm/s'}
+
+def _torricelli__velocidade_inicial(velocidade_final: float, aceleracao: float, deslocamento: float) -> Resultado:
+    if aceleracao == 0:
+        raise ValueError("Aceleração não pode ser zero para calcular a velocidade inicial.")
+    vi2 = velocidade_final**2 - 2 * aceleracao * deslocamento
+    if vi2 < 0:
+        raise ValueError("Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo).")
+    return {'velocidade_inicial': math.sqrt(vi2)}, {'velocidade_inicial': 'm/s'}
+
+def _torricelli__aceleracao(velocidade_final: float, velocidade_inicial: float, deslocamento: float) -> Resultado:
+    if deslocamento == 0:
+        raise ValueError("Deslocamento não pode ser zero para calcular a aceleração.")
+    aceleracao = (velocidade_final**2 - velocidade_inicial**2) / (2 * deslocamento)
+    return {'aceleracao': aceleracao}, {'aceleracao': 'm/s²'}
+
+def _torricelli__deslocamento(velocidade_final: float, velocidade_inicial: float, aceleracao: float) -> Resultado:
+    if aceleracao == 0:
+        raise ValueError("Aceleração não pode ser zero para calcular o deslocamento.")
+    deslocamento = (velocidade_final**2 - velocidade_inicial**2) / (2 * aceleracao)
+    return {'deslocamento': deslocamento}, {'deslocamento': 'm'}
+
+@Ramos("Erro na Equação de Torricelli", {
+    'velocidade_final': _torricelli__velocidade_final,
+    'velocidade_inicial': _torricelli__velocidade_inicial,
+    'aceleracao': _torricelli__aceleracao,
+    'deslocamento': _torricelli__deslocamento,
+})
 def equacao_torricelli(
     velocidade_final: Optional[float] = None,
     velocidade_inicial: Optional[float] = None,
     aceleracao: Optional[float] = None,
     deslocamento: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'velocidade_final': velocidade_final, 'velocidade_inicial': velocidade_inicial,
-                  'aceleracao': aceleracao, 'deslocamento': deslocamento}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if velocidade_final is None:
-            if aceleracao == 0:
-                raise ValueError("Aceleração não pode ser zero para calcular a velocidade final.")
-            vf2 = velocidade_inicial**2 + 2 * aceleracao * deslocamento
-            if vf2 < 0:
-                raise ValueError("Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo).")
-            velocidade_final = math.sqrt(vf2)
-            return {'velocidade_final': velocidade_final}, {'velocidade_final': 'm/s'}
-        elif velocidade_inicial is None:
-            if aceleracao == 0:
-                raise ValueError("Aceleração não pode ser zero para calcular a velocidade inicial.")
-            vi2 = velocidade_final**2 - 2 * aceleracao * deslocamento
-            if vi2 < 0:
-                raise ValueError("Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo).")
-            velocidade_inicial = math.sqrt(vi2)
-            return {'velocidade_inicial': velocidade_inicial}, {'velocidade_inicial': 'm/s'}
-        elif aceleracao is None:
-            if deslocamento == 0:
-                raise ValueError("Deslocamento não pode ser zero para calcular a aceleração.")
-            aceleracao = (velocidade_final**2 - velocidade_inicial**2) / (2 * deslocamento)
-            return {'aceleracao': aceleracao}, {'aceleracao': 'm/s²'}
-        else: # deslocamento is None
-            if aceleracao == 0:
-                raise ValueError("Aceleração não pode ser zero para calcular o deslocamento.")
-            deslocamento = (velocidade_final**2 - velocidade_inicial**2) / (2 * aceleracao)
-            return {'deslocamento': deslocamento}, {'deslocamento': 'm'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Equação de Torricelli: {str(e)}")
-
+) -> Resultado:
+    """Equação de Torricelli: v² = v0² + 2·a·Δs"""
+
+def _pfd__forca(massa: float, aceleracao: float) -> Resultado:
+    return {'forca': massa * aceleracao}, {'forca': 'N'}
+
+def _pfd__massa(forca: float, aceleracao: float) -> Resultado:
+    if aceleracao == 0:
+        raise ValueError("Aceleração não pode ser zero para calcular a massa.")
+    return {'massa': forca / aceleracao}, {'massa': 'kg'}
+
+def _pfd__aceleracao(forca: float, massa: float) -> Resultado:
+    if massa == 0:
+        raise ValueError("Massa não pode ser zero para calcular a aceleração.")
+    return {'aceleracao': forca / massa}, {'aceleracao': 'm/s²'}
+
+@Ramos("Erro no Princípio Fundamental da Dinâmica", {
+    'forca': _pfd__forca,
+    'massa': _pfd__massa,
+    'aceleracao': _pfd__aceleracao,
+})
 def principio_fundamental_dinamica(
     forca: Optional[float] = None,
     massa: Optional[float] = None,
     aceleracao: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'forca': forca, 'massa': massa, 'aceleracao': aceleracao}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if forca is None:
-            forca = massa * aceleracao
-            return {'forca': forca}, {'forca': 'N'}
-        elif massa is None:
-            if aceleracao == 0:
-                raise ValueError("Aceleração não pode ser zero para calcular a massa.")
-            massa = forca / aceleracao
-            return {'massa': massa}, {'massa': 'kg'}
-        else: # aceleracao is None
-            if massa == 0:
-                raise ValueError("Massa não pode ser zero para calcular a aceleração.")
-            aceleracao = forca / massa
-            return {'aceleracao': aceleracao}, {'aceleracao': 'm/s²'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no Princípio Fundamental da Dinâmica: {str(e)}")
-
+) -> Resultado:
+    """Segunda lei de Newton: F = m·a"""
+
+def _forca_peso__forca_peso(massa: float, gravidade: float) -> Resultado:
+    return {'forca_peso': massa * gravidade}, {'forca_peso': 'N'}
+
+def _forca_peso__massa(forca_peso: float, gravidade: float) -> Resultado:
+    if gravidade == 0:
+        raise ValueError("Gravidade não pode ser zero para calcular a massa.")
+    return {'massa': forca_peso / gravidade}, {'massa': 'kg'}
+
+def _forca_peso__gravidade(forca_peso: float, massa: float) -> Resultado:
+    if massa == 0:
+        raise ValueError("Massa não pode ser zero para calcular a gravidade.")
+    return {'gravidade': forca_peso / massa}, {'gravidade': 'm/s²'}
+
+@Ramos("Erro na Força Peso", {
+    'forca_peso': _forca_peso__forca_peso,
+    'massa': _forca_peso__massa,
+    'gravidade': _forca_peso__gravidade,
+})
 def forca_peso(
     forca_peso: Optional[float] = None,
     massa: Optional[float] = None,
     gravidade: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'forca_peso': forca_peso, 'massa': massa, 'gravidade': gravidade}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if forca_peso is None:
-            forca_peso = massa * gravidade
-            return {'forca_peso': forca_peso}, {'forca_peso': 'N'}
-        elif massa is None:
-            if gravidade == 0:
-                raise ValueError("Gravidade não pode ser zero para calcular a massa.")
-            massa = forca_peso / gravidade
-            return {'massa': massa}, {'massa': 'kg'}
-        else: # gravidade is None
-            if massa == 0:
-                raise ValueError("Massa não pode ser zero para calcular a gravidade.")
-            gravidade = forca_peso / massa
-            return {'gravidade': gravidade}, {'gravidade': 'm/s²'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Força Peso: {str(e)}")
-
+) -> Resultado:
+    """Força peso: P = m·g"""
+
+def _forca_atrito__forca_atrito(coeficiente: float, normal: float) -> Resultado:
+    return {'forca_atrito': coeficiente * normal}, {'forca_atrito': 'N'}
+
+def _forca_atrito__coeficiente(forca_atrito: float, normal: float) -> Resultado:
+    if normal == 0:
+        raise ValueError("Força normal não pode ser zero para calcular o coeficiente.")
+    return {'coeficiente': forca_atrito / normal}, {'coeficiente': '(adimensional)'}
+
+def _forca_atrito__normal(forca_atrito: float, coeficiente: float) -> Resultado:
+    if coeficiente == 0:
+        raise ValueError("Coeficiente não pode ser zero para calcular a força normal.")
+    return {'normal': forca_atrito / coeficiente}, {'normal': 'N'}
+
+@Ramos("Erro na Força de Atrito", {
+    'forca_atrito': _forca_atrito__forca_atrito,
+    'coeficiente': _forca_atrito__coeficiente,
+    'normal': _forca_atrito__normal,
+})
 def forca_atrito(
     forca_atrito: Optional[float] = None,
     coeficiente: Optional[float] = None,
     normal: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'forca_atrito': forca_atrito, 'coeficiente': coeficiente, 'normal': normal}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if forca_atrito is None:
-            forca_atrito = coeficiente * normal
-            return {'forca_atrito': forca_atrito}, {'forca_atrito': 'N'}
-        elif coeficiente is None:
-            if normal == 0:
-                raise ValueError("Força normal não pode ser zero para calcular o coeficiente.")
-            coeficiente = forca_atrito / normal
-            return {'coeficiente': coeficiente}, {'coeficiente': '(adimensional)'}
-        else: # normal is None
-            if coeficiente == 0:
-                raise ValueError("Coeficiente não pode ser zero para calcular a força normal.")
-            normal = forca_atrito / coeficiente
-            return {'normal': normal}, {'normal': 'N'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Força de Atrito: {str(e)}")
-
+) -> Resultado:
+    """Força de atrito: Fat = μ·N"""
+
+def _trabalho__trabalho(forca: float, deslocamento: float, angulo: float) -> Resultado:
+    return {'trabalho': forca * deslocamento * math.cos(math.radians(angulo))}, {'trabalho': 'J'}
+
+def _trabalho__forca(trabalho: float, deslocamento: float, angulo: float) -> Resultado:
+    den = (deslocamento * math.cos(math.radians(angulo)))
+    if den == 0:
+        raise ValueError("Denominador não pode ser zero para calcular a força.")
+    return {'forca': trabalho / den}, {'forca': 'N'}
+
+def _trabalho__deslocamento(trabalho: float, forca: float, angulo: float) -> Resultado:
+    den = (forca * math.cos(math.radians(angulo)))
+    if den == 0:
+        raise ValueError("Denominador não pode ser zero para calcular o deslocamento.")
+    return {'deslocamento': trabalho / den}, {'deslocamento': 'm'}
+
+def _trabalho__angulo(trabalho: float, forca: float, deslocamento: float) -> Resultado:
+    den = (forca * deslocamento)
+    if den == 0:
+        raise ValueError("Denominador não pode ser zero para calcular o ângulo.")
+    cos_angulo = trabalho / den
+    if not -1 <= cos_angulo <= 1:
+        raise ValueError("Não é possível calcular o ângulo real com os valores fornecidos.")
+    return {'angulo': math.degrees(math.acos(cos_angulo))}, {'angulo': '°'}
+
+@Ramos("Erro no cálculo do Trabalho de Força Constante", {
+    'trabalho': _trabalho__trabalho,
+    'forca': _trabalho__forca,
+    'deslocamento': _trabalho__deslocamento,
+    'angulo': _trabalho__angulo,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def trabalho_forca_constante(
     trabalho: Optional[float] = None,
     forca: Optional[float] = None,
     deslocamento: Optional[float] = None,
     angulo: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'trabalho': trabalho, 'forca': forca, 'deslocamento': deslocamento, 'angulo': angulo}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if trabalho is None:
-            trabalho = forca * deslocamento * math.cos(math.radians(angulo))
-            return {'trabalho': trabalho}, {'trabalho': 'J'}
-        elif forca is None:
-            den = (deslocamento * math.cos(math.radians(angulo)))
-            if den == 0:
-                raise ValueError("Denominador não pode ser zero para calcular a força.")
-            forca = trabalho / den
-            return {'forca': forca}, {'forca': 'N'}
-        elif deslocamento is None:
-            den = (forca * math.cos(math.radians(angulo)))
-            if den == 0:
-                raise ValueError("Denominador não pode ser zero para calcular o deslocamento.")
-            deslocamento = trabalho / den
-            return {'deslocamento': deslocamento}, {'deslocamento': 'm'}
-        else: # angulo is None
-            den = (forca * deslocamento)
-            if den == 0:
-                raise ValueError("Denominador não pode ser zero para calcular o ângulo.")
-            cos_angulo = trabalho / den
-            if not -1 <= cos_angulo <= 1:
-                raise ValueError("Não é possível calcular o ângulo real com os valores fornecidos.")
-            angulo = math.degrees(math.acos(cos_angulo))
-            return {'angulo': angulo}, {'angulo': '°'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro no cálculo do Trabalho de Força Constante: {str(e)}")
-
+) -> Resultado:
+    """Trabalho de força constante: τ = F·d·cos(θ)"""
+
+def _energia_cinetica__energia_cinetica(massa: float, velocidade: float) -> Resultado:
+    return {'energia_cinetica': (massa * velocidade**2) / 2}, {'energia_cinetica': 'J'}
+
+def _energia_cinetica__massa(energia_cinetica: float, velocidade: float) -> Resultado:
+    den = (velocidade**2)
+    if den == 0:
+        raise ValueError("Velocidade não pode ser zero para calcular a massa.")
+    return {'massa': (2 * energia_cinetica) / den}, {'massa': 'kg'}
+
+def _energia_cinetica__velocidade(energia_cinetica: float, massa: float) -> Resultado:
+    arg = (2 * energia_cinetica) / massa
+    if arg < 0:
+        raise ValueError("Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo).")
+    return {'velocidade': math.sqrt(arg)}, {'velocidade': 'm/s'}
+
+@Ramos("Erro no cálculo da Energia Cinética", {
+    'energia_cinetica': _energia_cinetica__energia_cinetica,
+    'massa': _energia_cinetica__massa,
+    'velocidade': _energia_cinetica__velocidade,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def energia_cinetica(
     energia_cinetica: Optional[float] = None,
     massa: Optional[float] = None,
     velocidade: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'energia_cinetica': energia_cinetica, 'massa': massa, 'velocidade': velocidade}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if energia_cinetica is None:
-            energia_cinetica = (massa * velocidade**2) / 2
-            return {'energia_cinetica': energia_cinetica}, {'energia_cinetica': 'J'}
-        elif massa is None:
-            den = (velocidade**2)
-            if den == 0:
-                raise ValueError("Velocidade não pode ser zero para calcular a massa.")
-            massa = (2 * energia_cinetica) / den
-            return {'massa': massa}, {'massa': 'kg'}
-        else: # velocidade is None
-            arg = (2 * energia_cinetica) / massa
-            if arg < 0:
-                raise ValueError("Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo).")
-            velocidade = math.sqrt(arg)
-            return {'velocidade': velocidade}, {'velocidade': 'm/s'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro no cálculo da Energia Cinética: {str(e)}")
-
+) -> Resultado:
+    """Energia cinética: Ec = m·v² / 2"""
+
+def _energia_potencial__energia_potencial(massa: float, altura: float, gravidade: float) -> Resultado:
+    return {'energia_potencial': massa * gravidade * altura}, {'energia_potencial': 'J'}
+
+def _energia_potencial__massa(energia_potencial: float, altura: float, gravidade: float) -> Resultado:
+    den = (gravidade * altura)
+    if den == 0:
+        raise ValueError("Gravidade ou altura não podem ser zero para calcular a massa.")
+    return {'massa': energia_potencial / den}, {'massa': 'kg'}
+
+def _energia_potencial__altura(energia_potencial: float, massa: float, gravidade: float) -> Resultado:
+    den = (massa * gravidade)
+    if den == 0:
+        raise ValueError("Massa ou gravidade não podem ser zero para calcular a altura.")
+    return {'altura': energia_potencial / den}, {'altura': 'm'}
+
+def _energia_potencial__gravidade(energia_potencial: float, massa: float, altura: float) -> Resultado:
+    den = (massa * altura)
+    if den == 0:
+        raise ValueError("Massa ou altura não podem ser zero para calcular a gravidade.")
+    return {'gravidade': energia_potencial / den}, {'gravidade': 'm/s²'}
+
+@Ramos("Erro no cálculo da Energia Potencial Gravitacional", {
+    'energia_potencial': _energia_potencial__energia_potencial,
+    'massa': _energia_potencial__massa,
+    'altura': _energia_potencial__altura,
+    'gravidade': _energia_potencial__gravidade,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def energia_potencial(
     energia_potencial: Optional[float] = None,
     massa: Optional[float] = None,
     altura: Optional[float] = None,
     gravidade: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'energia_potencial': energia_potencial, 'massa': massa, 'altura': altura, 'gravidade': gravidade}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if energia_potencial is None:
-            energia_potencial = massa * gravidade * altura
-            return {'energia_potencial': energia_potencial}, {'energia_potencial': 'J'}
-        elif massa is None:
-            den = (gravidade * altura)
-            if den == 0:
-                raise ValueError("Gravidade ou altura não podem ser zero para calcular a massa.")
-            massa = energia_potencial / den
-            return {'massa': massa}, {'massa': 'kg'}
-        elif altura is None:
-            den = (massa * gravidade)
-            if den == 0:
-                raise ValueError("Massa ou gravidade não podem ser zero para calcular a altura.")
-            altura = energia_potencial / den
-            return {'altura': altura}, {'altura': 'm'}
-        else: # gravidade is None
-            den = (massa * altura)
-            if den == 0:
-                raise ValueError("Massa ou altura não podem ser zero para calcular a gravidade.")
-            gravidade = energia_potencial / den
-            return {'gravidade': gravidade}, {'gravidade': 'm/s²'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro no cálculo da Energia Potencial Gravitacional: {str(e)}")
-
+) -> Resultado:
+    """Energia potencial gravitacional: Ep = m·g·h"""
+
+def _pressao_hidrostatica__pressao_hidrostatica(densidade: float, altura: float, gravidade: float) -> Resultado:
+    return {'pressao_hidrostatica': densidade * gravidade * altura}, {'pressao_hidrostatica': 'Pa'}
+
+def _pressao_hidrostatica__densidade(pressao_hidrostatica: float, altura: float, gravidade: float) -> Resultado:
+    den = (gravidade * altura)
+    if den == 0:
+        raise ValueError("Gravidade ou altura não podem ser zero para calcular a densidade.")
+    return {'densidade': pressao_hidrostatica / den}, {'densidade': 'kg/m³'}
+
+def _pressao_hidrostatica__altura(pressao_hidrostatica: float, densidade: float, gravidade: float) -> Resultado:
+    den = (densidade * gravidade)
+    if den == 0:
+        raise ValueError("Densidade ou gravidade não podem ser zero para calcular a altura.")
+    return {'altura': pressao_hidrostatica / den}, {'altura': 'm'}
+
+def _pressao_hidrostatica__gravidade(pressao_hidrostatica: float, densidade: float, altura: float) -> Resultado:
+    den = (densidade * altura)
+    if den == 0:
+        raise ValueError("Densidade ou altura não podem ser zero para calcular a gravidade.")
+    return {'gravidade': pressao_hidrostatica / den}, {'gravidade': 'm/s²'}
+
+@Ramos("Erro no cálculo da Pressão Hidrostática", {
+    'pressao_hidrostatica': _pressao_hidrostatica__pressao_hidrostatica,
+    'densidade': _pressao_hidrostatica__densidade,
+    'altura': _pressao_hidrostatica__altura,
+    'gravidade': _pressao_hidrostatica__gravidade,
+})
 def pressao_hidrostatica(
     pressao_hidrostatica: Optional[float] = None,
     densidade: Optional[float] = None,
     altura: Optional[float] = None,
     gravidade: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'pressao_hidrostatica': pressao_hidrostatica, 'densidade': densidade, 'altura': altura, 'gravidade': gravidade}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if pressao_hidrostatica is None:
-            pressao_hidrostatica = densidade * gravidade * altura
-            return {'pressao_hidrostatica': pressao_hidrostatica}, {'pressao_hidrostatica': 'Pa'}
-        elif densidade is None:
-            densidade = (pressao_hidrostatica) / (gravidade * altura) 
-            if densidade == 0:
-                raise ValueError("Gravidade ou altura não podem ser zero para calcular a densidade.")
-            return {'densidade': densidade}, {'densidade': 'kg/m³'}
-        elif altura is None:
-            altura = (densidade) / (gravidade * pressao_hidrostatica)
-            if altura == 0:
-                raise ValueError("Densidade ou gravidade não podem ser zero para calcular a altura.")
-            return {'altura': altura}, {'altura': 'm'}
-        else: # gravidade is None
-            gravidade = (pressao_hidrostatica) / (densidade * altura)
-            if gravidade == 0:
-                raise ValueError("Densidade ou altura não podem ser zero para calcular a gravidade.")
-            return {'gravidade': gravidade}, {'gravidade': 'm/s²'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no cálculo da Pressão Hidrostática: {str(e)}")
+) -> Resultado:
+    """Pressão hidrostática: p = ρ·g·h"""
 
+def _primeira_lei__variacao_interna(calor: float, trabalho: float) -> Resultado:
+    return {'variacao_interna': calor - trabalho}, {'variacao_interna': 'J'}
+
+def _primeira_lei__calor(variacao_interna: float, trabalho: float) -> Resultado:
+    return {'calor': variacao_interna + trabalho}, {'calor': 'J'}
+
+def _primeira_lei__trabalho(variacao_interna: float, calor: float) -> Resultado:
+    return {'trabalho': calor - variacao_interna}, {'trabalho': 'J'}
+
+@Ramos("Erro na Primeira Lei da Termodinâmica", {
+    'variacao_interna': _primeira_lei__variacao_interna,
+    'calor': _primeira_lei__calor,
+    'trabalho': _primeira_lei__trabalho,
+}, capturar=(TypeError, ValueError))
 def primeira_lei_termodinamica(
     variacao_interna: Optional[float] = None,
     calor: Optional[float] = None,
     trabalho: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'variacao_interna': variacao_interna, 'calor': calor, 'trabalho': trabalho}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-
-        if variacao_interna is None:
-            variacao_interna = calor - trabalho
-            return {'variacao_interna': variacao_interna}, {'variacao_interna': 'J'}
-        elif calor is None:
-            calor = variacao_interna + trabalho
-            return {'calor': calor}, {'calor': 'J'}
-        else: # trabalho is None
-            trabalho = calor - variacao_interna
-            return {'trabalho': trabalho}, {'trabalho': 'J'}
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Erro na Primeira Lei da Termodinâmica: {str(e)}")
-
+) -> Resultado:
+    """Primeira lei da termodinâmica: ΔU = Q - τ"""
+
+def _lei_ohm__tensao(resistencia: float, corrente: float) -> Resultado:
+    return {'tensao': resistencia * corrente}, {'tensao': 'V'}
+
+def _lei_ohm__resistencia(tensao: float, corrente: float) -> Resultado:
+    if corrente == 0:
+        raise ValueError("Corrente não pode ser zero para calcular a resistência.")
+    return {'resistencia': tensao / corrente}, {'resistencia': 'Ω'}
+
+def _lei_ohm__corrente(tensao: float, resistencia: float) -> Resultado:
+    if resistencia == 0:
+        raise ValueError("Resistência não pode ser zero para calcular a corrente.")
+    return {'corrente': tensao / resistencia}, {'corrente': 'A'}
+
+@Ramos("Erro na Lei de Ohm", {
+    'tensao': _lei_ohm__tensao,
+    'resistencia': _lei_ohm__resistencia,
+    'corrente': _lei_ohm__corrente,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def lei_ohm(
     tensao: Optional[float] = None,
     resistencia: Optional[float] = None,
     corrente: Optional[float] = None
-) -> Dict[str, str]:
-    try:
-        valores = {'tensao': tensao, 'resistencia': resistencia, 'corrente': corrente}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-
-        if tensao is None:
-            tensao = resistencia * corrente
-            return {'tensao': tensao}, {'tensao': 'V'}
-        elif resistencia is None:
-            if corrente == 0:
-                raise ValueError("Corrente não pode ser zero para calcular a resistência.")
-            resistencia = tensao / corrente
-            return {'resistencia': resistencia}, {'resistencia': 'Ω'}
-        else: # corrente is None
-            if resistencia == 0:
-                raise ValueError("Resistência não pode ser zero para calcular a corrente.")
-            corrente = tensao / resistencia
-            return {'corrente': corrente}, {'corrente': 'A'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro na Lei de Ohm: {str(e)}")
-
+) -> Resultado:
+    """Lei de Ohm: U = R·i"""
+
+def _potencia__potencia_media(trabalho: float, tempo: float) -> Resultado:
+    if tempo == 0:
+        raise ValueError("Tempo não pode ser zero para calcular a potência.")
+    return {'potencia_media': trabalho / tempo}, {'potencia_media': 'W'}
+
+def _potencia__trabalho(potencia_media: float, tempo: float) -> Resultado:
+    return {'trabalho': potencia_media * tempo}, {'trabalho': 'J'}
+
+def _potencia__tempo(potencia_media: float, trabalho: float) -> Resultado:
+    if potencia_media == 0:
+        raise ValueError("Potência não pode ser zero para calcular o tempo.")
+    return {'tempo': trabalho / potencia_media}, {'tempo': 's'}
+
+@Ramos("Erro no cálculo da Potência", {
+    'potencia_media': _potencia__potencia_media,
+    'trabalho': _potencia__trabalho,
+    'tempo': _potencia__tempo,
+})
 def potencia(
     potencia_media: Optional[float] = None,
     trabalho: Optional[float] = None,
     tempo: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'potencia_media': potencia_media, 'trabalho': trabalho, 'tempo': tempo}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if potencia_media is None:
-            if tempo == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a potência.")
-            potencia_media = trabalho / tempo
-            return {'potencia_media': potencia_media}, {'potencia_media': 'W'}
-        elif trabalho is None:
-            trabalho = potencia_media * tempo
-            return {'trabalho': trabalho}, {'trabalho': 'J'}
-        else: # tempo is None
-            if potencia_media == 0:
-                raise ValueError("Potência não pode ser zero para calcular o tempo.")
-            tempo = trabalho / potencia_media
-            return {'tempo': tempo}, {'tempo': 's'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no cálculo da Potência: {str(e)}")
-
+) -> Resultado:
+    """Potência média: P = τ / Δt"""
+
+def _pressao__pressao(forca: float, area: float) -> Resultado:
+    if area == 0:
+        raise ValueError("Área não pode ser zero para calcular a pressão.")
+    return {'pressao': forca / area}, {'pressao': 'Pa'}
+
+def _pressao__forca(pressao: float, area: float) -> Resultado:
+    return {'forca': pressao * area}, {'forca': 'N'}
+
+def _pressao__area(pressao: float, forca: float) -> Resultado:
+    if pressao == 0:
+        raise ValueError("Pressão não pode ser zero para calcular a área.")
+    return {'area': forca / pressao}, {'area': 'm²'}
+
+@Ramos("Erro no cálculo da Pressão", {
+    'pressao': _pressao__pressao,
+    'forca': _pressao__forca,
+    'area': _pressao__area,
+})
 def pressao(
     pressao: Optional[float] = None,
     forca: Optional[float] = None,
     area: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'pressao': pressao, 'forca': forca, 'area': area}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if pressao is None:
-            if area == 0:
-                raise ValueError("Área não pode ser zero para calcular a pressão.")
-            pressao = forca / area
-            return {'pressao': pressao}, {'pressao': 'Pa'}
-        elif forca is None:
-            forca = pressao * area
-            return {'forca': forca}, {'forca': 'N'}
-        else: # area is None
-            if pressao == 0:
-                raise ValueError("Pressão não pode ser zero para calcular a área.")
-            area = forca / pressao
-            return {'area': area}, {'area': 'm²'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no cálculo da Pressão: {str(e)}")
-
+) -> Resultado:
+    """Pressão: p = F / A"""
+
+def _espelhos__distancia_focal(distancia_objeto: float, distancia_imagem: float) -> Resultado:
+    if distancia_objeto == 0 or distancia_imagem == 0:
+        raise ValueError("Distância do objeto ou da imagem não podem ser zero para calcular a distância focal.")
+    distancia_focal = 1 / ((1 / distancia_objeto) + (1 / distancia_imagem))
+    return {'distancia_focal': distancia_focal}, {'distancia_focal': 'm'}
+
+def _espelhos__distancia_objeto(distancia_focal: float, distancia_imagem: float) -> Resultado:
+    if distancia_focal == 0 or distancia_imagem == 0 or (distancia_imagem - distancia_focal) == 0:
+        raise ValueError("Distância focal ou da imagem não podem ser zero para calcular a distância do objeto, ou a diferença entre elas.")
+    distancia_objeto = 1 / ((1 / distancia_focal) - (1 / distancia_imagem))
+    return {'distancia_objeto': distancia_objeto}, {'distancia_objeto': 'm'}
+
+def _espelhos__distancia_imagem(distancia_focal: float, distancia_objeto: float) -> Resultado:
+    if distancia_focal == 0 or distancia_objeto == 0 or (distancia_objeto - distancia_focal) == 0:
+        raise ValueError("Distância focal ou do objeto não podem ser zero para calcular a distância da imagem, ou a diferença entre elas.")
+    distancia_imagem = 1 / ((1 / distancia_focal) - (1 / distancia_objeto))
+    return {'distancia_imagem': distancia_imagem}, {'distancia_imagem': 'm'}
+
+@Ramos("Erro no cálculo da Equação dos Espelhos e Lentes", {
+    'distancia_focal': _espelhos__distancia_focal,
+    'distancia_objeto': _espelhos__distancia_objeto,
+    'distancia_imagem': _espelhos__distancia_imagem,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def equacao_dos_espelhos_e_lentes(
     distancia_focal: Optional[float] = None,
     distancia_objeto: Optional[float] = None,
     distancia_imagem: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'distancia_focal': distancia_focal, 'distancia_objeto': distancia_objeto, 'distancia_imagem': distancia_imagem}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-
-        if distancia_focal is None:
-            if distancia_objeto == 0 or distancia_imagem == 0: 
-                raise ValueError("Distância do objeto ou da imagem não podem ser zero para calcular a distância focal.")
-            distancia_focal = 1 / ((1 / distancia_objeto) + (1 / distancia_imagem))
-            return {'distancia_focal': distancia_focal}, {'distancia': 'm'}
-        elif distancia_objeto is None:
-            if distancia_focal == 0 or distancia_imagem == 0 or (distancia_imagem - distancia_focal) == 0:
-                raise ValueError("Distância focal ou da imagem não podem ser zero para calcular a distância do objeto, ou a diferença entre elas.")
-            distancia_objeto = 1 / ((1 / distancia_focal) - (1 / distancia_imagem))
-            return {'distancia_objeto': distancia_objeto}, {'distancia_objeto': 'm'}
-        else: # distancia_imagem is None
-            if distancia_focal == 0 or distancia_objeto == 0 or (distancia_objeto - distancia_focal) == 0:
-                raise ValueError("Distância focal ou do objeto não podem ser zero para calcular a distância da imagem, ou a diferença entre elas.")
-            distancia_imagem = 1 / ((1 / distancia_focal) - (1 / distancia_objeto))
-            return {'distancia_imagem': distancia_imagem}, {'distancia_imagem': 'm'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro no cálculo da Equação dos Espelhos e Lentes: {str(e)}")
+) -> Resultado:
+    """Equação de Gauss: 1/f = 1/p + 1/p'"""
 
+def _aumento__aumento_da_imagem(distancia_objeto: float, distancia_imagem: float) -> Resultado:
+    return {'aumento_da_imagem': - (distancia_imagem / distancia_objeto)}, {'aumento_da_imagem': 'm'}
+
+def _aumento__distancia_objeto(aumento_da_imagem: float, distancia_imagem: float) -> Resultado:
+    return {'distancia_objeto': - (distancia_imagem / aumento_da_imagem)}, {'distancia_objeto': 'm'}
+
+def _aumento__distancia_imagem(aumento_da_imagem: float, distancia_objeto: float) -> Resultado:
+    return {'distancia_imagem': - (aumento_da_imagem * distancia_objeto)}, {'distancia_imagem': 'm'}
+
+@Ramos("Erro no cálculo do Aumento da Imagem", {
+    'aumento_da_imagem': _aumento__aumento_da_imagem,
+    'distancia_objeto': _aumento__distancia_objeto,
+    'distancia_imagem': _aumento__distancia_imagem,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def aumento_da_imagem(
     aumento_da_imagem: Optional[float] = None,
     distancia_objeto: Optional[float] = None,
     distancia_imagem: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'aumento_da_imagem': aumento_da_imagem, 'distancia_objeto': distancia_objeto, 'distancia_imagem': distancia_imagem}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-
-        if aumento_da_imagem is None:
-            if aumento_da_imagem == 0:
-                raise ValueError("Distância do objeto não pode ser zero para calcular a altura da imagem.")
-            aumento_da_imagem = - (distancia_imagem / distancia_objeto)
-            return {'aumento_da_imagem': aumento_da_imagem}, {'aumento_da_imagem': 'm'}
-        elif distancia_objeto is None:
-            if distancia_objeto == 0:
-                raise ValueError("Distância do objeto não pode ser zero para calcular a altura do objeto.")
-            distancia_objeto = - (distancia_imagem / aumento_da_imagem)
-            return {'distancia_objeto':distancia_objeto}, {'distancia_objeto': 'm'}
-        else:
-            if distancia_imagem == 0:
-                raise ValueError("Altura do objeto não pode ser zero para calcular a distância do objeto.")
-            distancia_imagem = - (aumento_da_imagem * distancia_objeto)
-            return {'distancia_imagem':distancia_imagem}, {'distancia_imagem': 'm'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro no cálculo do Aumento da Imagem: {str(e)}")
-
+) -> Resultado:
+    """Aumento linear: A = -p' / p"""
+
+def _velocidade_onda__velocidade(frequencia: float, comprimento_onda: float) -> Resultado:
+    return {'velocidade': frequencia * comprimento_onda}, {'velocidade': 'm/s'}
+
+def _velocidade_onda__frequencia(velocidade: float, comprimento_onda: float) -> Resultado:
+    if comprimento_onda == 0:
+        raise ValueError("Comprimento de onda não pode ser zero para calcular a frequência.")
+    return {'frequencia': velocidade / comprimento_onda}, {'frequencia': 'Hz'}
+
+def _velocidade_onda__comprimento_onda(velocidade: float, frequencia: float) -> Resultado:
+    if frequencia == 0:
+        raise ValueError("Frequência não pode ser zero para calcular o comprimento de onda.")
+    return {'comprimento_onda': velocidade / frequencia}, {'comprimento_onda': 'm'}
+
+@Ramos("Erro no cálculo da Velocidade da Onda", {
+    'velocidade': _velocidade_onda__velocidade,
+    'frequencia': _velocidade_onda__frequencia,
+    'comprimento_onda': _velocidade_onda__comprimento_onda,
+}, capturar=(TypeError, ZeroDivisionError, ValueError))
 def velocidade_onda(
     velocidade: Optional[float] = None,
     frequencia: Optional[float] = None,
     comprimento_onda: Optional[float] = None
-) -> Dict[str, str]:
-    try:
-        valores = {'velocidade': velocidade, 'frequencia': frequencia, 'comprimento_onda': comprimento_onda}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-
-        if velocidade is None:
-            velocidade = frequencia * comprimento_onda
-            return {'velocidade': velocidade}, {'velocidade': 'm/s'}
-        elif frequencia is None:
-            if comprimento_onda == 0:
-                raise ValueError("Comprimento de onda não pode ser zero para calcular a frequência.")
-            frequencia = velocidade / comprimento_onda
-            return {'frequencia': frequencia}, {'frequencia': 'Hz'}
-        else: # comprimento_onda is None
-            if frequencia == 0:
-                raise ValueError("Frequência não pode ser zero para calcular o comprimento de onda.")
-            comprimento_onda = velocidade / frequencia
-            return {'comprimento_onda': comprimento_onda}, {'comprimento_onda': 'm'}
-    except (TypeError, ZeroDivisionError, ValueError) as e:
-        raise ValueError(f"Erro no cálculo da Velocidade da Onda: {str(e)}")
-
+) -> Resultado:
+    """Equação fundamental da ondulatória: v = λ·f"""
+
+def _empuxo__empuxo(densidade: float, volume: float, gravidade: float) -> Resultado:
+    return {'empuxo': densidade * volume * gravidade}, {'empuxo': 'N'}
+
+def _empuxo__densidade(empuxo: float, volume: float, gravidade: float) -> Resultado:
+    den = (volume * gravidade)
+    if den == 0:
+        raise ValueError("Volume ou gravidade não podem ser zero para calcular a densidade.")
+    return {'densidade': empuxo / den}, {'densidade': 'kg/m³'}
+
+def _empuxo__volume(empuxo: float, densidade: float, gravidade: float) -> Resultado:
+    den = (densidade * gravidade)
+    if den == 0:
+        raise ValueError("Densidade ou gravidade não podem ser zero para calcular o volume.")
+    return {'volume': empuxo / den}, {'volume': 'm³'}
+
+def _empuxo__gravidade(empuxo: float, densidade: float, volume: float) -> Resultado:
+    den = (densidade * volume)
+    if den == 0:
+        raise ValueError("Densidade ou volume não podem ser zero para calcular a gravidade.")
+    return {'gravidade': empuxo / den}, {'gravidade': 'm/s²'}
+
+@Ramos("Erro no cálculo do Empuxo", {
+    'empuxo': _empuxo__empuxo,
+    'densidade': _empuxo__densidade,
+    'volume': _empuxo__volume,
+    'gravidade': _empuxo__gravidade,
+})
 def empuxo(
     empuxo: Optional[float] = None,
     densidade: Optional[float] = None,
     volume: Optional[float] = None,
     gravidade: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'empuxo': empuxo, 'densidade': densidade, 'volume': volume, 'gravidade': gravidade}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if empuxo is None:
-            empuxo = densidade * volume * gravidade
-            return {'empuxo': empuxo}, {'empuxo': 'N'}
-        elif densidade is None:
-            den = (volume * gravidade)
-            if den == 0:
-                raise ValueError("Volume ou gravidade não podem ser zero para calcular a densidade.")
-            densidade = empuxo / den
-            return {'densidade': densidade}, {'densidade': 'kg/m³'}
-        elif volume is None:
-            den = (densidade * gravidade)
-            if den == 0:
-                raise ValueError("Densidade ou gravidade não podem ser zero para calcular o volume.")
-            volume = empuxo / den
-            return {'volume': volume}, {'volume': 'm³'}
-        else: # gravidade is None
-            den = (densidade * volume)
-            if den == 0:
-                raise ValueError("Densidade ou volume não podem ser zero para calcular a gravidade.")
-            gravidade = empuxo / den
-            return {'gravidade': gravidade}, {'gravidade': 'm/s²'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no cálculo do Empuxo: {str(e)}")
-
+) -> Resultado:
+    """Empuxo: E = ρ·V·g"""
+
+# O coeficiente de dilatação é informado em 10⁻⁵ °C⁻¹
+def _dilatacao__coeficiente_dilatacao(comprimento_inicial: float, dilatacao_linear: float,
+                                      variacao_de_temperatura: float) -> Resultado:
+    den = (variacao_de_temperatura * comprimento_inicial)
+    if den == 0:
+        raise ValueError("Comprimento inicial ou variação de temperatura não podem ser zero para calcular o coeficiente.")
+    return {'coeficiente_dilatacao': dilatacao_linear / den / 1e-5}, {'coeficiente_dilatacao': '10⁻⁵ °C⁻¹'}
+
+def _dilatacao__comprimento_inicial(coeficiente_dilatacao: float, dilatacao_linear: float,
+                                    variacao_de_temperatura: float) -> Resultado:
+    comprimento_inicial = (dilatacao_linear) / ((coeficiente_dilatacao * 1e-5) * variacao_de_temperatura)
+    return {'comprimento_inicial': comprimento_inicial}, {'comprimento_inicial': 'm'}
+
+def _dilatacao__dilatacao_linear(coeficiente_dilatacao: float, comprimento_inicial: float,
+                                 variacao_de_temperatura: float) -> Resultado:
+    dilatacao_linear = (comprimento_inicial * (coeficiente_dilatacao * 1e-5) * variacao_de_temperatura)
+    return {'dilatacao_linear': dilatacao_linear}, {'dilatacao_linear': 'm'}
+
+def _dilatacao__variacao_de_temperatura(coeficiente_dilatacao: float, comprimento_inicial: float,
+                                        dilatacao_linear: float) -> Resultado:
+    variacao_de_temperatura = (dilatacao_linear) / ((coeficiente_dilatacao * 1e-5) * comprimento_inicial)
+    return {'variacao_de_temperatura': variacao_de_temperatura}, {'variacao_de_temperatura': '°C'}
+
+@Ramos("Erro no cálculo da Dilatação Linear", {
+    'coeficiente_dilatacao': _dilatacao__coeficiente_dilatacao,
+    'comprimento_inicial': _dilatacao__comprimento_inicial,
+    'dilatacao_linear': _dilatacao__dilatacao_linear,
+    'variacao_de_temperatura': _dilatacao__variacao_de_temperatura,
+})
 def dilatacao_linear(
     coeficiente_dilatacao: Optional[float] = None,
     comprimento_inicial: Optional[float] = None,
     dilatacao_linear: Optional[float] = None,
     variacao_de_temperatura: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    coeficiente_dilatacao = coeficiente_dilatacao * 1e-5
-    try:
-        valores = {'coeficiente_dilataco': coeficiente_dilatacao, 'comprimento_inicial': comprimento_inicial, 'variacao_de_temperatura': variacao_de_temperatura, 'dilatacao_linear': dilatacao_linear}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if coeficiente_dilatacao is None:
-            coeficiente_dilatacao = (dilatacao_linear) / (variacao_de_temperatura * comprimento_inicial)
-            return {'coeficiente_dilatacao': coeficiente_dilatacao}, {'coeficiente_dilatacao': 'm'}
-        elif comprimento_inicial is None:
-            if comprimento_inicial == 0:
-                raise ValueError("Denominador não pode ser zero para calcular o comprimento inicial.")
-            comprimento_inicial = (dilatacao_linear) / (coeficiente_dilatacao * variacao_de_temperatura)
-            return {'comprimento_inicial': comprimento_inicial}, {'comprimento_inicial': 'm'}
-        elif dilatacao_linear is None:
-            if dilatacao_linear == 0:
-                raise ValueError("Comprimento inicial ou variação de temperatura não podem ser zero para calcular o coeficiente.")
-            dilatacao_linear = (comprimento_inicial * coeficiente_dilatacao * variacao_de_temperatura)
-            print(dilatacao_linear)
-            return {f'dilatacao_linear': dilatacao_linear}, {'dilatacao_linear': '°C⁻¹'}
-        else: # variacao_de_temperatura is None
-            if variacao_de_temperatura == 0:
-                raise ValueError("Comprimento inicial ou coeficiente não podem ser zero para calcular a variação de temperatura.")
-            variacao_de_temperatura = (dilatacao_linear) / (coeficiente_dilatacao * comprimento_inicial)
-            return {'variacao_de_temperatura': variacao_de_temperatura}, {'variacao_de_temperatura': '°C'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no cálculo da Dilatação Linear: {str(e)}")
-
+) -> Resultado:
+    """Dilatação linear: ΔL = L0·α·ΔT"""
+
+def _calorimetria__calor(massa: float, calor_especifico: float, variacao_temperatura: float) -> Resultado:
+    return {'calor': massa * calor_especifico * variacao_temperatura}, {'calor': 'J'}
+
+def _calorimetria__massa(calor: float, calor_especifico: float, variacao_temperatura: float) -> Resultado:
+    den = (calor_especifico * variacao_temperatura)
+    if den == 0:
+        raise ValueError("Calor específico ou variação de temperatura não podem ser zero para calcular a massa.")
+    return {'massa': calor / den}, {'massa': 'kg'}
+
+def _calorimetria__calor_especifico(calor: float, massa: float, variacao_temperatura: float) -> Resultado:
+    den = (massa * variacao_temperatura)
+    if den == 0:
+        raise ValueError("Massa ou variação de temperatura não podem ser zero para calcular o calor específico.")
+    return {'calor_especifico': calor / den}, {'calor_especifico': 'J/(kg·°C)'}
+
+def _calorimetria__variacao_temperatura(calor: float, massa: float, calor_especifico: float) -> Resultado:
+    den = (massa * calor_especifico)
+    if den == 0:
+        raise ValueError("Massa ou calor específico não podem ser zero para calcular a variação de temperatura.")
+    return {'variacao_temperatura': calor / den}, {'variacao_temperatura': '°C'}
+
+@Ramos("Erro no cálculo da Equação Fundamental da Calorimetria", {
+    'calor': _calorimetria__calor,
+    'massa': _calorimetria__massa,
+    'calor_especifico': _calorimetria__calor_especifico,
+    'variacao_temperatura': _calorimetria__variacao_temperatura,
+})
 def equacao_fundamental_calorimetria(
     calor: Optional[float] = None,
     massa: Optional[float] = None,
     calor_especifico: Optional[float] = None,
     variacao_temperatura: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'calor': calor, 'massa': massa, 'calor_especifico': calor_especifico,
-                  'variacao_temperatura': variacao_temperatura}
-        if sum(1 for v in valores.values() if v is None) != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        if calor is None:
-            calor = massa * calor_especifico * variacao_temperatura
-            return {'calor': calor}, {'calor': 'J'}
-        elif massa is None:
-            den = (calor_especifico * variacao_temperatura)
-            if den == 0:
-                raise ValueError("Calor específico ou variação de temperatura não podem ser zero para calcular a massa.")
-            massa = calor / den
-            return {'massa': massa}, {'massa': 'kg'}
-        elif calor_especifico is None:
-            den = (massa * variacao_temperatura)
-            if den == 0:
-                raise ValueError("Massa ou variação de temperatura não podem ser zero para calcular o calor específico.")
-            calor_especifico = calor / den
-            return {'calor_especifico': calor_especifico}, {'calor_especifico': 'J/(kg·°C)'}
-        else: # variacao_temperatura is None
-            den = (massa * calor_especifico)
-            if den == 0:
-                raise ValueError("Massa ou calor específico não podem ser zero para calcular a variação de temperatura.")
-            variacao_temperatura = calor / den
-            return {'variacao_temperatura': variacao_temperatura}, {'variacao_temperatura': '°C'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no cálculo da Equação Fundamental da Calorimetria: {str(e)}")
-
+) -> Resultado:
+    """Equação fundamental da calorimetria: Q = m·c·ΔT"""
+
+def _potencia_eletrica__potencia(tensao: float, corrente: float) -> Resultado:
+    return {'potencia': tensao * corrente}, {'potencia': 'W'}
+
+def _potencia_eletrica__tensao(potencia: float, corrente: float) -> Resultado:
+    if corrente == 0:
+        raise ValueError("Corrente não pode ser zero para calcular a tensão.")
+    return {'tensao': potencia / corrente}, {'tensao': 'V'}
+
+def _potencia_eletrica__corrente(potencia: float, tensao: float) -> Resultado:
+    if tensao == 0:
+        raise ValueError("Tensão não pode ser zero para calcular a corrente.")
+    return {'corrente': potencia / tensao}, {'corrente': 'A'}
+
+@Ramos("Erro na Potência Elétrica", {
+    'potencia': _potencia_eletrica__potencia,
+    'tensao': _potencia_eletrica__tensao,
+    'corrente': _potencia_eletrica__corrente,
+})
 def potencia_eletrica(
     potencia: Optional[float] = None,
     tensao: Optional[float] = None,
     corrente: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'potencia': potencia, 'tensao': tensao, 'corrente': corrente}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if potencia is None:
-            potencia = tensao * corrente
-            return {'potencia': potencia}, {'potencia': 'W'}
-        elif tensao is None:
-            if corrente == 0:
-                raise ValueError("Corrente não pode ser zero para calcular a tensão.")
-            tensao = potencia / corrente
-            return {'tensao': tensao}, {'tensao': 'V'}
-        else: # corrente is None
-            if tensao == 0:
-                raise ValueError("Tensão não pode ser zero para calcular a corrente.")
-            corrente = potencia / tensao
-            return {'corrente': corrente}, {'corrente': 'A'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Potência Elétrica: {str(e)}")
-
+) -> Resultado:
+    """Potência elétrica: P = U·i"""
+
+# Constante de Coulomb; as cargas são informadas em µC
+_K_COULOMB = 9 * 10**9
+
+def _coulomb__forca_coloumb(carga_1: float, carga_2: float, distancia: float) -> Resultado:
+    if distancia == 0:
+        raise ValueError("Distância não pode ser zero para calcular a força.")
+    forca_coloumb = _K_COULOMB * abs((carga_1 * 1e-6) * (carga_2 * 1e-6)) / (distancia ** 2)
+    return {'forca': forca_coloumb}, {'forca': 'N'}
+
+def _coulomb__carga_1(forca_coloumb: float, carga_2: float, distancia: float) -> Resultado:
+    if carga_2 == 0 or distancia == 0:
+        raise ValueError("Carga2 e distância não podem ser zero para calcular carga1.")
+    carga_1 = (forca_coloumb * distancia ** 2) / (_K_COULOMB * abs(carga_2 * 1e-6))
+    return {'carga1': carga_1}, {'carga1': 'C'}
+
+def _coulomb__carga_2(forca_coloumb: float, carga_1: float, distancia: float) -> Resultado:
+    if carga_1 == 0 or distancia == 0:
+        raise ValueError("Carga1 e distância não podem ser zero para calcular carga2.")
+    carga_2 = (forca_coloumb * distancia ** 2) / (_K_COULOMB * abs(carga_1 * 1e-6))
+    return {'carga2': carga_2}, {'carga2': 'C'}
+
+def _coulomb__distancia(forca_coloumb: float, carga_1: float, carga_2: float) -> Resultado:
+    if carga_1 == 0 or carga_2 == 0:
+        raise ValueError("Cargas não podem ser zero para calcular a distância.")
+    distancia = math.sqrt(_K_COULOMB * abs((carga_1 * 1e-6) * (carga_2 * 1e-6)) / forca_coloumb)
+    return {'distancia': distancia}, {'distancia': 'm'}
+
+@Ramos("Erro na Força entre Cargas Elétricas", {
+    'forca_coloumb': _coulomb__forca_coloumb,
+    'carga_1': _coulomb__carga_1,
+    'carga_2': _coulomb__carga_2,
+    'distancia': _coulomb__distancia,
+})
 def forca_entre_cargas_eletricas(
     forca_coloumb: Optional[float] = None,
     carga_1: Optional[float] = None,
     carga_2: Optional[float] = None,
     distancia: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'forca_coloumb': forca_coloumb, 'carga_1': carga_1, 'carga_2': carga_2, 'distancia': distancia}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        k = 9
-        k = k * 10**9 # Constante de Coulomb
-        carga_1 = carga_1 * 1e-6
-        carga_2 = carga_2 * 1e-6
-        if forca_coloumb is None:
-            if distancia == 0:
-                raise ValueError("Distância não pode ser zero para calcular a força.")
-            forca_coloumb = k * abs(carga_1 * carga_2) / (distancia ** 2)
-            return {'forca': forca_coloumb}, {'forca': 'N'}
-        elif carga_1 is None:
-            if carga_2 == 0 or distancia == 0:
-                raise ValueError("Carga2 e distância não podem ser zero para calcular carga1.")
-            carga_1 = (forca_coloumb * distancia ** 2) / (k * abs(carga_2))
-            return {'carga1': carga_1}, {'carga1': 'C'}
-        elif carga_2 is None:
-            if carga_1 == 0 or distancia == 0:
-                raise ValueError("Carga1 e distância não podem ser zero para calcular carga2.")
-            carga_2 = (forca_coloumb * distancia ** 2) / (k * abs(carga_1))
-            return {'carga2': carga_2}, {'carga2': 'C'}
-        else: # distancia is None
-            if carga_1 == 0 or carga_2 == 0:
-                raise ValueError("Cargas não podem ser zero para calcular a distância.")
-            distancia = math.sqrt(k * abs(carga_1 * carga_2) / forca_coloumb)
-            return {'distancia': distancia}, {'distancia': 'm'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Força entre Cargas Elétricas: {str(e)}")
-
+) -> Resultado:
+    """Lei de Coulomb: F = k·|q1·q2| / d²"""
+
+def _elastica__energia_potencial_elastica(constante_elastica: float, deformacao: float) -> Resultado:
+    return {'energia': (constante_elastica * deformacao ** 2) / 2}, {'energia': 'J'}
+
+def _elastica__constante_elastica(energia_potencial_elastica: float, deformacao: float) -> Resultado:
+    if deformacao == 0:
+        raise ValueError("Deformação não pode ser zero para calcular a constante elástica.")
+    constante_elastica = (2 * energia_potencial_elastica) / (deformacao ** 2)
+    return {'constante_elastica': constante_elastica}, {'constante_elastica': 'N/m'}
+
+def _elastica__deformacao(energia_potencial_elastica: float, constante_elastica: float) -> Resultado:
+    if constante_elastica == 0:
+        raise ValueError("Constante elástica não pode ser zero para calcular a deformação.")
+    deformacao = math.sqrt((2 * energia_potencial_elastica) / constante_elastica)
+    return {'deformacao': deformacao}, {'deformacao': 'm'}
+
+@Ramos("Erro na Energia Potencial Elástica", {
+    'energia_potencial_elastica': _elastica__energia_potencial_elastica,
+    'constante_elastica': _elastica__constante_elastica,
+    'deformacao': _elastica__deformacao,
+})
 def energia_potencial_elastica(
     energia_potencial_elastica: Optional[float] = None,
     constante_elastica: Optional[float] = None,
     deformacao: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'energia_potencial_elastica': energia_potencial_elastica, 'constante_elastica': constante_elastica, 'deformacao': deformacao}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if energia_potencial_elastica is None:
-            energia_potencial_elastica = (constante_elastica * deformacao ** 2) / 2
-            return {'energia': energia_potencial_elastica}, {'energia': 'J'}
-        elif constante_elastica is None:
-            if deformacao == 0:
-                raise ValueError("Deformação não pode ser zero para calcular a constante elástica.")
-            constante_elastica = (2 * energia_potencial_elastica) / (deformacao ** 2)
-            return {'constante_elastica': constante_elastica}, {'constante_elastica': 'N/m'}
-        else: # deformacao is None
-            if constante_elastica == 0:
-                raise ValueError("Constante elástica não pode ser zero para calcular a deformação.")
-            deformacao = math.sqrt((2 * energia_potencial_elastica) / constante_elastica)
-            return {'deformacao': deformacao}, {'deformacao': 'm'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Energia Potencial Elástica: {str(e)}")
+) -> Resultado:
+    """Energia potencial elástica: Epel = k·x² / 2"""
 
+def _energia_mecanica__energia_mecanica(energia_cinetica: float, energia_potencial: float) -> Resultado:
+    return {'energia_mecanica': energia_cinetica + energia_potencial}, {'energia_mecanica': 'J'}
+
+def _energia_mecanica__energia_cinetica(energia_mecanica: float, energia_potencial: float) -> Resultado:
+    return {'energia_cinetica': energia_mecanica - energia_potencial}, {'energia_cinetica': 'J'}
+
+def _energia_mecanica__energia_potencial(energia_mecanica: float, energia_cinetica: float) -> Resultado:
+    return {'energia_potencial': energia_mecanica - energia_cinetica}, {'energia_potencial': 'J'}
+
+@Ramos("Erro na Energia Mecânica", {
+    'energia_mecanica': _energia_mecanica__energia_mecanica,
+    'energia_cinetica': _energia_mecanica__energia_cinetica,
+    'energia_potencial': _energia_mecanica__energia_potencial,
+})
 def energia_mecanica(
     energia_mecanica: Optional[float] = None,
     energia_cinetica: Optional[float] = None,
     energia_potencial: Optional[float] = None
-) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'energia_mecanica': energia_mecanica, 'energia_cinetica': energia_cinetica, 'energia_potencial': energia_potencial}
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        if energia_mecanica is None:
-            energia_mecanica = energia_cinetica + energia_potencial
-            return {'energia_mecanica': energia_mecanica}, {'energia_mecanica': 'J'}
-        elif energia_cinetica is None:
-            energia_cinetica = energia_mecanica - energia_potencial
-            return {'energia_cinetica': energia_cinetica}, {'energia_cinetica': 'J'}
-        else: # energia_potencial is None
-            energia_potencial = energia_mecanica - energia_cinetica
-            return {'energia_potencial': energia_potencial}, {'energia_potencial': 'J'}
-            
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Energia Mecânica: {str(e)}")
\ No newline at end of file
+) -> Resultado:
+    """Energia mecânica: Em = Ec + Ep"""
+
+# Registro compilado uma única vez na importação; todas as fórmulas de física
+# calculam exatamente uma incógnita a partir das demais
+REGISTRO = RegistroCalculos({
+    'velocidade_media': velocidade_media,
+    'movimento_uniforme': movimento_uniforme,
+    'movimento_uniformemente_variado': movimento_uniformemente_variado,
+    'equacao_torricelli': equacao_torricelli,
+    'principio_fundamental_dinamica': principio_fundamental_dinamica,
+    'forca_peso': forca_peso,
+    'forca_atrito': forca_atrito,
+    'trabalho_forca_constante': trabalho_forca_constante,
+    'energia_cinetica': energia_cinetica,
+    'energia_potencial': energia_potencial,
+    'energia_potencial_elastica': energia_potencial_elastica,
+    'potencia': potencia,
+    'pressao': pressao,
+    'pressao_hidrostatica': pressao_hidrostatica,
+    'empuxo': empuxo,
+    'dilatacao_linear': dilatacao_linear,
+    'equacao_fundamental_calorimetria': equacao_fundamental_calorimetria,
+    'primeira_lei_termodinamica': primeira_lei_termodinamica,
+    'equacao_dos_espelhos_e_lentes': equacao_dos_espelhos_e_lentes,
+    'aumento_da_imagem': aumento_da_imagem,
+    'velocidade_onda': velocidade_onda,
+    'lei_ohm': lei_ohm,
+    'potencia_eletrica': potencia_eletrica,
+    'forca_entre_cargas_eletricas': forca_entre_cargas_eletricas,
+    'energia_mecanica': energia_mecanica
+}, incognita_unica=True)
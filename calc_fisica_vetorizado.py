@@ -0,0 +1,427 @@
+"""
+Avaliação vetorizada (NumPy) das fórmulas de física.
+
+Cada calculadora de ``calc_fisica`` tem aqui uma tabela com a fórmula de cada
+incógnita, escrita sobre arrays. As validações que no modo escalar geram
+``ValueError`` (tempo zero, discriminante negativo, etc.) são avaliadas
+elemento a elemento e devolvidas como máscaras booleanas.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+
+Valores = Dict[str, np.ndarray]
+
+
+class Formula(NamedTuple):
+    """Fórmula vetorizada para uma incógnita de uma calculadora."""
+    chave: str
+    unidade: str
+    calcular: Callable[[Valores], np.ndarray]
+    # Pares (mensagem, máscara); a máscara recebe os valores e o resultado bruto
+    validacoes: Sequence[Tuple[str, Callable[[Valores, np.ndarray], np.ndarray]]] = ()
+
+
+def _zero(*nomes: str) -> Callable[[Valores, np.ndarray], np.ndarray]:
+    """Máscara dos elementos em que alguma das variáveis é zero."""
+    def mascara(v: Valores, r: np.ndarray) -> np.ndarray:
+        resultado = np.zeros(r.shape, dtype=bool)
+        for nome in nomes:
+            resultado |= v[nome] == 0
+        return resultado
+    return mascara
+
+
+def _produto_zero(*nomes: str) -> Callable[[Valores, np.ndarray], np.ndarray]:
+    """Máscara dos elementos em que o produto das variáveis é zero."""
+    def mascara(v: Valores, r: np.ndarray) -> np.ndarray:
+        produto = np.ones(r.shape)
+        for nome in nomes:
+            produto = produto * v[nome]
+        return produto == 0
+    return mascara
+
+
+def _negativo(expressao: Callable[[Valores], np.ndarray]) -> Callable[[Valores, np.ndarray], np.ndarray]:
+    """Máscara dos elementos em que a expressão é negativa."""
+    return lambda v, r: expressao(v) < 0
+
+
+def _tempo_muv(v: Valores) -> np.ndarray:
+    """Menor tempo não negativo que satisfaz a equação horária do MUV."""
+    a = v['aceleracao'] / 2
+    b = v['velocidade_inicial']
+    c = v['posicao_inicial'] - v['posicao_final']
+
+    linear = a == 0
+    tempo_linear = -c / b
+
+    raiz_delta = np.sqrt(b**2 - 4*a*c)
+    tempo1 = (-b + raiz_delta) / (2*a)
+    tempo2 = (-b - raiz_delta) / (2*a)
+    tempo1 = np.where(tempo1 >= 0, tempo1, np.nan)
+    tempo2 = np.where(tempo2 >= 0, tempo2, np.nan)
+    tempo_quadratico = np.fmin(tempo1, tempo2)
+
+    tempo = np.where(linear, tempo_linear, tempo_quadratico)
+    return np.where(tempo >= 0, tempo, np.nan)
+
+
+def _cos_graus(angulo: np.ndarray) -> np.ndarray:
+    return np.cos(np.radians(angulo))
+
+
+_K_COULOMB = 9e9  # Constante de Coulomb
+
+# Mensagens reaproveitadas por várias fórmulas
+_RAIZ_NEGATIVA = "Não é possível ter velocidade real com os valores fornecidos (raiz de número negativo)."
+
+FORMULAS: Dict[str, Dict[str, Formula]] = {
+    'velocidade_media': {
+        'velocidade_media': Formula('velocidade_media', 'm/s', lambda v: v['deslocamento'] / v['tempo'],
+                                    [("Tempo não pode ser zero para calcular a velocidade média.", _zero('tempo'))]),
+        'deslocamento': Formula('deslocamento', 'm', lambda v: v['velocidade_media'] * v['tempo']),
+        'tempo': Formula('tempo', 's', lambda v: v['deslocamento'] / v['velocidade_media'],
+                         [("Velocidade média não pode ser zero para calcular o tempo.", _zero('velocidade_media'))]),
+    },
+    'movimento_uniforme': {
+        'posicao_final': Formula('posicao_final', 'm',
+                                 lambda v: v['posicao_inicial'] + v['velocidade'] * v['tempo']),
+        'posicao_inicial': Formula('posicao_inicial', 'm',
+                                   lambda v: v['posicao_final'] - v['velocidade'] * v['tempo']),
+        'tempo': Formula('tempo', 's', lambda v: (v['posicao_final'] - v['posicao_inicial']) / v['velocidade'],
+                         [("Velocidade não pode ser zero para calcular o tempo.", _zero('velocidade')),
+                          ("Tempo negativo não é fisicamente possível.", lambda v, r: r < 0)]),
+        'velocidade': Formula('velocidade', 'm/s', lambda v: (v['posicao_final'] - v['posicao_inicial']) / v['tempo'],
+                              [("Tempo não pode ser zero para calcular a velocidade.", _zero('tempo'))]),
+    },
+    'movimento_uniformemente_variado': {
+        'posicao_final': Formula('posicao_final', 'm',
+                                 lambda v: v['posicao_inicial'] + v['velocidade_inicial'] * v['tempo']
+                                 + (v['aceleracao'] * v['tempo']**2) / 2),
+        'posicao_inicial': Formula('posicao_inicial', 'm',
+                                   lambda v: v['posicao_final'] - v['velocidade_inicial'] * v['tempo']
+                                   - (v['aceleracao'] * v['tempo']**2) / 2),
+        'velocidade_inicial': Formula('velocidade_inicial', 'm/s',
+                                      lambda v: (v['posicao_final'] - v['posicao_inicial']
+                                                 - (v['aceleracao'] * v['tempo']**2) / 2) / v['tempo'],
+                                      [("Tempo não pode ser zero para calcular a velocidade inicial.", _zero('tempo'))]),
+        'tempo': Formula('tempo', 's', _tempo_muv, [
+            ("Não é possível calcular o tempo com os valores fornecidos (aceleração e velocidade inicial são zero).",
+             lambda v, r: (v['aceleracao'] == 0) & (v['velocidade_inicial'] == 0)),
+            ("Não há solução real para o tempo com os valores fornecidos.",
+             lambda v, r: (v['aceleracao'] != 0) & (v['velocidade_inicial']**2 - 2 * v['aceleracao']
+                                                    * (v['posicao_inicial'] - v['posicao_final']) < 0)),
+            ("Não há tempos positivos válidos com os valores fornecidos.", lambda v, r: np.isnan(r)),
+        ]),
+        'aceleracao': Formula('aceleracao', 'm/s²',
+                              lambda v: 2 * (v['posicao_final'] - v['posicao_inicial']
+                                             - v['velocidade_inicial'] * v['tempo']) / v['tempo']**2,
+                              [("Tempo não pode ser zero para calcular a aceleração.", _zero('tempo'))]),
+    },
+    'equacao_torricelli': {
+        'velocidade_final': Formula('velocidade_final', 'm/s',
+                                    lambda v: np.sqrt(v['velocidade_inicial']**2 + 2 * v['aceleracao'] * v['deslocamento']),
+                                    [("Aceleração não pode ser zero para calcular a velocidade final.", _zero('aceleracao')),
+                                     (_RAIZ_NEGATIVA, _negativo(lambda v: v['velocidade_inicial']**2
+                                                                + 2 * v['aceleracao'] * v['deslocamento']))]),
+        'velocidade_inicial': Formula('velocidade_inicial', 'm/s',
+                                      lambda v: np.sqrt(v['velocidade_final']**2 - 2 * v['aceleracao'] * v['deslocamento']),
+                                      [("Aceleração não pode ser zero para calcular a velocidade inicial.", _zero('aceleracao')),
+                                       (_RAIZ_NEGATIVA, _negativo(lambda v: v['velocidade_final']**2
+                                                                  - 2 * v['aceleracao'] * v['deslocamento']))]),
+        'aceleracao': Formula('aceleracao', 'm/s²',
+                              lambda v: (v['velocidade_final']**2 - v['velocidade_inicial']**2) / (2 * v['deslocamento']),
+                              [("Deslocamento não pode ser zero para calcular a aceleração.", _zero('deslocamento'))]),
+        'deslocamento': Formula('deslocamento', 'm',
+                                lambda v: (v['velocidade_final']**2 - v['velocidade_inicial']**2) / (2 * v['aceleracao']),
+                                [("Aceleração não pode ser zero para calcular o deslocamento.", _zero('aceleracao'))]),
+    },
+    'principio_fundamental_dinamica': {
+        'forca': Formula('forca', 'N', lambda v: v['massa'] * v['aceleracao']),
+        'massa': Formula('massa', 'kg', lambda v: v['forca'] / v['aceleracao'],
+                         [("Aceleração não pode ser zero para calcular a massa.", _zero('aceleracao'))]),
+        'aceleracao': Formula('aceleracao', 'm/s²', lambda v: v['forca'] / v['massa'],
+                              [("Massa não pode ser zero para calcular a aceleração.", _zero('massa'))]),
+    },
+    'forca_peso': {
+        'forca_peso': Formula('forca_peso', 'N', lambda v: v['massa'] * v['gravidade']),
+        'massa': Formula('massa', 'kg', lambda v: v['forca_peso'] / v['gravidade'],
+                         [("Gravidade não pode ser zero para calcular a massa.", _zero('gravidade'))]),
+        'gravidade': Formula('gravidade', 'm/s²', lambda v: v['forca_peso'] / v['massa'],
+                             [("Massa não pode ser zero para calcular a gravidade.", _zero('massa'))]),
+    },
+    'forca_atrito': {
+        'forca_atrito': Formula('forca_atrito', 'N', lambda v: v['coeficiente'] * v['normal']),
+        'coeficiente': Formula('coeficiente', '(adimensional)', lambda v: v['forca_atrito'] / v['normal'],
+                               [("Força normal não pode ser zero para calcular o coeficiente.", _zero('normal'))]),
+        'normal': Formula('normal', 'N', lambda v: v['forca_atrito'] / v['coeficiente'],
+                          [("Coeficiente não pode ser zero para calcular a força normal.", _zero('coeficiente'))]),
+    },
+    'trabalho_forca_constante': {
+        'trabalho': Formula('trabalho', 'J', lambda v: v['forca'] * v['deslocamento'] * _cos_graus(v['angulo'])),
+        'forca': Formula('forca', 'N', lambda v: v['trabalho'] / (v['deslocamento'] * _cos_graus(v['angulo'])),
+                         [("Denominador não pode ser zero para calcular a força.",
+                           lambda v, r: v['deslocamento'] * _cos_graus(v['angulo']) == 0)]),
+        'deslocamento': Formula('deslocamento', 'm', lambda v: v['trabalho'] / (v['forca'] * _cos_graus(v['angulo'])),
+                                [("Denominador não pode ser zero para calcular o deslocamento.",
+                                  lambda v, r: v['forca'] * _cos_graus(v['angulo']) == 0)]),
+        'angulo': Formula('angulo', '°', lambda v: np.degrees(np.arccos(v['trabalho'] / (v['forca'] * v['deslocamento']))),
+                          [("Denominador não pode ser zero para calcular o ângulo.", _produto_zero('forca', 'deslocamento')),
+                           ("Não é possível calcular o ângulo real com os valores fornecidos.",
+                            lambda v, r: np.abs(v['trabalho'] / (v['forca'] * v['deslocamento'])) > 1)]),
+    },
+    'energia_cinetica': {
+        'energia_cinetica': Formula('energia_cinetica', 'J', lambda v: (v['massa'] * v['velocidade']**2) / 2),
+        'massa': Formula('massa', 'kg', lambda v: (2 * v['energia_cinetica']) / v['velocidade']**2,
+                         [("Velocidade não pode ser zero para calcular a massa.", _zero('velocidade'))]),
+        'velocidade': Formula('velocidade', 'm/s', lambda v: np.sqrt((2 * v['energia_cinetica']) / v['massa']),
+                              [("Massa não pode ser zero para calcular a velocidade.", _zero('massa')),
+                               (_RAIZ_NEGATIVA, _negativo(lambda v: (2 * v['energia_cinetica']) / v['massa']))]),
+    },
+    'energia_potencial': {
+        'energia_potencial': Formula('energia_potencial', 'J', lambda v: v['massa'] * v['gravidade'] * v['altura']),
+        'massa': Formula('massa', 'kg', lambda v: v['energia_potencial'] / (v['gravidade'] * v['altura']),
+                         [("Gravidade ou altura não podem ser zero para calcular a massa.", _produto_zero('gravidade', 'altura'))]),
+        'altura': Formula('altura', 'm', lambda v: v['energia_potencial'] / (v['massa'] * v['gravidade']),
+                          [("Massa ou gravidade não podem ser zero para calcular a altura.", _produto_zero('massa', 'gravidade'))]),
+        'gravidade': Formula('gravidade', 'm/s²', lambda v: v['energia_potencial'] / (v['massa'] * v['altura']),
+                             [("Massa ou altura não podem ser zero para calcular a gravidade.", _produto_zero('massa', 'altura'))]),
+    },
+    'energia_potencial_elastica': {
+        'energia_potencial_elastica': Formula('energia', 'J', lambda v: (v['constante_elastica'] * v['deformacao']**2) / 2),
+        'constante_elastica': Formula('constante_elastica', 'N/m',
+                                      lambda v: (2 * v['energia_potencial_elastica']) / v['deformacao']**2,
+                                      [("Deformação não pode ser zero para calcular a constante elástica.", _zero('deformacao'))]),
+        'deformacao': Formula('deformacao', 'm',
+                              lambda v: np.sqrt((2 * v['energia_potencial_elastica']) / v['constante_elastica']),
+                              [("Constante elástica não pode ser zero para calcular a deformação.", _zero('constante_elastica')),
+                               ("Não é possível ter deformação real com os valores fornecidos (raiz de número negativo).",
+                                _negativo(lambda v: (2 * v['energia_potencial_elastica']) / v['constante_elastica']))]),
+    },
+    'potencia': {
+        'potencia_media': Formula('potencia_media', 'W', lambda v: v['trabalho'] / v['tempo'],
+                                  [("Tempo não pode ser zero para calcular a potência.", _zero('tempo'))]),
+        'trabalho': Formula('trabalho', 'J', lambda v: v['potencia_media'] * v['tempo']),
+        'tempo': Formula('tempo', 's', lambda v: v['trabalho'] / v['potencia_media'],
+                         [("Potência não pode ser zero para calcular o tempo.", _zero('potencia_media'))]),
+    },
+    'pressao': {
+        'pressao': Formula('pressao', 'Pa', lambda v: v['forca'] / v['area'],
+                           [("Área não pode ser zero para calcular a pressão.", _zero('area'))]),
+        'forca': Formula('forca', 'N', lambda v: v['pressao'] * v['area']),
+        'area': Formula('area', 'm²', lambda v: v['forca'] / v['pressao'],
+                        [("Pressão não pode ser zero para calcular a área.", _zero('pressao'))]),
+    },
+    'pressao_hidrostatica': {
+        'pressao_hidrostatica': Formula('pressao_hidrostatica', 'Pa',
+                                        lambda v: v['densidade'] * v['gravidade'] * v['altura']),
+        'densidade': Formula('densidade', 'kg/m³', lambda v: v['pressao_hidrostatica'] / (v['gravidade'] * v['altura']),
+                             [("Gravidade ou altura não podem ser zero para calcular a densidade.",
+                               _produto_zero('gravidade', 'altura'))]),
+        'altura': Formula('altura', 'm', lambda v: v['pressao_hidrostatica'] / (v['densidade'] * v['gravidade']),
+                          [("Densidade ou gravidade não podem ser zero para calcular a altura.",
+                            _produto_zero('densidade', 'gravidade'))]),
+        'gravidade': Formula('gravidade', 'm/s²', lambda v: v['pressao_hidrostatica'] / (v['densidade'] * v['altura']),
+                             [("Densidade ou altura não podem ser zero para calcular a gravidade.",
+                               _produto_zero('densidade', 'altura'))]),
+    },
+    'empuxo': {
+        'empuxo': Formula('empuxo', 'N', lambda v: v['densidade'] * v['volume'] * v['gravidade']),
+        'densidade': Formula('densidade', 'kg/m³', lambda v: v['empuxo'] / (v['volume'] * v['gravidade']),
+                             [("Volume ou gravidade não podem ser zero para calcular a densidade.",
+                               _produto_zero('volume', 'gravidade'))]),
+        'volume': Formula('volume', 'm³', lambda v: v['empuxo'] / (v['densidade'] * v['gravidade']),
+                          [("Densidade ou gravidade não podem ser zero para calcular o volume.",
+                            _produto_zero('densidade', 'gravidade'))]),
+        'gravidade': Formula('gravidade', 'm/s²', lambda v: v['empuxo'] / (v['densidade'] * v['volume']),
+                             [("Densidade ou volume não podem ser zero para calcular a gravidade.",
+                               _produto_zero('densidade', 'volume'))]),
+    },
+    'dilatacao_linear': {
+        # O coeficiente é informado em 10⁻⁵ °C⁻¹ e convertido em ESCALAS
+        'coeficiente_dilatacao': Formula('coeficiente_dilatacao', '10⁻⁵ °C⁻¹',
+                                         lambda v: v['dilatacao_linear']
+                                         / (v['variacao_de_temperatura'] * v['comprimento_inicial']) / 1e-5,
+                                         [("Comprimento inicial ou variação de temperatura não podem ser zero para calcular o coeficiente.",
+                                           _produto_zero('variacao_de_temperatura', 'comprimento_inicial'))]),
+        'comprimento_inicial': Formula('comprimento_inicial', 'm',
+                                       lambda v: v['dilatacao_linear']
+                                       / (v['coeficiente_dilatacao'] * v['variacao_de_temperatura']),
+                                       [("Denominador não pode ser zero para calcular o comprimento inicial.",
+                                         _produto_zero('coeficiente_dilatacao', 'variacao_de_temperatura'))]),
+        'dilatacao_linear': Formula('dilatacao_linear', 'm',
+                                    lambda v: v['comprimento_inicial'] * v['coeficiente_dilatacao']
+                                    * v['variacao_de_temperatura']),
+        'variacao_de_temperatura': Formula('variacao_de_temperatura', '°C',
+                                           lambda v: v['dilatacao_linear']
+                                           / (v['coeficiente_dilatacao'] * v['comprimento_inicial']),
+                                           [("Comprimento inicial ou coeficiente não podem ser zero para calcular a variação de temperatura.",
+                                             _produto_zero('coeficiente_dilatacao', 'comprimento_inicial'))]),
+    },
+    'equacao_fundamental_calorimetria': {
+        'calor': Formula('calor', 'J', lambda v: v['massa'] * v['calor_especifico'] * v['variacao_temperatura']),
+        'massa': Formula('massa', 'kg', lambda v: v['calor'] / (v['calor_especifico'] * v['variacao_temperatura']),
+                         [("Calor específico ou variação de temperatura não podem ser zero para calcular a massa.",
+                           _produto_zero('calor_especifico', 'variacao_temperatura'))]),
+        'calor_especifico': Formula('calor_especifico', 'J/(kg·°C)',
+                                    lambda v: v['calor'] / (v['massa'] * v['variacao_temperatura']),
+                                    [("Massa ou variação de temperatura não podem ser zero para calcular o calor específico.",
+                                      _produto_zero('massa', 'variacao_temperatura'))]),
+        'variacao_temperatura': Formula('variacao_temperatura', '°C',
+                                        lambda v: v['calor'] / (v['massa'] * v['calor_especifico']),
+                                        [("Massa ou calor específico não podem ser zero para calcular a variação de temperatura.",
+                                          _produto_zero('massa', 'calor_especifico'))]),
+    },
+    'primeira_lei_termodinamica': {
+        'variacao_interna': Formula('variacao_interna', 'J', lambda v: v['calor'] - v['trabalho']),
+        'calor': Formula('calor', 'J', lambda v: v['variacao_interna'] + v['trabalho']),
+        'trabalho': Formula('trabalho', 'J', lambda v: v['calor'] - v['variacao_interna']),
+    },
+    'equacao_dos_espelhos_e_lentes': {
+        'distancia_focal': Formula('distancia_focal', 'm',
+                                   lambda v: 1 / ((1 / v['distancia_objeto']) + (1 / v['distancia_imagem'])),
+                                   [("Distância do objeto ou da imagem não podem ser zero para calcular a distância focal.",
+                                     _zero('distancia_objeto', 'distancia_imagem'))]),
+        'distancia_objeto': Formula('distancia_objeto', 'm',
+                                    lambda v: 1 / ((1 / v['distancia_focal']) - (1 / v['distancia_imagem'])),
+                                    [("Distância focal ou da imagem não podem ser zero para calcular a distância do objeto, ou a diferença entre elas.",
+                                      lambda v, r: (v['distancia_focal'] == 0) | (v['distancia_imagem'] == 0)
+                                      | (v['distancia_imagem'] == v['distancia_focal']))]),
+        'distancia_imagem': Formula('distancia_imagem', 'm',
+                                    lambda v: 1 / ((1 / v['distancia_focal']) - (1 / v['distancia_objeto'])),
+                                    [("Distância focal ou do objeto não podem ser zero para calcular a distância da imagem, ou a diferença entre elas.",
+                                      lambda v, r: (v['distancia_focal'] == 0) | (v['distancia_objeto'] == 0)
+                                      | (v['distancia_objeto'] == v['distancia_focal']))]),
+    },
+    'aumento_da_imagem': {
+        'aumento_da_imagem': Formula('aumento_da_imagem', 'm', lambda v: -(v['distancia_imagem'] / v['distancia_objeto']),
+                                     [("Distância do objeto não pode ser zero para calcular o aumento da imagem.",
+                                       _zero('distancia_objeto'))]),
+        'distancia_objeto': Formula('distancia_objeto', 'm', lambda v: -(v['distancia_imagem'] / v['aumento_da_imagem']),
+                                    [("Aumento da imagem não pode ser zero para calcular a distância do objeto.",
+                                      _zero('aumento_da_imagem'))]),
+        'distancia_imagem': Formula('distancia_imagem', 'm', lambda v: -(v['aumento_da_imagem'] * v['distancia_objeto'])),
+    },
+    'velocidade_onda': {
+        'velocidade': Formula('velocidade', 'm/s', lambda v: v['frequencia'] * v['comprimento_onda']),
+        'frequencia': Formula('frequencia', 'Hz', lambda v: v['velocidade'] / v['comprimento_onda'],
+                              [("Comprimento de onda não pode ser zero para calcular a frequência.", _zero('comprimento_onda'))]),
+        'comprimento_onda': Formula('comprimento_onda', 'm', lambda v: v['velocidade'] / v['frequencia'],
+                                    [("Frequência não pode ser zero para calcular o comprimento de onda.", _zero('frequencia'))]),
+    },
+    'lei_ohm': {
+        'tensao': Formula('tensao', 'V', lambda v: v['resistencia'] * v['corrente']),
+        'resistencia': Formula('resistencia', 'Ω', lambda v: v['tensao'] / v['corrente'],
+                               [("Corrente não pode ser zero para calcular a resistência.", _zero('corrente'))]),
+        'corrente': Formula('corrente', 'A', lambda v: v['tensao'] / v['resistencia'],
+                            [("Resistência não pode ser zero para calcular a corrente.", _zero('resistencia'))]),
+    },
+    'potencia_eletrica': {
+        'potencia': Formula('potencia', 'W', lambda v: v['tensao'] * v['corrente']),
+        'tensao': Formula('tensao', 'V', lambda v: v['potencia'] / v['corrente'],
+                          [("Corrente não pode ser zero para calcular a tensão.", _zero('corrente'))]),
+        'corrente': Formula('corrente', 'A', lambda v: v['potencia'] / v['tensao'],
+                            [("Tensão não pode ser zero para calcular a corrente.", _zero('tensao'))]),
+    },
+    'forca_entre_cargas_eletricas': {
+        # As cargas são informadas em µC e convertidas em ESCALAS
+        'forca_coloumb': Formula('forca', 'N',
+                                 lambda v: _K_COULOMB * np.abs(v['carga_1'] * v['carga_2']) / v['distancia']**2,
+                                 [("Distância não pode ser zero para calcular a força.", _zero('distancia'))]),
+        'carga_1': Formula('carga1', 'C',
+                           lambda v: (v['forca_coloumb'] * v['distancia']**2) / (_K_COULOMB * np.abs(v['carga_2'])),
+                           [("Carga2 e distância não podem ser zero para calcular carga1.", _zero('carga_2', 'distancia'))]),
+        'carga_2': Formula('carga2', 'C',
+                           lambda v: (v['forca_coloumb'] * v['distancia']**2) / (_K_COULOMB * np.abs(v['carga_1'])),
+                           [("Carga1 e distância não podem ser zero para calcular carga2.", _zero('carga_1', 'distancia'))]),
+        'distancia': Formula('distancia', 'm',
+                             lambda v: np.sqrt(_K_COULOMB * np.abs(v['carga_1'] * v['carga_2']) / v['forca_coloumb']),
+                             [("Cargas não podem ser zero para calcular a distância.", _zero('carga_1', 'carga_2')),
+                              ("Força não pode ser zero ou negativa para calcular a distância.",
+                               lambda v, r: v['forca_coloumb'] <= 0)]),
+    },
+    'energia_mecanica': {
+        'energia_mecanica': Formula('energia_mecanica', 'J', lambda v: v['energia_cinetica'] + v['energia_potencial']),
+        'energia_cinetica': Formula('energia_cinetica', 'J', lambda v: v['energia_mecanica'] - v['energia_potencial']),
+        'energia_potencial': Formula('energia_potencial', 'J', lambda v: v['energia_mecanica'] - v['energia_cinetica']),
+    },
+}
+
+# Fatores aplicados às entradas antes do cálculo (mesmas conversões do modo escalar)
+ESCALAS: Dict[str, Dict[str, float]] = {
+    'dilatacao_linear': {'coeficiente_dilatacao': 1e-5},
+    'forca_entre_cargas_eletricas': {'carga_1': 1e-6, 'carga_2': 1e-6},
+}
+
+MENSAGEM_INDEFINIDO = "Resultado indefinido para os valores fornecidos."
+
+
+def calcular_vetorizado(
+    tipo_calculo: str, max_pontos: Optional[int] = None, **kwargs
+) -> Tuple[Dict[str, np.ndarray], Dict[str, str], Dict[str, np.ndarray]]:
+    """
+    Resolve a incógnita de uma calculadora de física sobre arrays inteiros.
+
+    Args:
+        tipo_calculo (str): Tipo de cálculo a ser realizado
+        max_pontos (Optional[int]): Número máximo de elementos do resultado
+        **kwargs: Valores conhecidos (escalares, listas ou arrays); a incógnita
+            é o único parâmetro ausente ou ``None``
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], Dict[str, str], Dict[str, np.ndarray]]:
+            Resultado (NaN nos elementos inválidos), unidades e, para cada
+            problema de validação encontrado, a máscara dos elementos afetados
+    """
+    if tipo_calculo not in FORMULAS:
+        raise ValueError(f"Tipo de cálculo '{tipo_calculo}' não encontrado.")
+    formulas = FORMULAS[tipo_calculo]
+
+    desconhecidos = set(kwargs) - set(formulas)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros desconhecidos para {tipo_calculo}: {', '.join(sorted(desconhecidos))}")
+
+    valores = {}
+    for chave, valor in kwargs.items():
+        if valor is None or (isinstance(valor, str) and valor == ''):
+            continue
+        try:
+            valores[chave] = np.asarray(valor, dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError(f"Valor inválido para {chave}: {valor}")
+
+    incognitas = [nome for nome in formulas if nome not in valores]
+    if len(incognitas) != 1:
+        raise ValueError(f"Exatamente {len(formulas) - 1} valores devem ser fornecidos para calcular o restante.")
+    formula = formulas[incognitas[0]]
+
+    try:
+        arrays = np.broadcast_arrays(*valores.values())
+    except ValueError:
+        raise ValueError("Os valores fornecidos têm tamanhos incompatíveis.")
+    if max_pontos is not None and arrays[0].size > max_pontos:
+        raise ValueError(f"O cálculo gera {arrays[0].size} pontos; o limite é {max_pontos}.")
+    escalas = ESCALAS.get(tipo_calculo, {})
+    valores = {chave: array * escalas.get(chave, 1.0) for chave, array in zip(valores, arrays)}
+    forma = arrays[0].shape
+
+    with np.errstate(all='ignore'):
+        resultado = np.broadcast_to(np.asarray(formula.calcular(valores), dtype=float), forma).copy()
+
+        invalidos = {}
+        ja_invalido = np.zeros(forma, dtype=bool)
+        for mensagem, mascara in formula.validacoes:
+            afetados = np.broadcast_to(mascara(valores, resultado), forma) & ~ja_invalido
+            if afetados.any():
+                invalidos[mensagem] = invalidos.get(mensagem, np.zeros(forma, dtype=bool)) | afetados
+                ja_invalido |= afetados
+
+    # Qualquer outro resultado não finito (estouro, 0/0...) também é sinalizado
+    indefinidos = ~np.isfinite(resultado) & ~ja_invalido
+    if indefinidos.any():
+        invalidos[MENSAGEM_INDEFINIDO] = indefinidos
+        ja_invalido |= indefinidos
+
+    resultado[ja_invalido] = np.nan
+    return {formula.chave: resultado}, {formula.chave: formula.unidade}, invalidos
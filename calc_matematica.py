@@ -3,8 +3,12 @@ Módulo de cálculos matemáticos.
 """
 
 import math
-import numpy as np
-from typing import List, Dict, Union, Tuple, Optional
+from typing import Any, List, Dict, Union, Tuple, Optional
+from registro_calculos import Ramos, RegistroCalculos, Resultado
+import combinatoria
+
+# Matriz como lista de linhas, texto ou buffer compacto (ver matrizes.py, importado no primeiro uso)
+EntradaMatriz = Union[str, List[Any], Dict[str, Any]]
 
 def calculate_matematica(tipo_calculo: str, **kwargs) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
@@ -17,64 +21,7 @@ def calculate_matematica(tipo_calculo: str, **kwargs) -> Tuple[Dict[str, float],
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: Resultado do cálculo e suas unidades
     """
-    # Mapeamento de tipos de cálculo para suas respectivas funções
-    calculos = {
-        'produtos_notaveis': produtos_notaveis,
-        'formula_do_delta': formula_do_delta,
-        'funcao_do_1_grau': funcao_do_1_grau,
-        'funcao_do_2_grau': funcao_do_2_grau,
-        'vertice_de_parabola': vertice_de_parabola,
-        'funcao_exponencial': funcao_exponencial,
-        'funcao_logaritmica': funcao_logaritmica,
-        'pa_termo_geral': pa_termo_geral,
-        'pa_soma_dos_termos': pa_soma_dos_termos,
-        'pg_termo_geral': pg_termo_geral,  
-        'pg_soma_dos_termos_finitos': pg_soma_dos_termos_finitos,
-        'pg_soma_infinita': pg_soma_infinita,
-        'relacoes_fundamentais': relacoes_fundamentais,
-        'lei_dos_senos': lei_dos_senos,
-        'lei_dos_cossenos': lei_dos_cossenos,
-        'area_do_triangulo': area_do_triangulo,
-        'area_do_circulo': area_do_circulo,
-        'volume_do_cubo': volume_do_cubo,
-        'volume_da_esfera': volume_da_esfera,
-        'volume_do_cilindro': volume_do_cilindro, 
-        'fatorial': fatorial,
-        'permutacao_simples': permutacao_simples,
-        'combinacao_simples': combinacao_simples,
-        'probabilidade': probabilidade,
-        'determinante_da_matriz': determinante_da_matriz, 
-        'multiplicacao_de_matriz': multiplicacao_de_matriz,
-        'limite': limite,
-        'derivada_de_funcao_potencia': derivada_de_funcao_potencia
-    }
-    # Verifica se o tipo de cálculo existe
-    if tipo_calculo not in calculos:
-        raise ValueError(f"Tipo de cálculo '{tipo_calculo}' não encontrado.")
-    
-    # Lista de campos que devem permanecer como texto
-    campos_texto = ['equacao_reagentes', 'equacao_produtos', 'composto_quimico', 'elemento']
-    
-    # Converte os valores de string para float apenas se não forem campos de texto
-    valores = {}
-    for chave, valor in kwargs.items():
-        if valor is not None and valor != '':
-            if chave in campos_texto:
-                valores[chave] = valor
-            else:
-                try:
-                    valores[chave] = float(valor)
-                except ValueError:
-                    raise ValueError(f"Valor inválido para {chave}: {valor}")
-    
-    # Executa o cálculo
-    try:
-        resultado, unidades = calculos[tipo_calculo](**valores)
-        if not isinstance(resultado, dict) or not isinstance(unidades, dict):
-            raise ValueError('Função de cálculo deve retornar dois dicionários.')
-        return resultado, unidades
-    except Exception as e:
-        raise ValueError(f"Erro ao executar cálculo: {str(e)}")
+    return REGISTRO.executar(tipo_calculo, kwargs)
     
 def produtos_notaveis( #! REVISAR COMO FAZER OS TIPOS DE PRODUTOS NOTÁVEIS
     a: Optional[float] = None,
@@ -132,15 +79,41 @@ def funcao_do_2_grau(
         raise ValueError(f"Erro na funcao_do_2_grau: {str(e)}")
 
 
+def abscissa_do_vertice(a: float, b: float) -> float:
+    """Abscissa do vértice de ax² + bx + c: xv = -b/2a"""
+    if a == 0:
+        raise ValueError("O coeficiente a não pode ser zero: a função não é do 2º grau.")
+    return -b / (2 * a)
+
+
+def _vertice__vertice_da_parabola(b: float, a: float) -> Resultado:
+    return {'vertice_da_parabola': abscissa_do_vertice(a, b)}, {'vertice_da_parabola': ''}
+
+
+def _vertice__b(vertice_da_parabola: float, a: float) -> Resultado:
+    return {'b': -2 * a * vertice_da_parabola}, {'b': ''}
+
+
+def _vertice__a(vertice_da_parabola: float, b: float) -> Resultado:
+    if vertice_da_parabola == 0:
+        raise ValueError("Com o vértice em x = 0 o coeficiente a não pode ser determinado.")
+    a = -b / (2 * vertice_da_parabola)
+    if a == 0:
+        raise ValueError("O coeficiente a resultante é zero: a função não é do 2º grau.")
+    return {'a': a}, {'a': ''}
+
+
+@Ramos("Erro na vertice_parabola", {
+    'vertice_da_parabola': _vertice__vertice_da_parabola,
+    'b': _vertice__b,
+    'a': _vertice__a,
+}, capturar=(TypeError, ValueError, KeyError))
 def vertice_de_parabola(
     vertice_da_parabola: Optional[float] = None,
     b: Optional[float] = None,
     a: Optional[float] = None,
 ) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        ...
-    except (TypeError, ValueError, KeyError) as e:
-        raise ValueError(f"Erro na vertice_parabola: {str(e)}")
+    """Vértice da parábola: xv = -b/2a"""
 
 
 def funcao_exponencial(
@@ -312,31 +285,37 @@ def volume_do_cilindro(
         raise ValueError(f"Erro na volume_do_cilindro: {str(e)}")
 
 
-def fatorial( #! REVISAR VARIÁVEIS
-    n_fatorial: Optional[float] = None,
+def fatorial(
     n: Optional[float] = None,
-) -> Tuple[Dict[str, float], Dict[str, str]]:
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
     try:
-        ...
+        resultado = combinatoria.fatorial(n, modo)
+        return resultado, {chave: '' for chave in resultado}
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Erro na fatorial: {str(e)}")
 
 
 def permutacao_simples(
-    pn: Optional[float] = None,
-    n_fatorial: Optional[float] = None,
-) -> Tuple[Dict[str, float], Dict[str, str]]:
+    n: Optional[float] = None,
+    k: Optional[float] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
     try:
-        ...
+        resultado = combinatoria.permutacao(n, k, modo)
+        return resultado, {chave: '' for chave in resultado}
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Erro na permutacao_simples: {str(e)}")
 
 
-def combinacao_simples( #! REVISAR VARIÁVEIS
-    a: Optional[float] = None,
-) -> Tuple[Dict[str, float], Dict[str, str]]:
+def combinacao_simples(
+    n: Optional[float] = None,
+    k: Optional[float] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
     try:
-        ...
+        resultado = combinatoria.combinacao(n, k, modo)
+        return resultado, {chave: '' for chave in resultado}
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Erro na combinacao_simples: {str(e)}")
 
@@ -352,24 +331,63 @@ def probabilidade(
         raise ValueError(f"Erro na probabilidade: {str(e)}")
 
 
-def determinante_da_matriz( # ! VERIFICAR VARIÁVEIS
-    a: Optional[float] = None,
-) -> Tuple[Dict[str, float], Dict[str, str]]:
+def determinante_da_matriz(
+    matriz: Optional[EntradaMatriz] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
     try:
-        ...
+        from matrizes import determinante
+        return {'determinante': determinante(matriz, modo)}, {'determinante': ''}
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Erro na determinante_da_matriz: {str(e)}")
 
 
-def multiplicacao_de_matriz( # ! VERIFICAR VARIÁVEIS
-    a: Optional[float] = None,
-) -> Tuple[Dict[str, float], Dict[str, str]]:
+def multiplicacao_de_matriz(
+    matriz_a: Optional[EntradaMatriz] = None,
+    matriz_b: Optional[EntradaMatriz] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
     try:
-        ...
+        from matrizes import multiplicar
+        return {'produto': multiplicar(matriz_a, matriz_b, modo)}, {'produto': ''}
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Erro na multiplicacao_de_matriz: {str(e)}")
 
 
+def inversa_da_matriz(
+    matriz: Optional[EntradaMatriz] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    try:
+        from matrizes import inversa
+        return {'inversa': inversa(matriz, modo)}, {'inversa': ''}
+    except (TypeError, ValueError, KeyError) as e:
+        raise ValueError(f"Erro na inversa_da_matriz: {str(e)}")
+
+
+def posto_da_matriz(
+    matriz: Optional[EntradaMatriz] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    try:
+        from matrizes import posto
+        return {'posto': posto(matriz, modo)}, {'posto': ''}
+    except (TypeError, ValueError, KeyError) as e:
+        raise ValueError(f"Erro no posto_da_matriz: {str(e)}")
+
+
+def sistema_linear(
+    matriz: Optional[EntradaMatriz] = None,
+    vetor_b: Optional[EntradaMatriz] = None,
+    modo: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    try:
+        from matrizes import resolver_sistema
+        return {'solucao': resolver_sistema(matriz, vetor_b, modo)}, {'solucao': ''}
+    except (TypeError, ValueError, KeyError) as e:
+        raise ValueError(f"Erro no sistema_linear: {str(e)}")
+
+
 def limite(
     limite_fx: Optional[float] = None,
     l: Optional[float] = None,
@@ -390,3 +408,40 @@ def derivada_de_funcao_potencia(
     except (TypeError, ValueError, KeyError) as e:
         raise ValueError(f"Erro na derivada_de_funcao_potencia: {str(e)}")
 
+# Registro compilado uma única vez na importação
+REGISTRO = RegistroCalculos({
+    'produtos_notaveis': produtos_notaveis,
+    'formula_do_delta': formula_do_delta,
+    'funcao_do_1_grau': funcao_do_1_grau,
+    'funcao_do_2_grau': funcao_do_2_grau,
+    'vertice_de_parabola': vertice_de_parabola,
+    'funcao_exponencial': funcao_exponencial,
+    'funcao_logaritmica': funcao_logaritmica,
+    'pa_termo_geral': pa_termo_geral,
+    'pa_soma_dos_termos': pa_soma_dos_termos,
+    'pg_termo_geral': pg_termo_geral,
+    'pg_soma_dos_termos_finitos': pg_soma_dos_termos_finitos,
+    'pg_soma_infinita': pg_soma_infinita,
+    'relacoes_fundamentais': relacoes_fundamentais,
+    'lei_dos_senos': lei_dos_senos,
+    'lei_dos_cossenos': lei_dos_cossenos,
+    'area_do_triangulo': area_do_triangulo,
+    'area_do_circulo': area_do_circulo,
+    'volume_do_cubo': volume_do_cubo,
+    'volume_da_esfera': volume_da_esfera,
+    'volume_do_cilindro': volume_do_cilindro,
+    'fatorial': fatorial,
+    'permutacao_simples': permutacao_simples,
+    'combinacao_simples': combinacao_simples,
+    'probabilidade': probabilidade,
+    'determinante_da_matriz': determinante_da_matriz,
+    'multiplicacao_de_matriz': multiplicacao_de_matriz,
+    'inversa_da_matriz': inversa_da_matriz,
+    'posto_da_matriz': posto_da_matriz,
+    'sistema_linear': sistema_linear,
+    'limite': limite,
+    'derivada_de_funcao_potencia': derivada_de_funcao_potencia
+},
+    # Matrizes chegam como listas, texto ou buffer e não passam pela conversão para float
+    campos_texto=['matriz', 'matriz_a', 'matriz_b', 'vetor_b']
+)
@@ -8,10 +8,12 @@ import os
 import sys
 import re  
 from collections import Counter
-from sympy import Matrix, lcm
 from collections import defaultdict
 from typing import Dict, List, Union, Optional, Tuple
 from dicionario_quimica import tabela_periodica, tabela_massa, tabela_potenciais, entalpias_formacao
+from registro_calculos import Ramos, RegistroCalculos, Resultado
+from formulas_quimicas import composicao, contagem_elementos, massa_molar, separar_coeficiente
+from balanceador import balancear_com_cache
 
 def calculate_quimica(tipo_calculo: str, **kwargs) -> Tuple[Dict[str, float], Dict[str, str]]:
     """
@@ -24,98 +26,55 @@ def calculate_quimica(tipo_calculo: str, **kwargs) -> Tuple[Dict[str, float], Di
     Returns:
         Tuple[Dict[str, float], Dict[str, str]]: Resultado do cálculo e suas unidades
     """
-    # Mapeamento de tipos de cálculo para suas respectivas funções
-    calculos = {
-        'pureza': pureza,
-        'rendimento': rendimento,
-        'excesso': excesso,
-        'quantidade_de_reagentes_necessario': quantidade_de_reagentes_necessario,
-        'balanceamento': balanceamento,
-        'gases': gases,
-        'tabela_periodica': tabela_periodica,
-        'pilha_de_daniels': pilha_de_daniels,
-        'termoquimica': termoquimica,
-        'equilibrio_ionico': equilibrio_ionico
-    }
-    # Verifica se o tipo de cálculo existe
-    if tipo_calculo not in calculos:
-        raise ValueError(f"Tipo de cálculo '{tipo_calculo}' não encontrado.")
-    
-    # Lista de campos que devem permanecer como texto
-    campos_texto = ['equacao_reagentes', 'equacao_produtos', 'composto_quimico', 'elemento']
-    
-    # Converte os valores de string para float apenas se não forem campos de texto
-    valores = {}
-    for chave, valor in kwargs.items():
-        if valor is not None and valor != '':
-            if chave in campos_texto:
-                valores[chave] = valor
-            else:
-                try:
-                    valores[chave] = float(valor)
-                except ValueError:
-                    raise ValueError(f"Valor inválido para {chave}: {valor}")
-    
-    # Executa o cálculo
-    try:
-        resultado, unidades = calculos[tipo_calculo](**valores)
-        if not isinstance(resultado, dict) or not isinstance(unidades, dict):
-            raise ValueError('Função de cálculo deve retornar dois dicionários.')
-        return resultado, unidades
-    except Exception as e:
-        raise ValueError(f"Erro ao executar cálculo: {str(e)}")
+    return REGISTRO.executar(tipo_calculo, kwargs)
     
+def _pureza__pureza(massa_da_substancia_pura: float, massa_da_substancia_amostra: float) -> Resultado:
+    pureza = (massa_da_substancia_pura / massa_da_substancia_amostra) * 100
+    return {'Pureza da Substância': pureza}, {'Pureza da Substância': '%'}
+
+def _pureza__massa_da_substancia_pura(pureza: float, massa_da_substancia_amostra: float) -> Resultado:
+    massa_da_substancia_pura = (pureza / massa_da_substancia_amostra) * 100
+    return {'Massa da Substância Pura': massa_da_substancia_pura}, {'Massa da Substância Pura': 'g'}
+
+def _pureza__massa_da_substancia_amostra(pureza: float, massa_da_substancia_pura: float) -> Resultado:
+    massa_da_substancia_amostra = (pureza / 100) * massa_da_substancia_pura
+    return {'Massa da Substância Amostra': massa_da_substancia_amostra}, {'Massa da Substância Amostra': 'g'}
+
+@Ramos("Erro na Pureza", {
+    'pureza': _pureza__pureza,
+    'massa_da_substancia_pura': _pureza__massa_da_substancia_pura,
+    'massa_da_substancia_amostra': _pureza__massa_da_substancia_amostra,
+})
 def pureza(
     pureza: Optional[float] = None,
     massa_da_substancia_pura: Optional[float] = None,
     massa_da_substancia_amostra: Optional[float] = None
 ) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'pureza':pureza, 'massa_da_substancia_pura':massa_da_substancia_pura, 'massa_da_substancia_amostra':massa_da_substancia_amostra}
-        none_count = sum(1 for v in valores.values() if v is None)
-        if none_count != 1:
-                raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        if pureza is None:
-            if pureza == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a velocidade média.")
-            pureza = (massa_da_substancia_pura / massa_da_substancia_amostra) * 100
-            return {'Pureza da Substância': pureza}, {'Pureza da Substância': '%'}
-        elif massa_da_substancia_pura is None:
-            massa_da_substancia_pura = (pureza / massa_da_substancia_amostra) * 100
-            return {'Massa da Substância Pura': massa_da_substancia_pura}, {'Massa da Substância Pura': 'g'}
-        else: 
-            if massa_da_substancia_amostra == 0:
-                    raise ValueError("Velocidade média não pode ser zero para calcular o tempo.")
-            massa_da_substancia_amostra = (pureza / 100) * massa_da_substancia_pura
-            return {'Massa da Substância Amostra': massa_da_substancia_amostra}, {'Massa da Substância Amostra': 'g'}
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro na Pureza: {str(e)}")
-    
+    """Pureza: P = m_pura / m_amostra · 100"""
+
+def _rendimento__rendimento(rendimento_real: float, rendimento_teorico: float) -> Resultado:
+    rendimento = (rendimento_real / rendimento_teorico) * 100
+    return {'Rendimento da Reação': rendimento}, {'Rendimento da Reação': '%'}
+
+def _rendimento__rendimento_real(rendimento: float, rendimento_teorico: float) -> Resultado:
+    rendimento_real = (rendimento / rendimento_teorico) * 100
+    return {'Rendimento Real': rendimento_real}, {'Rendimento Real': 'g'}
+
+def _rendimento__rendimento_teorico(rendimento: float, rendimento_real: float) -> Resultado:
+    rendimento_teorico = (rendimento / 100) * rendimento_real
+    return {'Rendimento Teórico': rendimento_teorico}, {'Rendimento Teórico': 'g'}
+
+@Ramos("Erro no Rendimento", {
+    'rendimento': _rendimento__rendimento,
+    'rendimento_real': _rendimento__rendimento_real,
+    'rendimento_teorico': _rendimento__rendimento_teorico,
+})
 def rendimento(
     rendimento: Optional[float] = None,
     rendimento_real: Optional[float] = None,
     rendimento_teorico: Optional[float] = None
 ) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        valores = {'rendimento': rendimento, 'rendimento_real': rendimento_real, 'rendimento_teorico': rendimento_teorico}
-        none_count = sum(1 for v in valores.values() if v is None)
-        if none_count != 1:
-                raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        if rendimento is None:
-            if rendimento == 0:
-                raise ValueError("Tempo não pode ser zero para calcular a velocidade média.")
-            rendimento = (rendimento_real / rendimento_teorico) * 100
-            return {'Rendimento da Reação': rendimento}, {'Rendimento da Reação': '%'}
-        elif rendimento_real is None:
-            rendimento_real = (rendimento / rendimento_teorico) * 100
-            return {'Rendimento Real': rendimento_real}, {'Rendimento Real': 'g'}
-        else: 
-            if rendimento_teorico == 0:
-                    raise ValueError("Velocidade média não pode ser zero para calcular o tempo.")
-            rendimento_teorico = (rendimento / 100) * rendimento_real
-            return {'Rendimento Teórico': rendimento_teorico}, {'Rendimento Teórico': 'g'}
-    except (TypeError, ZeroDivisionError) as e:
-        raise ValueError(f"Erro no Rendimento: {str(e)}")
+    """Rendimento: R = real / teórico · 100"""
     
 def excesso(
     equacao_reagentes: Optional[str] = None,
@@ -129,17 +88,6 @@ def excesso(
         if none_count > 0:
             raise ValueError("Todos os valores devem ser fornecidos para calcular o excesso.")
         
-        def obter_massa_molar(composto, tabela_massa):
-            elementos = re.findall(r'([A-Z][a-z]*)(\d*)', composto)
-            massa_molar = 0
-            for elemento, quantidade in elementos:
-                quantidade = int(quantidade) if quantidade else 1
-                if elemento in tabela_massa:
-                    massa_molar += tabela_massa[elemento] * quantidade
-                else:
-                    raise ValueError(f"O elemento '{elemento}' não foi encontrado na tabela periódica ou foi escrito incorretamente.")
-            return massa_molar
-
         # Entrada de dados
         reagentes = [r.strip() for r in equacao_reagentes.split(',')]
         
@@ -148,17 +96,14 @@ def excesso(
         massas_disponiveis = {}
         
         for termo in reagentes:
-            match = re.match(r'(\d*)([A-Za-z0-9]+)', termo)
-            coef = int(match.group(1)) if match.group(1) else 1
-            substancia = match.group(2)
+            coef, substancia = separar_coeficiente(termo)
             reagentes_esteq[substancia] = coef
             massas_disponiveis[substancia] = massa_disponivel
         
         # Converter massas em mols
         mols_disponiveis = {}
         for substancia in reagentes_esteq:
-            massa_molar = obter_massa_molar(substancia, tabela_massa)
-            mols_disponiveis[substancia] = massas_disponiveis[substancia] / massa_molar
+            mols_disponiveis[substancia] = massas_disponiveis[substancia] / massa_molar(substancia)
         
         # Determinar o reagente limitante
         razoes = {r: mols_disponiveis[r] / reagentes_esteq[r] for r in reagentes_esteq}
@@ -170,7 +115,7 @@ def excesso(
             if r != limitante:
                 mols_consumidos = mols_disponiveis[limitante] * (reagentes_esteq[r] / reagentes_esteq[limitante])
                 mols_excesso = mols_disponiveis[r] - mols_consumidos
-                excesso[r] = mols_excesso * obter_massa_molar(r, tabela_massa)
+                excesso[r] = mols_excesso * massa_molar(r)
         
         # Preparar resultado
         resultado = {
@@ -199,33 +144,10 @@ def quantidade_de_reagentes_necessario(
     try:
         valores = {'equacao_reagentes': equacao_reagentes, 'equacao_produtos': equacao_produtos, 'massa_dos_produtos_desejada': massa_dos_produtos_desejada}
         none_count = sum(1 for v in valores.values() if v is None)
-        def decompor_formula_quimica(fml_quimica):
-            elementos_quimicos = defaultdict(int)
-            indice = 0
-            while indice < len(fml_quimica):
-                if fml_quimica[indice].isalpha():
-                    elemento_atual = fml_quimica[indice]
-                    if indice + 1 < len(fml_quimica) and fml_quimica[indice + 1].islower():
-                        elemento_atual += fml_quimica[indice + 1]
-                        indice += 1
-                    indice += 1
-                    quantidade_elemento = ""
-                    while indice < len(fml_quimica) and fml_quimica[indice].isdigit():
-                        quantidade_elemento += fml_quimica[indice]
-                        indice += 1
-                    quantidade_elemento = int(quantidade_elemento) if quantidade_elemento else 1
-                    elementos_quimicos[elemento_atual] += quantidade_elemento
-            return elementos_quimicos
-
         def calcular_massa_molar(composto_quimico):
-            composicao = decompor_formula_quimica(composto_quimico)
-            massa_total = 0
-            for elemento, quantidade in composicao.items():
-                if elemento in tabela_massa:
-                    massa_total += tabela_massa[elemento] * quantidade
-                else:
-                    print(f"O elemento '{elemento}' não foi encontrado no dicionário de massas atômicas ou foi escrito incorretamente.")
-                    return None
+            massa_total = composicao(composto_quimico).massa_molar
+            if massa_total is None:
+                print(f"O composto '{composto_quimico}' contém elementos que não foram encontrados no dicionário de massas atômicas ou foram escritos incorretamente.")
             return massa_total
 
         # Calcular as massas molares dos reagentes e produtos
@@ -270,18 +192,6 @@ def massa_dos_reagentes_ou_dos_produtos(
     try:
         valores = {'composto_quimico': composto_quimico}
         none_count = sum(1 for v in valores.values() if v is None)
-        def calcular_massa_molar(composto, tabela_massa):
-            elementos = re.findall(r'([A-Z][a-z]*)(\d*)', composto)
-            massa_total = 0
-            for elemento, quantidade in elementos:
-                if elemento in tabela_massa:
-                    massa_elemento = tabela_massa[elemento]
-                    quantidade = int(quantidade) if quantidade else 1
-                    massa_total += massa_elemento * quantidade
-                else:
-                    print(f"O elemento '{elemento}' não foi encontrado na tabela ou foi escrito incorretamente.")
-            return massa_total
-
         def main():
                 compostos = []
                 while True:
@@ -291,7 +201,7 @@ def massa_dos_reagentes_ou_dos_produtos(
                 
                 massa_total = 0
                 for composto_quimico in compostos:
-                    massa = calcular_massa_molar(composto_quimico, tabela_massa)
+                    massa = massa_molar(composto_quimico)
                     print(f"Massa molar de {composto_quimico}: {massa:.3f} g/mol")
                     massa_total += massa
 
@@ -309,54 +219,11 @@ def balanceamento(equacao_reagentes: str, equacao_produtos: str) -> Tuple[Dict[s
         if not equacao_reagentes or not equacao_produtos:
             raise ValueError("Todas as equações devem ser fornecidas para o balanceamento.")
 
-        # Importa as dependências necessárias
-        from collections import defaultdict
-        from sympy import Matrix, lcm
-
-        # Função para processar uma fórmula química
-        def parse_formula(formula):
-            elements = defaultdict(int)
-            i = 0
-            while i < len(formula):
-                if formula[i].isalpha():
-                    element = formula[i]
-                    if i + 1 < len(formula) and formula[i + 1].islower():
-                        element += formula[i + 1]
-                        i += 1
-                    i += 1
-                    qty = ""
-                    while i < len(formula) and formula[i].isdigit():
-                        qty += formula[i]
-                        i += 1
-                    qty = int(qty) if qty else 1
-                    elements[element] += qty
-            return elements
-
         # Função para balancear a equação
         def balance_chemical_equation(reactants, products):
-            # Obtém todos os elementos únicos
-            elements = set()
-            for compound in reactants + products:
-                elements.update(parse_formula(compound).keys())
-            elements = sorted(elements)
-            
-            # Cria os vetores para cada composto
-            compound_vectors = []
-            for compound in reactants + products:
-                compound_vector = [parse_formula(compound).get(element, 0) for element in elements]
-                compound_vectors.append(compound_vector)
-            
-            # Cria as matrizes
-            reactant_matrix = Matrix(compound_vectors[:len(reactants)]).transpose()
-            product_matrix = Matrix(compound_vectors[len(reactants):]).transpose()
-            
-            # Resolve o sistema
-            coeff_matrix = reactant_matrix.row_join(-product_matrix)
-            solution = coeff_matrix.nullspace()[0]
-            
-            # Calcula os coeficientes
-            lcm_val = lcm([term.q for term in solution])
-            coefficients = [abs(int(term * lcm_val)) for term in solution]
+            # Resolve com aritmética inteira exata; fórmulas inválidas e equações
+            # sem balanceamento único chegam como ValueError (ErroBalanceamento)
+            coefficients = balancear_com_cache(reactants, products)
             
             # Formata a equação balanceada
             balanced_reactants = []
@@ -381,9 +248,9 @@ def balanceamento(equacao_reagentes: str, equacao_produtos: str) -> Tuple[Dict[s
         print(f"Debug - Reagentes recebidos: {equacao_reagentes}")
         print(f"Debug - Produtos recebidos: {equacao_produtos}")
 
-        # Separa os reagentes e produtos
-        reactants = [r.strip() for r in equacao_reagentes.replace(',', '+').split('+') if r.strip()]
-        products = [p.strip() for p in equacao_produtos.replace(',', '+').split('+') if p.strip()]
+        # Separa os reagentes e produtos, descartando coeficientes já informados
+        reactants = [separar_coeficiente(r)[1] for r in equacao_reagentes.replace(',', '+').split('+') if r.strip()]
+        products = [separar_coeficiente(p)[1] for p in equacao_produtos.replace(',', '+').split('+') if p.strip()]
 
         print(f"Debug - Reagentes processados: {reactants}")
         print(f"Debug - Produtos processados: {products}")
@@ -404,65 +271,69 @@ def balanceamento(equacao_reagentes: str, equacao_produtos: str) -> Tuple[Dict[s
         print(f"Debug - Erro inesperado: {str(e)}")
         raise ValueError(f"Erro inesperado no Balanceamento: {str(e)}")
     
+CONSTANTE_GASES = 0.082
+
+# Mensagens das validações dos gases, na ordem dos parâmetros
+_GASES_POSITIVOS = {
+    'pressao': "A pressão deve ser maior que zero.",
+    'volume': "O volume deve ser maior que zero.",
+    'numero_de_mols': "O número de mols deve ser maior que zero.",
+    'temperatura': "A temperatura deve ser maior que zero.",
+}
+
+def _validar_gases(conhecidos: Dict[str, float]) -> None:
+    """Valida os valores conhecidos dos gases: números e maiores que zero."""
+    for nome in _GASES_POSITIVOS:
+        if nome in conhecidos and not isinstance(conhecidos[nome], (int, float)):
+            raise TypeError(f"O parâmetro {nome} deve ser um número.")
+    for nome, mensagem in _GASES_POSITIVOS.items():
+        if nome in conhecidos and conhecidos[nome] <= 0:
+            raise ValueError(mensagem)
+
+def _finito(valor: float, descricao: str) -> float:
+    if not math.isfinite(valor):
+        raise ValueError(f"Resultado do cálculo {descricao} é inválido.")
+    return valor
+
+def _gases__pressao(volume: float, numero_de_mols: float, temperatura: float) -> Resultado:
+    _validar_gases({'volume': volume, 'numero_de_mols': numero_de_mols, 'temperatura': temperatura})
+    pressao = _finito((numero_de_mols * CONSTANTE_GASES * temperatura) / volume, 'da pressão')
+    return {'Pressão do Gás': pressao}, {'Pressão do Gás': 'atm'}
+
+def _gases__volume(pressao: float, numero_de_mols: float, temperatura: float) -> Resultado:
+    _validar_gases({'pressao': pressao, 'numero_de_mols': numero_de_mols, 'temperatura': temperatura})
+    volume = _finito((numero_de_mols * CONSTANTE_GASES * temperatura) / pressao, 'do volume')
+    return {'Volume do Gás': volume}, {'Volume do Gás': 'L'}
+
+def _gases__numero_de_mols(pressao: float, volume: float, temperatura: float) -> Resultado:
+    _validar_gases({'pressao': pressao, 'volume': volume, 'temperatura': temperatura})
+    den = (CONSTANTE_GASES * temperatura)
+    if den == 0:
+        raise ValueError("Divisão por zero detectada. Verifique os valores de entrada.")
+    numero_de_mols = _finito((pressao * volume) / den, 'do número de mols')
+    return {'Número de Mols': numero_de_mols}, {'Número de Mols': 'mol'}
+
+def _gases__temperatura(pressao: float, volume: float, numero_de_mols: float) -> Resultado:
+    _validar_gases({'pressao': pressao, 'volume': volume, 'numero_de_mols': numero_de_mols})
+    den = (numero_de_mols * CONSTANTE_GASES)
+    if den == 0:
+        raise ValueError("Divisão por zero detectada. Verifique os valores de entrada.")
+    temperatura = _finito((pressao * volume) / den, 'da temperatura')
+    return {'Temperatura do Gás': temperatura}, {'Temperatura do Gás': 'K'}
+
+@Ramos("Erro nos Gases", {
+    'pressao': _gases__pressao,
+    'volume': _gases__volume,
+    'numero_de_mols': _gases__numero_de_mols,
+    'temperatura': _gases__temperatura,
+}, capturar=(TypeError, ValueError))
 def gases(
     pressao: Optional[float] = None,
     volume: Optional[float] = None,
     numero_de_mols: Optional[float] = None,
     temperatura: Optional[float] = None
 ) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        # Validação dos tipos de entrada
-        for param_name, param_value in [('pressao', pressao), ('volume', volume), 
-                                      ('numero_de_mols', numero_de_mols), ('temperatura', temperatura)]:
-            if param_value is not None and not isinstance(param_value, (int, float)):
-                raise TypeError(f"O parâmetro {param_name} deve ser um número.")
-
-        valores = {'pressao': pressao, 'volume': volume, 'numero_de_mols': numero_de_mols, 'temperatura': temperatura}
-        none_count = sum(1 for v in valores.values() if v is None)
-        constante_gases = 0.082
-
-        if none_count != 1:
-            raise ValueError("Exatamente três valores devem ser fornecidos para calcular o quarto.")
-        
-        # Validações para valores não nulos
-        if pressao is not None and pressao <= 0:
-            raise ValueError("A pressão deve ser maior que zero.")
-        if volume is not None and volume <= 0:
-            raise ValueError("O volume deve ser maior que zero.")
-        if numero_de_mols is not None and numero_de_mols <= 0:
-            raise ValueError("O número de mols deve ser maior que zero.")
-        if temperatura is not None and temperatura <= 0:
-            raise ValueError("A temperatura deve ser maior que zero.")
-
-        # Cálculos com tratamento de overflow
-        try:
-            if pressao is None:
-                pressao = (numero_de_mols * constante_gases * temperatura) / volume
-                if not math.isfinite(pressao):
-                    raise ValueError("Resultado do cálculo da pressão é inválido.")
-                return {'Pressão do Gás': pressao}, {'Pressão do Gás': 'atm'}
-            elif volume is None:
-                volume = (numero_de_mols * constante_gases * temperatura) / pressao
-                if not math.isfinite(volume):
-                    raise ValueError("Resultado do cálculo do volume é inválido.")
-                return {'Volume do Gás': volume}, {'Volume do Gás': 'L'}
-            elif numero_de_mols is None:
-                numero_de_mols = (pressao * volume) / (constante_gases * temperatura)
-                if not math.isfinite(numero_de_mols):
-                    raise ValueError("Resultado do cálculo do número de mols é inválido.")
-                return {'Número de Mols': numero_de_mols}, {'Número de Mols': 'mol'}
-            else:
-                temperatura = (pressao * volume) / (numero_de_mols * constante_gases)
-                if not math.isfinite(temperatura):
-                    raise ValueError("Resultado do cálculo da temperatura é inválido.")
-                return {'Temperatura do Gás': temperatura}, {'Temperatura do Gás': 'K'}
-        except OverflowError:
-            raise ValueError("O resultado do cálculo é muito grande para ser representado.")
-        except ZeroDivisionError:
-            raise ValueError("Divisão por zero detectada. Verifique os valores de entrada.")
-            
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Erro nos Gases: {str(e)}")
+    """Equação de Clapeyron: P·V = n·R·T"""
     
 def tabela_periodica(
     elemento: Optional[str] = None,
@@ -570,51 +441,37 @@ def pilha_de_daniels(
     except (TypeError, ValueError) as e:
         raise ValueError(f"Erro na Pilha de Daniels: {str(e)}")
     
+def _validar_termoquimica(conhecidos: Dict[str, float]) -> None:
+    for nome in ('delta_h', 'entalpia_dos_reagentes', 'entalpia_dos_produtos'):
+        if nome in conhecidos and not isinstance(conhecidos[nome], (int, float)):
+            raise TypeError(f"O parâmetro {nome} deve ser um número.")
+
+def _termoquimica__delta_h(entalpia_dos_reagentes: float, entalpia_dos_produtos: float) -> Resultado:
+    _validar_termoquimica({'entalpia_dos_reagentes': entalpia_dos_reagentes, 'entalpia_dos_produtos': entalpia_dos_produtos})
+    delta_h = _finito(entalpia_dos_produtos - entalpia_dos_reagentes, 'da variação de entalpia')
+    return {'Variação de Entalpia': delta_h}, {'Variação de Entalpia': 'kJ/mol'}
+
+def _termoquimica__entalpia_dos_produtos(delta_h: float, entalpia_dos_reagentes: float) -> Resultado:
+    _validar_termoquimica({'delta_h': delta_h, 'entalpia_dos_reagentes': entalpia_dos_reagentes})
+    entalpia_dos_produtos = _finito(delta_h + entalpia_dos_reagentes, 'da entalpia dos produtos')
+    return {'Entalpia dos Produtos': entalpia_dos_produtos}, {'Entalpia dos Produtos': 'kJ/mol'}
+
+def _termoquimica__entalpia_dos_reagentes(delta_h: float, entalpia_dos_produtos: float) -> Resultado:
+    _validar_termoquimica({'delta_h': delta_h, 'entalpia_dos_produtos': entalpia_dos_produtos})
+    entalpia_dos_reagentes = _finito(entalpia_dos_produtos - delta_h, 'da entalpia dos reagentes')
+    return {'Entalpia dos Reagentes': entalpia_dos_reagentes}, {'Entalpia dos Reagentes': 'kJ/mol'}
+
+@Ramos("Erro na Termoquímica", {
+    'delta_h': _termoquimica__delta_h,
+    'entalpia_dos_reagentes': _termoquimica__entalpia_dos_reagentes,
+    'entalpia_dos_produtos': _termoquimica__entalpia_dos_produtos,
+}, capturar=(TypeError, ValueError))
 def termoquimica(
     delta_h: Optional[float] = None,
     entalpia_dos_reagentes: Optional[float] = None,
     entalpia_dos_produtos: Optional[float] = None
 ) -> Tuple[Dict[str, float], Dict[str, str]]:
-    try:
-        # Validação dos tipos de entrada
-        for param_name, param_value in [('delta_h', delta_h), 
-                                      ('entalpia_dos_reagentes', entalpia_dos_reagentes),
-                                      ('entalpia_dos_produtos', entalpia_dos_produtos)]:
-            if param_value is not None and not isinstance(param_value, (int, float)):
-                raise TypeError(f"O parâmetro {param_name} deve ser um número.")
-
-        valores = {
-            'delta_h': delta_h,
-            'entalpia_dos_produtos': entalpia_dos_produtos,
-            'entalpia_dos_reagentes': entalpia_dos_reagentes
-        }
-        none_count = sum(1 for v in valores.values() if v is None)
-        
-        if none_count != 1:
-            raise ValueError("Exatamente dois valores devem ser fornecidos para calcular o terceiro.")
-        
-        # Cálculos com tratamento de overflow
-        try:
-            if delta_h is None:
-                delta_h = entalpia_dos_produtos - entalpia_dos_reagentes
-                if not math.isfinite(delta_h):
-                    raise ValueError("Resultado do cálculo da variação de entalpia é inválido.")
-                return {'Variação de Entalpia': delta_h}, {'Variação de Entalpia': 'kJ/mol'}
-            elif entalpia_dos_produtos is None:
-                entalpia_dos_produtos = delta_h + entalpia_dos_reagentes
-                if not math.isfinite(entalpia_dos_produtos):
-                    raise ValueError("Resultado do cálculo da entalpia dos produtos é inválido.")
-                return {'Entalpia dos Produtos': entalpia_dos_produtos}, {'Entalpia dos Produtos': 'kJ/mol'}
-            else:
-                entalpia_dos_reagentes = entalpia_dos_produtos - delta_h
-                if not math.isfinite(entalpia_dos_reagentes):
-                    raise ValueError("Resultado do cálculo da entalpia dos reagentes é inválido.")
-                return {'Entalpia dos Reagentes': entalpia_dos_reagentes}, {'Entalpia dos Reagentes': 'kJ/mol'}
-        except OverflowError:
-            raise ValueError("O resultado do cálculo é muito grande para ser representado.")
-            
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Erro na Termoquímica: {str(e)}")
+    """Termoquímica: ΔH = H_produtos - H_reagentes"""
     
 def equilibrio_ionico(
     acido_ou_base: Optional[str] = None,
@@ -709,4 +566,21 @@ def equilibrio_ionico(
         
     except (TypeError, ValueError) as e:
         raise ValueError(f"Erro no Equilíbrio Iônico: {str(e)}")
-    
\ No newline at end of file
+
+# Registro compilado uma única vez na importação
+REGISTRO = RegistroCalculos({
+    'pureza': pureza,
+    'rendimento': rendimento,
+    'excesso': excesso,
+    'quantidade_de_reagentes_necessario': quantidade_de_reagentes_necessario,
+    'balanceamento': balanceamento,
+    'gases': gases,
+    'tabela_periodica': tabela_periodica,
+    'pilha_de_daniels': pilha_de_daniels,
+    'termoquimica': termoquimica,
+    'equilibrio_ionico': equilibrio_ionico
+},
+    # Campos que devem permanecer como texto além dos anotados como str
+    # pureza, rendimento, gases e termoquimica são declarados com Ramos: o registro chama o ramo da incógnita
+    campos_texto=['equacao_reagentes', 'equacao_produtos', 'composto_quimico', 'elemento']
+)
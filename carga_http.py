@@ -0,0 +1,427 @@
+"""
+Teste de carga HTTP do CalcLab.
+
+Reproduz uma mistura configurável de requisições (cálculos de física e
+química, login e chatbot) contra o app e mede vazão, latências p50/p95/p99 e
+taxa de erros. A carga é em malha fechada: cada usuário virtual envia a
+próxima requisição assim que recebe a resposta anterior. Rodando vários
+estágios de concorrência (``--concorrencia 1,2,4,8``) dá para ver onde a vazão
+deixa de crescer, isto é, onde o worker satura.
+
+Modos:
+
+- ``cliente``: usa o ``app.test_client()`` no próprio processo, sem rede;
+- ``gunicorn``: sobe um gunicorn local (um worker ``gthread`` por padrão) e
+  envia requisições HTTP reais com conexões persistentes;
+- ``--url``: envia requisições HTTP para um servidor já em execução.
+
+O chatbot usa sempre o backend ``local`` (sem rede), com latência simulada
+por ``--latencia-chatbot``. Banco, perfis e backups ficam numa pasta
+temporária, nunca no diretório do projeto.
+
+Uso:
+
+    python carga_http.py --modo gunicorn --concorrencia 1,2,4,8 --duracao 10
+    python carga_http.py --modo cliente --mistura fisica=6,quimica=3,login=1 --saida carga.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+DIRETORIO_PROJETO = os.path.dirname(os.path.abspath(__file__))
+
+# Conta criada antes da carga e usada no login e no chatbot
+USUARIO = {
+    'nome_usuario': 'carga_http',
+    'senha': 'carga-http-123',
+    'email': 'carga_http@example.com',
+    'nome_completo': 'Usuário de Carga',
+    'data_nascimento': '2000-01-01',
+    'serie': '3',
+    'materia_dificuldade': 'fisica',
+}
+
+MISTURA_PADRAO = 'fisica=5,quimica=3,login=1,chatbot=1'
+
+EQUACOES = (
+    ('H2 + O2', 'H2O'),
+    ('CH4 + O2', 'CO2 + H2O'),
+    ('C8H18 + O2', 'CO2 + H2O'),
+    ('Fe + O2', 'Fe2O3'),
+    ('KMnO4 + HCl', 'KCl + MnCl2 + H2O + Cl2'),
+    ('Ca3(PO4)2 + SiO2 + C', 'CaSiO3 + P4 + CO'),
+)
+
+PERGUNTAS = (
+    'Como calculo a velocidade média?',
+    'Qual a fórmula da força peso?',
+    'Como balancear uma equação química?',
+    'O que é a lei de Ohm?',
+    'Como calcular o pH de uma solução?',
+)
+
+
+class Requisicao(NamedTuple):
+    """Uma requisição da mistura e os status considerados sucesso."""
+    tipo: str
+    metodo: str
+    caminho: str
+    corpo: Optional[bytes]
+    cabecalhos: Dict[str, str]
+    esperados: Tuple[int, ...]
+
+
+def _json(tipo: str, caminho: str, dados: Any) -> Requisicao:
+    return Requisicao(tipo, 'POST', caminho, json.dumps(dados).encode('utf-8'),
+                      {'Content-Type': 'application/json'}, (200,))
+
+
+def _formulario(tipo: str, caminho: str, dados: Dict[str, str], esperados: Tuple[int, ...]) -> Requisicao:
+    return Requisicao(tipo, 'POST', caminho, urllib.parse.urlencode(dados).encode('utf-8'),
+                      {'Content-Type': 'application/x-www-form-urlencoded'}, esperados)
+
+
+def gerar_requisicao(tipo: str, aleatorio: random.Random, variedade: int) -> Requisicao:
+    """
+    Monta uma requisição do tipo pedido.
+
+    Args:
+        tipo (str): 'fisica', 'quimica', 'login' ou 'chatbot'
+        aleatorio (random.Random): Gerador do usuário virtual
+        variedade (int): Entradas distintas por tipo de cálculo; valores pequenos favorecem o cache
+
+    Returns:
+        Requisicao: Requisição pronta para envio
+    """
+    indice = aleatorio.randrange(variedade)
+    if tipo == 'fisica':
+        return _json(tipo, '/fisica', {'tipo_calculo': 'velocidade_media',
+                                       'deslocamento': 10 + indice, 'tempo': 2})
+    if tipo == 'quimica':
+        if indice % 2 == 0:
+            reagentes, produtos = EQUACOES[indice // 2 % len(EQUACOES)]
+            return _json(tipo, '/quimica', {'tipo_calculo': 'balanceamento',
+                                            'equacao_reagentes': reagentes, 'equacao_produtos': produtos})
+        return _json(tipo, '/quimica', {'tipo_calculo': 'gases', 'pressao': 1 + indice,
+                                        'volume': 22.4, 'numero_de_mols': 1})
+    if tipo == 'login':
+        return _formulario(tipo, '/login', {'username': USUARIO['nome_usuario'], 'password': USUARIO['senha']}, (302,))
+    if tipo == 'chatbot':
+        return _json(tipo, '/chatbot', {'message': PERGUNTAS[indice % len(PERGUNTAS)]})
+    raise ValueError(f"Tipo de requisição '{tipo}' não suportado. Opções: fisica, quimica, login, chatbot")
+
+
+def interpretar_mistura(texto: str) -> Dict[str, float]:
+    """Converte 'fisica=5,quimica=3' em pesos por tipo de requisição."""
+    mistura = {}
+    for parte in filter(None, (p.strip() for p in texto.split(','))):
+        tipo, _, peso = parte.partition('=')
+        gerar_requisicao(tipo, random.Random(0), 1)  # valida o tipo
+        mistura[tipo] = float(peso or 1)
+    if not mistura or sum(mistura.values()) <= 0:
+        raise ValueError('A mistura deve ter ao menos um tipo com peso positivo.')
+    return mistura
+
+
+class ClienteFlask:
+    """Usuário virtual sobre o ``test_client`` do Flask, no mesmo processo."""
+
+    def __init__(self, app):
+        self._cliente = app.test_client()
+
+    def enviar(self, requisicao: Requisicao) -> int:
+        resposta = self._cliente.open(requisicao.caminho, method=requisicao.metodo,
+                                      data=requisicao.corpo, headers=requisicao.cabecalhos)
+        resposta.close()
+        return resposta.status_code
+
+    def fechar(self) -> None:
+        pass
+
+
+class ClienteHTTP:
+    """Usuário virtual com uma conexão HTTP persistente e o cookie de sessão."""
+
+    def __init__(self, host: str, porta: int, tempo_limite: float = 30.0):
+        self.host = host
+        self.porta = porta
+        self.tempo_limite = tempo_limite
+        self._conexao: Optional[http.client.HTTPConnection] = None
+        self._cookie: Optional[str] = None
+
+    def enviar(self, requisicao: Requisicao) -> int:
+        cabecalhos = dict(requisicao.cabecalhos)
+        if self._cookie:
+            cabecalhos['Cookie'] = self._cookie
+        for tentativa in range(2):
+            if self._conexao is None:
+                self._conexao = http.client.HTTPConnection(self.host, self.porta, timeout=self.tempo_limite)
+            try:
+                self._conexao.request(requisicao.metodo, requisicao.caminho, body=requisicao.corpo, headers=cabecalhos)
+                resposta = self._conexao.getresponse()
+                resposta.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # O servidor pode fechar conexões ociosas; reabre uma vez
+                self.fechar()
+                if tentativa:
+                    raise
+        cookie = resposta.getheader('Set-Cookie')
+        if cookie and cookie.startswith('session='):
+            self._cookie = cookie.split(';', 1)[0]
+        if resposta.getheader('Connection', '').lower() == 'close':
+            self.fechar()
+        return resposta.status
+
+    def fechar(self) -> None:
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
+
+
+def preparar_conta(cliente) -> None:
+    """Cria a conta de carga (ignora se já existir) e faz login no cliente."""
+    cliente.enviar(_formulario('setup', '/criar_conta', USUARIO, (302,)))
+    status = cliente.enviar(gerar_requisicao('login', random.Random(0), 1))
+    if status != 302:
+        raise RuntimeError(f'Não foi possível entrar com a conta de carga (status {status}).')
+
+
+def _percentis(latencias: List[float]) -> Dict[str, float]:
+    if not latencias:
+        return {'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+    if len(latencias) == 1:
+        return {'p50_ms': latencias[0], 'p95_ms': latencias[0], 'p99_ms': latencias[0]}
+    cortes = statistics.quantiles(latencias, n=100, method='inclusive')
+    return {'p50_ms': round(cortes[49], 3), 'p95_ms': round(cortes[94], 3), 'p99_ms': round(cortes[98], 3)}
+
+
+def resumir(amostras: List[Tuple[str, float, bool]], duracao: float) -> Dict[str, Any]:
+    """Vazão, percentis de latência e erros, no total e por tipo de requisição."""
+    def resumo(selecao: List[Tuple[str, float, bool]]) -> Dict[str, Any]:
+        erros = sum(1 for _, _, ok in selecao if not ok)
+        return {
+            'requisicoes': len(selecao),
+            'vazao_rps': round(len(selecao) / duracao, 2) if duracao else 0.0,
+            'erros': erros,
+            'taxa_erros': round(erros / len(selecao), 4) if selecao else 0.0,
+            **_percentis([latencia for _, latencia, _ in selecao]),
+        }
+
+    tipos = sorted({tipo for tipo, _, _ in amostras})
+    return {
+        **resumo(amostras),
+        'por_tipo': {tipo: resumo([a for a in amostras if a[0] == tipo]) for tipo in tipos},
+    }
+
+
+def executar_estagio(criar_cliente: Callable[[], Any], mistura: Dict[str, float], concorrencia: int,
+                     duracao: float, aquecimento: float, variedade: int, semente: int) -> Dict[str, Any]:
+    """
+    Roda um estágio de carga com ``concorrencia`` usuários virtuais.
+
+    Args:
+        criar_cliente (Callable[[], Any]): Fábrica de ``ClienteFlask`` ou ``ClienteHTTP``
+        mistura (Dict[str, float]): Peso de cada tipo de requisição
+        concorrencia (int): Usuários virtuais simultâneos
+        duracao (float): Segundos medidos
+        aquecimento (float): Segundos iniciais descartados
+        variedade (int): Entradas distintas por tipo de cálculo
+        semente (int): Semente dos geradores aleatórios
+
+    Returns:
+        Dict[str, Any]: Resumo do estágio
+    """
+    tipos, pesos = list(mistura), list(mistura.values())
+    amostras: List[Tuple[str, float, bool]] = []
+    trava = threading.Lock()
+    inicio_medicao = time.perf_counter() + aquecimento
+    fim = inicio_medicao + duracao
+    falhas_preparo: List[str] = []
+
+    def usuario(numero: int) -> None:
+        aleatorio = random.Random(semente * 1000 + numero)
+        cliente = criar_cliente()
+        locais = []
+        try:
+            if 'chatbot' in mistura:
+                preparar_conta(cliente)
+            while True:
+                agora = time.perf_counter()
+                if agora >= fim:
+                    break
+                requisicao = gerar_requisicao(aleatorio.choices(tipos, pesos)[0], aleatorio, variedade)
+                try:
+                    ok = cliente.enviar(requisicao) in requisicao.esperados
+                except Exception:
+                    ok = False
+                depois = time.perf_counter()
+                if agora >= inicio_medicao:
+                    locais.append((requisicao.tipo, (depois - agora) * 1000, ok))
+        except Exception as e:
+            falhas_preparo.append(str(e))
+        finally:
+            cliente.fechar()
+            with trava:
+                amostras.extend(locais)
+
+    threads = [threading.Thread(target=usuario, args=(i,), daemon=True) for i in range(concorrencia)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if falhas_preparo:
+        raise RuntimeError(f'Falha ao preparar os usuários virtuais: {falhas_preparo[0]}')
+    return {'concorrencia': concorrencia, 'duracao_s': duracao, **resumir(amostras, duracao)}
+
+
+def _porta_livre() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def iniciar_gunicorn(pasta: str, porta: int, workers: int, threads: int, ambiente: Dict[str, str],
+                     espera: float = 30.0) -> subprocess.Popen:
+    """Sobe um gunicorn com o app, usando ``pasta`` como diretório de trabalho."""
+    processo = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:app',
+         '--pythonpath', DIRETORIO_PROJETO,
+         '--bind', f'127.0.0.1:{porta}',
+         '--workers', str(workers),
+         '--worker-class', 'gthread',
+         '--threads', str(threads),
+         '--log-level', 'warning'],
+        cwd=pasta, env={**os.environ, **ambiente},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    limite = time.monotonic() + espera
+    while time.monotonic() < limite:
+        if processo.poll() is not None:
+            raise RuntimeError(f'O gunicorn terminou ao iniciar (código {processo.returncode}).')
+        try:
+            with socket.create_connection(('127.0.0.1', porta), timeout=0.5):
+                return processo
+        except OSError:
+            time.sleep(0.1)
+    processo.terminate()
+    raise RuntimeError('O gunicorn não respondeu a tempo.')
+
+
+def _imprimir_estagio(estagio: Dict[str, Any]) -> None:
+    print(f"\nConcorrência {estagio['concorrencia']}: {estagio['vazao_rps']:.1f} req/s, "
+          f"p50 {estagio['p50_ms']:.2f} ms, p95 {estagio['p95_ms']:.2f} ms, p99 {estagio['p99_ms']:.2f} ms, "
+          f"erros {estagio['taxa_erros']:.2%}")
+    for tipo, resumo in estagio['por_tipo'].items():
+        print(f"  {tipo:<8} {resumo['requisicoes']:>7} req {resumo['vazao_rps']:>9.1f} req/s  "
+              f"p50 {resumo['p50_ms']:>8.2f}  p95 {resumo['p95_ms']:>8.2f}  p99 {resumo['p99_ms']:>8.2f} ms  "
+              f"erros {resumo['taxa_erros']:.2%}")
+
+
+def saturacao(estagios: List[Dict[str, Any]], ganho_minimo: float = 0.10) -> Optional[int]:
+    """Primeira concorrência a partir da qual dobrar usuários rende menos de ``ganho_minimo`` de vazão."""
+    for anterior, atual in zip(estagios, estagios[1:]):
+        if anterior['vazao_rps'] and atual['vazao_rps'] < anterior['vazao_rps'] * (1 + ganho_minimo):
+            return anterior['concorrencia']
+    return None
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Teste de carga HTTP do CalcLab.')
+    parser.add_argument('--modo', choices=('cliente', 'gunicorn'), default='gunicorn')
+    parser.add_argument('--url', help='Servidor já em execução (ex.: http://127.0.0.1:8000); ignora --modo')
+    parser.add_argument('--mistura', default=MISTURA_PADRAO, help=f'Pesos por tipo (padrão: {MISTURA_PADRAO})')
+    parser.add_argument('--concorrencia', default='1,2,4,8', help='Usuários virtuais de cada estágio')
+    parser.add_argument('--duracao', type=float, default=10.0, help='Segundos medidos por estágio')
+    parser.add_argument('--aquecimento', type=float, default=2.0, help='Segundos descartados no início de cada estágio')
+    parser.add_argument('--variedade', type=int, default=50, help='Entradas distintas por tipo de cálculo')
+    parser.add_argument('--workers', type=int, default=1, help='Workers do gunicorn')
+    parser.add_argument('--threads', type=int, default=4, help='Threads por worker do gunicorn')
+    parser.add_argument('--latencia-chatbot', type=float, default=0.0, help='Latência simulada do chatbot local (s)')
+    parser.add_argument('--semente', type=int, default=1)
+    parser.add_argument('--saida', help='Arquivo JSON onde o relatório é gravado')
+    args = parser.parse_args(argumentos)
+
+    mistura = interpretar_mistura(args.mistura)
+    saida = os.path.abspath(args.saida) if args.saida else None
+    niveis = [int(n) for n in args.concorrencia.split(',') if n.strip()]
+    ambiente = {
+        'CHATBOT_BACKEND': 'local',
+        'CHATBOT_LOCAL_LATENCIA': str(args.latencia_chatbot),
+        'BACKUP_ATIVO': 'False',
+    }
+
+    pasta = tempfile.mkdtemp(prefix='calclab_carga_')
+    processo = None
+    try:
+        if args.url:
+            endereco = urllib.parse.urlsplit(args.url)
+            criar_cliente = lambda: ClienteHTTP(endereco.hostname, endereco.port or 80)  # noqa: E731
+            modo = 'url'
+        elif args.modo == 'gunicorn':
+            porta = _porta_livre()
+            processo = iniciar_gunicorn(pasta, porta, args.workers, args.threads, ambiente)
+            criar_cliente = lambda: ClienteHTTP('127.0.0.1', porta)  # noqa: E731
+            modo = 'gunicorn'
+        else:
+            # O app lê a configuração e abre o banco na importação
+            os.environ.update(ambiente)
+            os.chdir(pasta)
+            sys.path.insert(0, DIRETORIO_PROJETO)
+            from app import app
+            criar_cliente = lambda: ClienteFlask(app)  # noqa: E731
+            modo = 'cliente'
+
+        preparo = criar_cliente()
+        preparar_conta(preparo)
+        preparo.fechar()
+
+        estagios = []
+        for concorrencia in niveis:
+            estagio = executar_estagio(criar_cliente, mistura, concorrencia, args.duracao,
+                                       args.aquecimento, args.variedade, args.semente)
+            estagios.append(estagio)
+            _imprimir_estagio(estagio)
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait(timeout=10)
+        shutil.rmtree(pasta, ignore_errors=True)
+
+    ponto = saturacao(estagios)
+    if ponto is not None:
+        print(f'\nSaturação a partir de {ponto} usuários simultâneos '
+              f'(mais concorrência rendeu menos de 10% de vazão).')
+
+    if saida:
+        relatorio = {
+            'gerado_em': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'modo': modo,
+            'workers': args.workers if modo == 'gunicorn' else None,
+            'threads': args.threads if modo == 'gunicorn' else None,
+            'mistura': mistura,
+            'variedade': args.variedade,
+            'latencia_chatbot_s': args.latencia_chatbot,
+            'estagios': estagios,
+            'saturacao_concorrencia': ponto,
+        }
+        with open(saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    return 1 if any(estagio['taxa_erros'] > 0 for estagio in estagios) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
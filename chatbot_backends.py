@@ -0,0 +1,173 @@
+"""
+Backends do chatbot e execução com limite de tempo e de concorrência.
+
+O chatbot não fala direto com a OpenAI: ele entrega a pergunta a um
+``BackendChatbot`` por meio de um ``ExecutorChatbot``, que roda as chamadas num
+pool de threads com número máximo de chamadas simultâneas, fila limitada e
+tempo máximo de espera. O backend é escolhido por ``config.CHATBOT_BACKEND``:
+
+- ``openai``: API da OpenAI (cliente 1.x, com timeout próprio);
+- ``local``: resposta determinística montada a partir da análise da pergunta,
+  sem rede, para desenvolvimento e testes de carga.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+
+class ErroChatbot(Exception):
+    """Falha ao obter resposta do backend do chatbot."""
+
+
+class FilaCheia(ErroChatbot):
+    """Há chamadas demais em andamento ou aguardando na fila."""
+
+
+class TempoEsgotado(ErroChatbot):
+    """O backend não respondeu dentro do tempo limite."""
+
+
+class BackendChatbot:
+    """Interface dos backends: recebe a pergunta e devolve o texto da resposta."""
+
+    nome = ''
+
+    def responder(self, texto: str, contexto: str, analise: Dict) -> str:
+        """
+        Gera a resposta para a pergunta do usuário.
+
+        Args:
+            texto (str): Pergunta do usuário
+            contexto (str): Instruções de sistema montadas pelo chatbot
+            analise (Dict): Palavras-chave e calculadoras encontradas na pergunta
+
+        Returns:
+            str: Texto da resposta
+        """
+        raise NotImplementedError
+
+
+class BackendOpenAI(BackendChatbot):
+    """Backend que consulta a API de chat da OpenAI."""
+
+    nome = 'openai'
+
+    def __init__(self, modelo: str = 'gpt-3.5-turbo', timeout: float = 20.0,
+                 temperatura: float = 0.7, max_tokens: int = 500):
+        self.modelo = modelo
+        self.timeout = timeout
+        self.temperatura = temperatura
+        self.max_tokens = max_tokens
+        self._cliente = None
+        self._trava = threading.Lock()
+
+    def _obter_cliente(self):
+        # O pacote openai só é importado quando o backend é usado de fato
+        if self._cliente is None:
+            with self._trava:
+                if self._cliente is None:
+                    import openai
+                    self._cliente = openai.OpenAI(
+                        api_key=os.getenv('OPENAI_API_KEY'),
+                        timeout=self.timeout,
+                        max_retries=0,
+                    )
+        return self._cliente
+
+    def responder(self, texto: str, contexto: str, analise: Dict) -> str:
+        resposta = self._obter_cliente().chat.completions.create(
+            model=self.modelo,
+            messages=[
+                {"role": "system", "content": contexto},
+                {"role": "user", "content": texto}
+            ],
+            temperature=self.temperatura,
+            max_tokens=self.max_tokens
+        )
+        return resposta.choices[0].message.content.strip()
+
+
+class BackendLocal(BackendChatbot):
+    """Backend determinístico e sem rede, com latência simulada opcional."""
+
+    nome = 'local'
+
+    def __init__(self, latencia: float = 0.0):
+        self.latencia = latencia
+
+    def responder(self, texto: str, contexto: str, analise: Dict) -> str:
+        if self.latencia > 0:
+            time.sleep(self.latencia)
+        calculadoras = analise.get('calculators', [])
+        if not calculadoras:
+            return ("Não identifiquei uma calculadora específica para sua pergunta. "
+                    "Pode dizer quais grandezas você conhece e qual deseja calcular?")
+        principal = calculadoras[0]
+        resposta = (f"Use a calculadora {principal['name'].replace('_', ' ')} da área de "
+                    f"{principal['category']}, que trabalha com: {', '.join(principal['params'])}.")
+        outras = [calc['name'].replace('_', ' ') for calc in calculadoras[1:4]]
+        if outras:
+            resposta += f" Também podem ajudar: {', '.join(outras)}."
+        return resposta
+
+
+# Backends disponíveis por nome
+BACKENDS: Dict[str, Callable[..., BackendChatbot]] = {
+    BackendOpenAI.nome: BackendOpenAI,
+    BackendLocal.nome: BackendLocal,
+}
+
+
+def criar_backend(nome: str, **opcoes: Any) -> BackendChatbot:
+    """Instancia o backend pelo nome configurado."""
+    fabrica = BACKENDS.get(nome)
+    if fabrica is None:
+        raise ValueError(f"Backend de chatbot '{nome}' não encontrado. Opções: {', '.join(BACKENDS)}")
+    return fabrica(**opcoes)
+
+
+class ExecutorChatbot:
+    """Pool de threads com limite de concorrência, fila limitada e tempo máximo por chamada."""
+
+    def __init__(self, max_concorrencia: int = 4, max_fila: int = 16, timeout: float = 20.0):
+        """
+        Args:
+            max_concorrencia (int): Chamadas executando ao mesmo tempo
+            max_fila (int): Chamadas aguardando além das que estão executando
+            timeout (float): Segundos que quem chama espera pela resposta
+        """
+        if max_concorrencia <= 0:
+            raise ValueError("A concorrência máxima do chatbot deve ser positiva.")
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_concorrencia, thread_name_prefix='chatbot')
+        self._vagas = threading.BoundedSemaphore(max_concorrencia + max(max_fila, 0))
+
+    def executar(self, funcao: Callable[..., str], *args: Any, timeout: Optional[float] = None) -> str:
+        """
+        Executa a função no pool e espera o resultado até o tempo limite.
+
+        Raises:
+            FilaCheia: Se não houver vaga em execução nem na fila
+            TempoEsgotado: Se a resposta não chegar a tempo
+        """
+        if not self._vagas.acquire(blocking=False):
+            raise FilaCheia("O assistente está com muitas perguntas no momento.")
+        try:
+            futuro = self._pool.submit(funcao, *args)
+        except Exception:
+            self._vagas.release()
+            raise
+        # A vaga só é liberada quando a chamada termina, mesmo que ninguém espere por ela
+        futuro.add_done_callback(lambda _: self._vagas.release())
+        try:
+            return futuro.result(timeout=self.timeout if timeout is None else timeout)
+        except FuturesTimeoutError:
+            futuro.cancel()
+            raise TempoEsgotado("O assistente demorou demais para responder.")
+
+    def encerrar(self) -> None:
+        """Finaliza o pool sem esperar as chamadas pendentes."""
+        self._pool.shutdown(wait=False)
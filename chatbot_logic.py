@@ -2,42 +2,40 @@ from typing import Dict, List, Optional
 import re
 import json
 import os
-from datetime import datetime
-import openai
+import time
+import unicodedata
 from dotenv import load_dotenv
+import config
+import metricas
+from busca_calculadoras import IndiceCalculadoras, IndicePalavrasChave
+from cache import CacheLRU
+from chatbot_backends import ExecutorChatbot, FilaCheia, TempoEsgotado, criar_backend
+from historico_chat import HistoricoChat
 
 # Carrega variáveis de ambiente
 load_dotenv()
 
-# Configuração da API do OpenAI
-openai.api_key = os.getenv('OPENAI_API_KEY')
-
 class CalcLabChatbot:
     def __init__(self):
+        self.history = HistoricoChat(config.HISTORICO_CHAT_BANCO)
+        self.backend = criar_backend(config.CHATBOT_BACKEND, **config.CHATBOT_BACKEND_OPCOES.get(config.CHATBOT_BACKEND, {}))
+        self.executor = ExecutorChatbot(
+            max_concorrencia=config.CHATBOT_MAX_CONCORRENCIA,
+            max_fila=config.CHATBOT_MAX_FILA,
+            timeout=config.CHATBOT_TIMEOUT
+        )
+        # Respostas já geradas, sem personalização, compartilhadas entre usuários
+        self.response_cache = CacheLRU(config.CHATBOT_CACHE_TAMANHO, config.CHATBOT_CACHE_VALIDADE)
+        # Respostas dadas pelo recomendador local, sem chamar a IA
+        self.local_answers = 0
+        # Calculadoras disponíveis por área, com suas variáveis, a partir do catálogo completo
         self.calculators = {
-            'fisica': {
-                'velocidade_media': ['velocidade', 'deslocamento', 'tempo'],
-                'movimento_uniforme': ['posição', 'velocidade', 'tempo'],
-                'movimento_uniformemente_variado': ['posição', 'velocidade', 'aceleração', 'tempo'],
-                'forca_peso': ['massa', 'gravidade'],
-                'energia_cinetica': ['massa', 'velocidade'],
-                'energia_potencial': ['massa', 'altura', 'gravidade'],
-                'potencia': ['trabalho', 'tempo'],
-                'pressao': ['força', 'área'],
-                'lei_ohm': ['tensão', 'corrente', 'resistência']
-            },
-            'quimica': {
-                'concentracao': ['massa', 'volume', 'massa_molar'],
-                'ph': ['concentração', 'h+'],
-                'diluicao': ['concentração_inicial', 'volume_inicial', 'volume_final'],
-                'gases': ['pressão', 'volume', 'temperatura', 'mols']
-            },
-            'matematica': {
-                'equacao_segundo_grau': ['a', 'b', 'c'],
-                'trigonometria': ['ângulo', 'cateto', 'hipotenusa'],
-                'logaritmo': ['base', 'número'],
-                'matriz': ['dimensão', 'elementos']
+            area: {
+                calc_name: calc['variables']
+                for category in data['categories'].values()
+                for calc_name, calc in category['calculations'].items()
             }
+            for area, data in config.CALCULATORS.items()
         }
         
         self.keywords = {
@@ -49,71 +47,113 @@ class CalcLabChatbot:
             'química': ['concentração', 'ph', 'ácido', 'base', 'molar'],
             'matemática': ['equação', 'trigonometria', 'logaritmo', 'matriz']
         }
+        
+        # Índices montados uma vez para a análise das perguntas
+        self.calculator_index = IndiceCalculadoras(config.CALCULATORS)
+        self.keyword_index = IndicePalavrasChave(self.keywords)
+
+    def analyze_input(self, text: str, limit: int = 5) -> Dict:
+        """Analisa o texto de entrada e retorna recomendações ordenadas por relevância"""
+        suggestions = self.calculator_index.buscar(text, limit)
+        return {
+            'keywords': self.keyword_index.encontrar(text),
+            'calculators': [suggestion.como_dict() for suggestion in suggestions],
+            'confidence': self.calculator_index.confianca(text, suggestions)
+        }
+
+    def recommend(self, analysis: Dict) -> str:
+        """Monta a resposta de recomendação a partir da análise, sem consultar a IA"""
+        best = analysis['calculators'][0]
+        area = config.CALCULATORS[best['category']]['title']
+        response = (f"Para isso, use a calculadora \"{best['title']}\" na {area}. "
+                    f"Ela trabalha com: {', '.join(best['params'])}. "
+                    "Preencha os valores que você conhece e deixe em branco o que deseja calcular.")
+        others = [f"\"{calc['title']}\"" for calc in analysis['calculators'][1:3]]
+        if others:
+            response += f" Se não for bem isso, veja também {' ou '.join(others)}."
+        return response
+
+    @staticmethod
+    def normalize_question(text: str) -> str:
+        """Normaliza a pergunta para uso como chave de cache"""
+        text = unicodedata.normalize('NFKC', text).lower()
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text.rstrip('?!. ')
 
-    def analyze_input(self, text: str) -> Dict:
-        """Analisa o texto de entrada e retorna recomendações"""
-        text = text.lower()
+    def cache_key(self, text: str, analysis: Dict) -> tuple:
+        """Chave do cache: pergunta normalizada e resultado da análise"""
+        return (
+            self.normalize_question(text),
+            tuple(analysis['keywords']),
+            tuple(calc['name'] for calc in analysis['calculators'])
+        )
+
+    def cache_stats(self) -> Dict:
+        """Estatísticas do cache de respostas (acertos, falhas, taxa de acerto, ocupação)"""
+        return self.response_cache.estatisticas()
+
+    def answer_stats(self) -> Dict:
+        """Quantas respostas vieram do recomendador local e quantas passaram pelo cache/IA"""
+        cache = self.response_cache.estatisticas()
+        return {
+            'recomendador_local': self.local_answers,
+            'cache': cache['acertos'],
+            'backend': cache['falhas']
+        }
+
+    def _ask_backend(self, text: str, analysis: Dict) -> str:
+        """Monta o contexto e consulta o backend configurado"""
+        # Prepara o contexto para o ChatGPT
+        context = f"""Você é um assistente especializado em física, química e matemática.
+        Sua função é ajudar os usuários a escolher a calculadora correta do CalcLab.
         
-        # Identifica palavras-chave
-        found_keywords = []
-        for category, words in self.keywords.items():
-            for word in words:
-                if word in text:
-                    found_keywords.append(category)
-                    break
+        Calculadoras disponíveis:
+        {json.dumps(self.calculators, indent=2, ensure_ascii=False)}
         
-        # Encontra calculadoras relevantes
-        relevant_calculators = []
-        for category, calcs in self.calculators.items():
-            for calc_name, params in calcs.items():
-                if any(keyword in text for keyword in params):
-                    relevant_calculators.append({
-                        'category': category,
-                        'name': calc_name,
-                        'params': params
-                    })
+        Análise da pergunta do usuário:
+        Palavras-chave encontradas: {', '.join(analysis['keywords'])}
+        Calculadoras relevantes: {[calc['name'] for calc in analysis['calculators']]}
         
-        return {
-            'keywords': found_keywords,
-            'calculators': relevant_calculators
-        }
+        Usuário: {text}
+        
+        Responda de forma amigável e profissional, explicando qual calculadora usar e por quê.
+        Se precisar de mais informações, peça gentilmente.
+        """
+
+        # Chama o backend configurado no pool do chatbot, com tempo limite
+        start = time.perf_counter()
+        result = 'ok'
+        try:
+            return self.executor.executar(self.backend.responder, text, context, analysis)
+        except FilaCheia:
+            result = 'fila_cheia'
+            raise
+        except TempoEsgotado:
+            result = 'tempo_esgotado'
+            raise
+        except Exception:
+            result = 'erro'
+            raise
+        finally:
+            metricas.LATENCIA_CHATBOT.observar(time.perf_counter() - start, self.backend.nome, result)
 
     def generate_ai_response(self, text: str, user_name: Optional[str] = None) -> str:
-        """Gera uma resposta usando a API do ChatGPT"""
+        """Gera uma resposta usando o backend de IA configurado"""
         try:
             # Análise inicial do texto
             analysis = self.analyze_input(text)
             
-            # Prepara o contexto para o ChatGPT
-            context = f"""Você é um assistente especializado em física, química e matemática.
-            Sua função é ajudar os usuários a escolher a calculadora correta do CalcLab.
-            
-            Calculadoras disponíveis:
-            {json.dumps(self.calculators, indent=2, ensure_ascii=False)}
-            
-            Análise da pergunta do usuário:
-            Palavras-chave encontradas: {', '.join(analysis['keywords'])}
-            Calculadoras relevantes: {[calc['name'] for calc in analysis['calculators']]}
-            
-            Usuário: {text}
-            
-            Responda de forma amigável e profissional, explicando qual calculadora usar e por quê.
-            Se precisar de mais informações, peça gentilmente.
-            """
-
-            # Chama a API do ChatGPT
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": context},
-                    {"role": "user", "content": text}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-
-            # Processa a resposta
-            ai_response = response.choices[0].message.content.strip()
+            # Perguntas do tipo "qual calculadora uso" são respondidas localmente
+            if config.CHATBOT_RECOMENDADOR and analysis['confidence'] >= config.CHATBOT_RECOMENDADOR_CONFIANCA:
+                self.local_answers += 1
+                ai_response = self.recommend(analysis)
+            else:
+                # Reaproveita a resposta de uma pergunta equivalente
+                key = self.cache_key(text, analysis)
+                ai_response = self.response_cache.obter(key)
+                if ai_response is None:
+                    ai_response = self._ask_backend(text, analysis)
+                    self.response_cache.guardar(key, ai_response)
             
             # Personaliza a resposta com o nome do usuário
             if user_name:
@@ -121,6 +161,10 @@ class CalcLabChatbot:
             
             return ai_response
 
+        except FilaCheia:
+            return "O assistente está atendendo muitas pessoas agora. Tente novamente em alguns segundos."
+        except TempoEsgotado:
+            return "O assistente demorou demais para responder. Pode tentar novamente?"
         except Exception as e:
             print(f"Erro ao gerar resposta: {str(e)}")
             return "Desculpe, tive um problema ao processar sua pergunta. Pode tentar novamente?"
@@ -131,28 +175,11 @@ class CalcLabChatbot:
 
     def save_conversation(self, user_id: str, message: str, response: str):
         """Salva a conversa no histórico"""
-        history_file = 'chat_history.json'
-        
-        # Carrega histórico existente
-        if os.path.exists(history_file):
-            with open(history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-        else:
-            history = {}
-        
-        # Adiciona nova conversa
-        if user_id not in history:
-            history[user_id] = []
-        
-        history[user_id].append({
-            'timestamp': datetime.now().isoformat(),
-            'message': message,
-            'response': response
-        })
-        
-        # Salva histórico
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        self.history.registrar(user_id, message, response)
+
+    def get_history(self, user_id: str, limit: int = 50) -> List[Dict]:
+        """Retorna as últimas conversas do usuário"""
+        return self.history.historico(user_id, limit)
 
 # Instância global do chatbot
 chatbot = CalcLabChatbot() 
\ No newline at end of file
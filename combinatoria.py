@@ -0,0 +1,160 @@
+"""
+Análise combinatória com inteiros exatos ou em escala logarítmica.
+
+O modo exato usa aritmética inteira: ``math.factorial`` (que no CPython já
+multiplica por divisão binária dos fatores), ``math.perm`` e ``math.comb``,
+com uma tabela pré-calculada para os fatoriais pequenos. O modo aproximado
+usa ``math.lgamma`` e devolve o resultado em notação científica junto com o
+seu logaritmo, o que funciona para ``n`` muito grande em tempo constante.
+
+Antes de qualquer conta exata o tamanho do resultado é estimado pelo
+``lgamma``; acima de ``COMBINATORIA_MAX_DIGITOS`` o modo ``auto`` passa para o
+aproximado e o modo ``exato`` é recusado, para que uma única requisição não
+consuma segundos de CPU.
+"""
+
+import math
+from itertools import accumulate
+from operator import mul
+from typing import Any, Dict, List, Optional
+
+import config
+
+MODOS = ('auto', 'exato', 'aproximado')
+
+# Maior n aceito: acima disso o float recebido já não representa inteiros exatos
+_MAX_N = 2 ** 53
+
+_LN10 = math.log(10)
+
+# Fatoriais pequenos, calculados uma vez na importação
+_FATORIAIS: List[int] = list(accumulate(range(1, config.COMBINATORIA_MEMO + 1), mul, initial=1))
+
+
+def _inteiro(valor: Optional[float], nome: str) -> int:
+    """Converte o valor recebido (float após o registro) em inteiro não negativo."""
+    if valor is None:
+        raise ValueError(f"Informe {nome}.")
+    if not math.isfinite(valor) or valor != int(valor):
+        raise ValueError(f"{nome} deve ser um número inteiro.")
+    if valor < 0:
+        raise ValueError(f"{nome} não pode ser negativo.")
+    if valor > _MAX_N:
+        raise ValueError(f"{nome} deve ser no máximo {_MAX_N}.")
+    return int(valor)
+
+
+def fatorial_exato(n: int) -> int:
+    """n! exato, pela tabela para n pequeno."""
+    if n < len(_FATORIAIS):
+        return _FATORIAIS[n]
+    return math.factorial(n)
+
+
+def _log_fatorial(n: int) -> float:
+    return math.lgamma(n + 1)
+
+
+def _usar_modo_exato(modo: Optional[str], log_resultado: float) -> bool:
+    """Escolhe o modo conforme o pedido e o tamanho estimado do resultado (log natural)."""
+    modo = (modo or 'auto').strip().lower()
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: '{modo}'. Use um de {', '.join(MODOS)}.")
+    if modo == 'aproximado':
+        return False
+    cabe = log_resultado / _LN10 < config.COMBINATORIA_MAX_DIGITOS
+    if modo == 'exato' and not cabe:
+        raise ValueError(
+            f"O resultado teria mais de {config.COMBINATORIA_MAX_DIGITOS} dígitos; use o modo aproximado."
+        )
+    return cabe
+
+
+def _log10_inteiro(valor: int) -> float:
+    """log10 de um inteiro positivo de qualquer tamanho, pelos seus 64 bits mais altos."""
+    deslocamento = max(valor.bit_length() - 64, 0)
+    return math.log10(valor >> deslocamento) + deslocamento * math.log10(2)
+
+
+def _cientifica(log10_valor: float) -> str:
+    expoente = math.floor(log10_valor)
+    mantissa = 10 ** (log10_valor - expoente)
+    # Arredondar a mantissa pode levá-la a 10
+    if round(mantissa, 12) >= 10:
+        mantissa, expoente = mantissa / 10, expoente + 1
+    return f"{mantissa:.12f}e+{expoente}"
+
+
+def _digitos(valor: int) -> int:
+    """Número exato de dígitos: a estimativa pelo logaritmo é conferida com potências de 10."""
+    digitos = math.floor(_log10_inteiro(valor)) + 1
+    potencia = 10 ** (digitos - 1)
+    if valor < potencia:
+        return digitos - 1
+    if valor >= potencia * 10:
+        return digitos + 1
+    return digitos
+
+
+def _resultado_exato(chave: str, valor: int) -> Dict[str, Any]:
+    """Inteiros de até COMBINATORIA_DIGITOS_SAIDA dígitos saem inteiros; os maiores, em notação científica."""
+    if valor == 0:
+        return {chave: 0}
+    digitos = _digitos(valor)
+    if digitos <= config.COMBINATORIA_DIGITOS_SAIDA:
+        return {chave: valor}
+    # Os 13 primeiros dígitos exatos, arredondados pelo 14º
+    lider = (valor // 10 ** (digitos - 14) + 5) // 10
+    expoente = digitos - 1
+    if lider == 10 ** 13:
+        lider, expoente = lider // 10, expoente + 1
+    texto = str(lider)
+    return {chave: f"{texto[0]}.{texto[1:]}e+{expoente}", 'digitos': digitos}
+
+
+def _resultado_aproximado(chave: str, log_valor: float) -> Dict[str, Any]:
+    log10_valor = log_valor / _LN10
+    if log10_valor < 15:
+        # Ainda cabe num float; 12 algarismos significativos, a precisão do lgamma
+        return {chave: float(f'{math.exp(log_valor):.12g}'), f'log10_{chave}': log10_valor}
+    return {
+        chave: _cientifica(log10_valor),
+        f'log10_{chave}': log10_valor,
+        'digitos': math.floor(log10_valor) + 1,
+    }
+
+
+def fatorial(n: Optional[float], modo: Optional[str] = None) -> Dict[str, Any]:
+    """n!"""
+    n = _inteiro(n, 'n')
+    log_resultado = _log_fatorial(n)
+    if _usar_modo_exato(modo, log_resultado):
+        return _resultado_exato('n_fatorial', fatorial_exato(n))
+    return _resultado_aproximado('n_fatorial', log_resultado)
+
+
+def permutacao(n: Optional[float], k: Optional[float] = None,
+               modo: Optional[str] = None) -> Dict[str, Any]:
+    """P(n) = n! ou, com k, P(n, k) = n!/(n-k)!"""
+    n = _inteiro(n, 'n')
+    k = n if k is None else _inteiro(k, 'k')
+    if k > n:
+        raise ValueError('k não pode ser maior que n.')
+    log_resultado = _log_fatorial(n) - _log_fatorial(n - k)
+    if _usar_modo_exato(modo, log_resultado):
+        valor = fatorial_exato(n) if k == n else math.perm(n, k)
+        return _resultado_exato('pn', valor)
+    return _resultado_aproximado('pn', log_resultado)
+
+
+def combinacao(n: Optional[float], k: Optional[float],
+               modo: Optional[str] = None) -> Dict[str, Any]:
+    """C(n, k) = n!/(k!(n-k)!)"""
+    n = _inteiro(n, 'n')
+    k = _inteiro(k, 'k')
+    if k > n:
+        raise ValueError('k não pode ser maior que n.')
+    log_resultado = _log_fatorial(n) - _log_fatorial(k) - _log_fatorial(n - k)
+    if _usar_modo_exato(modo, log_resultado):
+        return _resultado_exato('cnk', math.comb(n, k))
+    return _resultado_aproximado('cnk', log_resultado)
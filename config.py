@@ -28,8 +28,12 @@ LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_FILE = "app.log"
 
 # Configurações de cache
-CACHE_TYPE = 'SimpleCache'
-CACHE_DEFAULT_TIMEOUT = 300
+CACHE_TYPE = os.getenv('CACHE_TYPE', 'SimpleCache')  # 'SimpleCache', 'SQLiteCache' (compartilhado) ou 'NullCache'
+CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300))
+CACHE_THRESHOLD = int(os.getenv('CACHE_THRESHOLD', 5000))  # Resultados de cálculos guardados
+CACHE_SQLITE_BANCO = os.getenv('CACHE_SQLITE_BANCO', 'cache_calculos.db')  # Arquivo do 'SQLiteCache'
+BALANCEAMENTO_CACHE_TAMANHO = int(os.getenv('BALANCEAMENTO_CACHE_TAMANHO', 2048))  # Equações em memória por processo
+BALANCEAMENTO_CACHE_BANCO = os.getenv('BALANCEAMENTO_CACHE_BANCO', 'calclab.db')  # Vazio desativa a persistência
 
 # Configurações de segurança
 SESSION_COOKIE_SECURE = True
@@ -45,10 +49,69 @@ ALLOWED_EXTENSIONS = {'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif'}
 # Configurações de API
 API_RATE_LIMIT = '100 per minute'
 API_RATE_LIMIT_STORAGE_URL = 'memory://'
+BATCH_MAX_ITENS = int(os.getenv('BATCH_MAX_ITENS', 500))  # Máximo de cálculos por lote
+VARREDURA_MAX_PONTOS = int(os.getenv('VARREDURA_MAX_PONTOS', 10000))  # Máximo de pontos por varredura
+AMOSTRAGEM_MAX_PONTOS = int(os.getenv('AMOSTRAGEM_MAX_PONTOS', 5000))  # Máximo de pontos por gráfico de função
+AMOSTRAGEM_PONTOS_PADRAO = int(os.getenv('AMOSTRAGEM_PONTOS_PADRAO', 256))  # Pontos quando a requisição não informa
+
+# Configurações de matrizes
+MATRIZ_MAX_DIMENSAO = int(os.getenv('MATRIZ_MAX_DIMENSAO', 1000))  # Máximo de linhas ou colunas
+MATRIZ_MAX_ELEMENTOS = int(os.getenv('MATRIZ_MAX_ELEMENTOS', 250000))  # Máximo de elementos por matriz (entrada ou resultado)
+MATRIZ_EXATA_MAX_DIMENSAO = int(os.getenv('MATRIZ_EXATA_MAX_DIMENSAO', 8))  # Até este tamanho, matrizes de inteiros usam aritmética exata
+MATRIZ_SAIDA_COMPACTA = int(os.getenv('MATRIZ_SAIDA_COMPACTA', 1024))  # Resultados com mais elementos saem como buffer base64
+
+# Configurações de análise combinatória
+COMBINATORIA_MAX_DIGITOS = int(os.getenv('COMBINATORIA_MAX_DIGITOS', 20000))  # Acima disso o resultado é calculado por lgamma
+COMBINATORIA_DIGITOS_SAIDA = int(os.getenv('COMBINATORIA_DIGITOS_SAIDA', 1000))  # Resultados exatos maiores saem em notação científica
+COMBINATORIA_MEMO = int(os.getenv('COMBINATORIA_MEMO', 256))  # Fatoriais pré-calculados na importação
+
+# Configurações do chatbot
+CHATBOT_BACKEND = os.getenv('CHATBOT_BACKEND', 'openai')  # 'openai' ou 'local' (sem rede)
+CHATBOT_TIMEOUT = float(os.getenv('CHATBOT_TIMEOUT', 20))  # Segundos de espera pela resposta
+CHATBOT_MAX_CONCORRENCIA = int(os.getenv('CHATBOT_MAX_CONCORRENCIA', 4))  # Chamadas simultâneas por processo
+CHATBOT_MAX_FILA = int(os.getenv('CHATBOT_MAX_FILA', 16))  # Chamadas aguardando vaga
+CHATBOT_CACHE_TAMANHO = int(os.getenv('CHATBOT_CACHE_TAMANHO', 1024))  # Respostas guardadas por processo
+CHATBOT_CACHE_VALIDADE = float(os.getenv('CHATBOT_CACHE_VALIDADE', 3600))  # Segundos até a resposta expirar
+CHATBOT_RECOMENDADOR = os.getenv('CHATBOT_RECOMENDADOR', 'True').lower() == 'true'  # Responde localmente quando possível
+CHATBOT_RECOMENDADOR_CONFIANCA = float(os.getenv('CHATBOT_RECOMENDADOR_CONFIANCA', 0.6))  # Confiança mínima (0 a 1)
+CHATBOT_BACKEND_OPCOES = {
+    'openai': {
+        'modelo': os.getenv('CHATBOT_MODELO', 'gpt-3.5-turbo'),
+        'timeout': CHATBOT_TIMEOUT,
+    },
+    'local': {
+        'latencia': float(os.getenv('CHATBOT_LOCAL_LATENCIA', 0)),  # Latência simulada em segundos
+    },
+}
+
+# Configurações de métricas
+METRICAS_ATIVAS = os.getenv('METRICAS_ATIVAS', 'True').lower() == 'true'  # Instrumentação e rota /metrics
+METRICAS_TOKEN = os.getenv('METRICAS_TOKEN', '')  # Se definido, /metrics exige "Authorization: Bearer <token>"
+
+# Configurações de inicialização
+PREAQUECER = os.getenv('PREAQUECER', 'False').lower() == 'true'  # Carrega módulos pesados na partida (gunicorn --preload)
+PREAQUECER_MODULOS = [m.strip() for m in os.getenv('PREAQUECER_MODULOS', 'numpy,calc_fisica_vetorizado,openai').split(',') if m.strip()]
+
+# Configurações de perfilamento
+PERFIL_ATIVO = os.getenv('PERFIL_ATIVO', 'False').lower() == 'true'  # Perfila por amostragem os cálculos
+PERFIL_AMOSTRAGEM = float(os.getenv('PERFIL_AMOSTRAGEM', 0.01))  # Fração das chamadas perfiladas (0 a 1)
+PERFIL_PASTA = os.getenv('PERFIL_PASTA', 'perfis')
+PERFIL_MANTER = int(os.getenv('PERFIL_MANTER', 200))  # Perfis mantidos na pasta
+PERFIL_FORMATO = os.getenv('PERFIL_FORMATO', 'prof')  # 'prof' (pstats) ou 'colapsado' (flamegraph)
 
 # Configurações de banco de dados
 SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///calclab.db')
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+BANCO_POOL_TAMANHO = int(os.getenv('BANCO_POOL_TAMANHO', 4))  # Conexões SQLite ociosas mantidas por processo
+BANCO_BUSY_TIMEOUT = int(os.getenv('BANCO_BUSY_TIMEOUT', 5000))  # Milissegundos de espera com o banco travado
+BANCO_MMAP_SIZE = int(os.getenv('BANCO_MMAP_SIZE', 64 * 1024 * 1024))  # Bytes mapeados em memória
+BACKUP_ATIVO = os.getenv('BACKUP_ATIVO', 'True').lower() == 'true'  # Backups periódicos em segundo plano
+BACKUP_INTERVALO_HORAS = float(os.getenv('BACKUP_INTERVALO_HORAS', 24))
+BACKUP_PASTA = os.getenv('BACKUP_PASTA', 'backups')
+BACKUP_COMPRIMIR = os.getenv('BACKUP_COMPRIMIR', 'False').lower() == 'true'  # Grava .db.gz
+BACKUP_MANTER = int(os.getenv('BACKUP_MANTER', 5))  # Backups mantidos na pasta
+ADMIN_USUARIOS_POR_PAGINA = int(os.getenv('ADMIN_USUARIOS_POR_PAGINA', 50))  # Usuários por página nas listagens
+HISTORICO_CHAT_BANCO = os.getenv('HISTORICO_CHAT_BANCO', 'calclab.db')  # Banco do histórico do chatbot
 
 # Configurações de tema
 THEME = {
@@ -225,17 +288,17 @@ CALCULATORS = {
                     'fatorial': {
                         'title': 'Fatorial [n! = n.(n-1).(n-2)...1]',
                         'description': 'Produto de todos os inteiros positivos até n.',
-                        'variables': ['n!', 'n']
+                        'variables': ['n', 'modo']
                     },
                     'permutacao_simples': {
-                        'title': 'Permutação Simples [P(n) = n!]',
+                        'title': 'Permutação Simples [P(n) = n!, P(n,k) = n!/(n-k)!]',
                         'description': 'Contagem de ordens possíveis.',
-                        'variables': ['pn', 'n!']
+                        'variables': ['n', 'k', 'modo']
                     },
                     'combinacao_simples': {
                         'title': 'Combinação Simples [C(n,k) = n!/k!(n-k)!]',
                         'description': 'Contagem de agrupamentos sem ordem.',
-                        'variables': ['cnk #', 'n!', 'n', 'k'] # ! VERIFICAR VARIÁVEIS
+                        'variables': ['n', 'k', 'modo']
                     },
                     'probabilidade': {
                         'title': 'Probabilidade [P = favoráveis/possíveis]',
@@ -251,12 +314,27 @@ CALCULATORS = {
                     'determinante_da_matriz': {
                         'title': 'Determinante da Matriz',
                         'description': 'Valor escalar associado à matriz.',
-                        'variables': ['#', '#', '#', '#'] # ! VERIFICAR VARIÁVEIS
+                        'variables': ['matriz', 'modo']
                     },
                     'multiplicacao_de_matriz': {
                         'title': 'Multiplicação de Matriz [Cij = n∑k=1 Aik.Bkj]',
                         'description': 'Produto entre duas matrizes.',
-                        'variables': ['#', '#', '#', '#'] # ! VERIFICAR VARIÁVEIS
+                        'variables': ['matriz_a', 'matriz_b', 'modo']
+                    },
+                    'inversa_da_matriz': {
+                        'title': 'Inversa da Matriz [A.A⁻¹ = I]',
+                        'description': 'Matriz que multiplicada pela original resulta na identidade.',
+                        'variables': ['matriz', 'modo']
+                    },
+                    'posto_da_matriz': {
+                        'title': 'Posto da Matriz',
+                        'description': 'Número de linhas linearmente independentes.',
+                        'variables': ['matriz', 'modo']
+                    },
+                    'sistema_linear': {
+                        'title': 'Sistema Linear [A.x = b]',
+                        'description': 'Solução de um sistema de equações lineares.',
+                        'variables': ['matriz', 'vetor_b', 'modo']
                     },
                 }
             },
@@ -0,0 +1,76 @@
+"""
+Exportação da tabela de usuários em CSV e JSON Lines.
+
+As linhas são lidas do cursor SQLite em lotes (``fetchmany``) e emitidas por
+geradores, então a memória usada não depende do tamanho da tabela. A senha
+nunca é exportada.
+"""
+
+import csv
+import io
+import json
+import sqlite3
+from typing import Callable, ContextManager, Iterator, List, Sequence, Tuple
+
+# Colunas exportadas, na ordem do arquivo
+COLUNAS = (
+    'id', 'nome_usuario', 'email', 'nome_completo', 'data_nascimento',
+    'serie', 'materia_dificuldade', 'is_admin', 'created_at',
+)
+
+# Linhas lidas do banco por vez
+TAMANHO_LOTE = 500
+
+
+def _lotes(conectar: Callable[[], ContextManager[sqlite3.Connection]],
+           colunas: Sequence[str]) -> Iterator[List[Tuple]]:
+    """Percorre a tabela em lotes usando uma conexão própria, liberada ao final."""
+    with conectar() as db:
+        cursor = db.execute(f"SELECT {', '.join(colunas)} FROM usuarios ORDER BY id")
+        try:
+            while True:
+                lote = cursor.fetchmany(TAMANHO_LOTE)
+                if not lote:
+                    break
+                yield [tuple(linha) for linha in lote]
+        finally:
+            cursor.close()
+
+
+def gerar_csv(conectar: Callable[[], ContextManager[sqlite3.Connection]],
+              colunas: Sequence[str] = COLUNAS) -> Iterator[str]:
+    """
+    Gera o CSV da tabela de usuários, um lote por vez.
+
+    Args:
+        conectar (Callable): Fábrica de conexões (ex.: ``PoolConexoes.conexao``)
+        colunas (Sequence[str]): Colunas exportadas
+
+    Returns:
+        Iterator[str]: Trechos do arquivo CSV
+    """
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(colunas)
+    for lote in _lotes(conectar, colunas):
+        escritor.writerows(lote)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def gerar_jsonl(conectar: Callable[[], ContextManager[sqlite3.Connection]],
+                colunas: Sequence[str] = COLUNAS) -> Iterator[str]:
+    """
+    Gera a tabela de usuários em JSON Lines (um objeto por linha), um lote por vez.
+
+    Args:
+        conectar (Callable): Fábrica de conexões (ex.: ``PoolConexoes.conexao``)
+        colunas (Sequence[str]): Colunas exportadas
+
+    Returns:
+        Iterator[str]: Trechos do arquivo JSON Lines
+    """
+    for lote in _lotes(conectar, colunas):
+        yield ''.join(json.dumps(dict(zip(colunas, linha)), ensure_ascii=False) + '\n' for linha in lote)
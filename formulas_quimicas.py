@@ -0,0 +1,144 @@
+"""
+Interpretação de fórmulas químicas com cache.
+
+Um único parser para todo o módulo de química: decompõe a fórmula em
+contagem de átomos por elemento e calcula a massa molar a partir de
+``tabela_massa``. Os resultados ficam num cache LRU limitado, indexado pela
+fórmula, já que os mesmos compostos (H2O, CO2, NaCl...) se repetem o tempo todo.
+
+Suporta parênteses e colchetes com índice (``Ca(OH)2``, ``K4[Fe(CN)6]``) e
+hidratos separados por ``·``, ``.`` ou ``*`` com coeficiente (``CuSO4·5H2O``).
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+from dicionario_quimica import tabela_massa
+
+# Número máximo de fórmulas mantidas no cache
+TAMANHO_CACHE = 1024
+
+_TOKEN = re.compile(r'([A-Z][a-z]?)|(\d+)|([(\[])|([)\]])|(\s+)')
+_SEPARADOR_HIDRATO = re.compile(r'[·•.*]')
+_COEFICIENTE = re.compile(r'^\s*(\d*)\s*(.+?)\s*$')
+_FECHAMENTO = {'(': ')', '[': ']'}
+
+
+class Composicao(NamedTuple):
+    """Resultado da interpretação de uma fórmula química."""
+    # Pares (elemento, quantidade) na ordem em que os elementos aparecem
+    elementos: Tuple[Tuple[str, int], ...]
+    # None quando algum elemento não está em tabela_massa
+    massa_molar: Optional[float]
+
+    @property
+    def contagem(self) -> Dict[str, int]:
+        """Contagem de átomos por elemento como dicionário."""
+        return dict(self.elementos)
+
+
+def separar_coeficiente(termo: str) -> Tuple[int, str]:
+    """Separa o coeficiente estequiométrico inicial de um termo como '2H2O'."""
+    match = _COEFICIENTE.match(termo)
+    if not match or not match.group(2):
+        raise ValueError(f"Fórmula química inválida: '{termo}'")
+    coeficiente = int(match.group(1)) if match.group(1) else 1
+    return coeficiente, match.group(2)
+
+
+def _somar(destino: Dict[str, int], origem: Dict[str, int], fator: int) -> None:
+    for elemento, quantidade in origem.items():
+        destino[elemento] = destino.get(elemento, 0) + quantidade * fator
+
+
+def _interpretar_parte(parte: str, formula: str) -> Dict[str, int]:
+    """Interpreta uma fórmula sem separadores de hidrato."""
+    pilha = [({}, None)]
+    ultimo: Optional[Dict[str, int]] = None  # grupo ao qual o próximo índice se aplica
+    posicao = 0
+    while posicao < len(parte):
+        match = _TOKEN.match(parte, posicao)
+        if not match:
+            raise ValueError(f"Fórmula química inválida: '{formula}'")
+        elemento, numero, abre, fecha, _ = match.groups()
+        atual = pilha[-1][0]
+        if elemento:
+            ultimo = {elemento: 1}
+            _somar(atual, ultimo, 1)
+        elif numero:
+            if ultimo is None:
+                raise ValueError(f"Fórmula química inválida: '{formula}'")
+            # O grupo já foi somado uma vez; soma as cópias restantes
+            _somar(atual, ultimo, int(numero) - 1)
+            ultimo = None
+        elif abre:
+            pilha.append(({}, abre))
+            ultimo = None
+        elif fecha:
+            grupo, abertura = pilha.pop() if len(pilha) > 1 else ({}, None)
+            if abertura is None or _FECHAMENTO[abertura] != fecha:
+                raise ValueError(f"Parênteses desbalanceados na fórmula '{formula}'")
+            ultimo = grupo
+            _somar(pilha[-1][0], grupo, 1)
+        posicao = match.end()
+    if len(pilha) != 1:
+        raise ValueError(f"Parênteses desbalanceados na fórmula '{formula}'")
+    return pilha[0][0]
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def composicao(formula: str) -> Composicao:
+    """
+    Decompõe uma fórmula química e calcula sua massa molar.
+
+    Args:
+        formula (str): Fórmula química, como 'H2O', 'Ca(OH)2' ou 'CuSO4·5H2O'
+
+    Returns:
+        Composicao: Contagem de átomos por elemento e massa molar em g/mol
+    """
+    if not isinstance(formula, str) or not formula.strip():
+        raise ValueError("A fórmula química não pode estar vazia.")
+
+    contagem: Dict[str, int] = {}
+    for parte in _SEPARADOR_HIDRATO.split(formula.strip()):
+        coeficiente, parte = separar_coeficiente(parte)
+        _somar(contagem, _interpretar_parte(parte, formula), coeficiente)
+    if not contagem:
+        raise ValueError(f"Fórmula química inválida: '{formula}'")
+
+    if all(elemento in tabela_massa for elemento in contagem):
+        massa = sum(tabela_massa[elemento] * quantidade for elemento, quantidade in contagem.items())
+    else:
+        massa = None
+    return Composicao(tuple(contagem.items()), massa)
+
+
+def contagem_elementos(formula: str) -> Dict[str, int]:
+    """Retorna a contagem de átomos por elemento de uma fórmula."""
+    return composicao(formula).contagem
+
+
+def massa_molar(formula: str) -> float:
+    """Retorna a massa molar da fórmula em g/mol, validando os elementos."""
+    resultado = composicao(formula)
+    if resultado.massa_molar is None:
+        desconhecido = next(elemento for elemento, _ in resultado.elementos if elemento not in tabela_massa)
+        raise ValueError(f"O elemento '{desconhecido}' não foi encontrado na tabela periódica ou foi escrito incorretamente.")
+    return resultado.massa_molar
+
+
+def estatisticas_cache() -> Dict[str, int]:
+    """Acertos, falhas e ocupação do cache de fórmulas."""
+    info = composicao.cache_info()
+    return {
+        'acertos': info.hits,
+        'falhas': info.misses,
+        'tamanho': info.currsize,
+        'capacidade': info.maxsize,
+    }
+
+
+def limpar_cache() -> None:
+    """Esvazia o cache de fórmulas."""
+    composicao.cache_clear()
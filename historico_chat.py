@@ -0,0 +1,199 @@
+"""
+Histórico de conversas do chatbot em SQLite.
+
+Cada mensagem é uma linha da tabela ``chat_messages`` (só inserções), com
+índice por usuário para ler o histórico de uma pessoa sem varrer o resto.
+O antigo ``chat_history.json`` é importado uma única vez e renomeado para
+``chat_history.json.migrado``. A importação pode ser feita explicitamente,
+antes de subir os workers:
+
+    python historico_chat.py --migrar
+
+Se não for, ela acontece no primeiro uso. Nos dois casos roda dentro de uma
+transação ``BEGIN IMMEDIATE``, cuja trava de escrita do SQLite vale entre
+processos, e grava uma marca em ``chat_migracoes``; assim vários workers do
+gunicorn podem tentar ao mesmo tempo sem duplicar o histórico.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Arquivo usado pelas versões anteriores
+ARQUIVO_JSON_ANTIGO = 'chat_history.json'
+
+_ESQUEMA = (
+    'CREATE TABLE IF NOT EXISTS chat_messages ('
+    'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+    'user_id TEXT NOT NULL, '
+    'timestamp TEXT NOT NULL, '
+    'message TEXT NOT NULL, '
+    'response TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS idx_chat_messages_user_id ON chat_messages (user_id, id)',
+    # Arquivos JSON já importados
+    'CREATE TABLE IF NOT EXISTS chat_migracoes (arquivo TEXT PRIMARY KEY, migrado_em TEXT NOT NULL)',
+)
+
+
+class HistoricoChat:
+    """Armazena e consulta as conversas do chatbot."""
+
+    def __init__(self, caminho_banco: str, arquivo_json: Optional[str] = ARQUIVO_JSON_ANTIGO):
+        """
+        Args:
+            caminho_banco (str): Caminho do banco SQLite
+            arquivo_json (Optional[str]): Histórico antigo a importar (None = não importar)
+        """
+        self.caminho_banco = caminho_banco
+        self.arquivo_json = arquivo_json
+        self._preparado = False
+        self._trava = threading.Lock()
+
+    def _conectar(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.caminho_banco, timeout=10)
+        db.row_factory = sqlite3.Row
+        return db
+
+    def _preparar(self) -> None:
+        """Cria as tabelas e migra o JSON antigo na primeira utilização."""
+        if self._preparado:
+            return
+        with self._trava:
+            if not self._preparado:
+                self.migrar()
+
+    def migrar(self) -> int:
+        """
+        Cria as tabelas e importa o JSON antigo, se ainda não foi importado.
+
+        Returns:
+            int: Número de mensagens importadas (0 se não havia o que migrar)
+        """
+        db = self._conectar()
+        try:
+            with db:
+                for comando in _ESQUEMA:
+                    db.execute(comando)
+            importadas = self._migrar_json(db) if self.arquivo_json else 0
+        finally:
+            db.close()
+        self._preparado = True
+        return importadas
+
+    def _migrar_json(self, db: sqlite3.Connection) -> int:
+        """Importa o histórico do arquivo JSON uma única vez, mesmo com vários processos."""
+        marca = os.path.abspath(self.arquivo_json)
+        db.isolation_level = None
+        # A trava de escrita vale entre processos: quem chegar depois espera e
+        # encontra a marca gravada por quem migrou primeiro
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            ja_migrado = db.execute('SELECT 1 FROM chat_migracoes WHERE arquivo = ?', (marca,)).fetchone()
+            if not ja_migrado and not os.path.exists(self.arquivo_json):
+                db.execute('ROLLBACK')
+                return 0
+            importadas = 0 if ja_migrado else self._importar(db, marca)
+            if importadas is None:
+                # Arquivo ilegível: fica onde está para ser corrigido e migrado depois
+                db.execute('ROLLBACK')
+                return 0
+            db.execute('COMMIT')
+        except BaseException:
+            if db.in_transaction:
+                db.execute('ROLLBACK')
+            raise
+        finally:
+            db.isolation_level = ''
+
+        # O arquivo só é renomeado depois do COMMIT; outro processo pode já tê-lo renomeado
+        try:
+            os.replace(self.arquivo_json, self.arquivo_json + '.migrado')
+        except FileNotFoundError:
+            pass
+        if ja_migrado:
+            return 0
+        logger.info(f"{importadas} mensagens migradas de {self.arquivo_json} para {self.caminho_banco}")
+        return importadas
+
+    def _importar(self, db: sqlite3.Connection, marca: str) -> Optional[int]:
+        """Insere as mensagens do JSON e grava a marca, dentro da transação aberta (None se o arquivo for ilegível)."""
+        try:
+            with open(self.arquivo_json, 'r', encoding='utf-8') as f:
+                historico = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Não foi possível ler {self.arquivo_json} para migração: {e}")
+            return None
+
+        linhas = [
+            (str(user_id), item.get('timestamp', ''), item.get('message', ''), item.get('response', ''))
+            for user_id, itens in historico.items()
+            for item in itens
+        ]
+        # Ordena por horário para manter a ordem de inserção coerente com o id
+        linhas.sort(key=lambda linha: linha[1])
+        db.executemany(
+            'INSERT INTO chat_messages (user_id, timestamp, message, response) VALUES (?, ?, ?, ?)',
+            linhas
+        )
+        db.execute('INSERT INTO chat_migracoes (arquivo, migrado_em) VALUES (?, ?)',
+                   (marca, datetime.now().isoformat()))
+        return len(linhas)
+
+    def registrar(self, user_id: str, message: str, response: str) -> None:
+        """Acrescenta uma mensagem ao histórico do usuário."""
+        self._preparar()
+        db = self._conectar()
+        try:
+            with db:
+                db.execute(
+                    'INSERT INTO chat_messages (user_id, timestamp, message, response) VALUES (?, ?, ?, ?)',
+                    (str(user_id), datetime.now().isoformat(), message, response)
+                )
+        finally:
+            db.close()
+
+    def historico(self, user_id: str, limite: int = 50) -> List[Dict[str, str]]:
+        """
+        Retorna as mensagens mais recentes de um usuário, da mais antiga para a mais nova.
+
+        Args:
+            user_id (str): Identificador do usuário
+            limite (int): Número máximo de mensagens
+
+        Returns:
+            List[Dict[str, str]]: Mensagens com timestamp, message e response
+        """
+        self._preparar()
+        db = self._conectar()
+        try:
+            linhas = db.execute(
+                'SELECT timestamp, message, response FROM chat_messages '
+                'WHERE user_id = ? ORDER BY id DESC LIMIT ?',
+                (str(user_id), limite)
+            ).fetchall()
+        finally:
+            db.close()
+        return [dict(linha) for linha in reversed(linhas)]
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import config
+
+    parser = argparse.ArgumentParser(description='Histórico de conversas do chatbot.')
+    parser.add_argument('--migrar', action='store_true',
+                        help=f'Importa {ARQUIVO_JSON_ANTIGO} para o banco (pode ser repetido sem duplicar)')
+    args = parser.parse_args()
+    if not args.migrar:
+        parser.print_help()
+    else:
+        logging.basicConfig(level=logging.INFO)
+        total = HistoricoChat(config.HISTORICO_CHAT_BANCO).migrar()
+        print(f"{total} mensagens importadas.")
@@ -0,0 +1,351 @@
+"""
+Operações com matrizes para a calculadora de matemática.
+
+As matrizes chegam como listas aninhadas (``[[1, 2], [3, 4]]``), como texto
+(JSON ou linhas separadas por ``;``) ou como um buffer compacto em ordem de
+linhas::
+
+    {"forma": [2, 2], "tipo": "float64", "dados": "<base64>"}
+
+onde ``dados`` também pode ser uma lista plana. O buffer é lido direto para um
+array com ``numpy.frombuffer``, e resultados grandes voltam no mesmo formato,
+então matrizes grandes não passam por listas Python em nenhum dos sentidos.
+
+As dimensões são validadas antes de qualquer conversão. O modo numérico usa
+``numpy.linalg``; matrizes pequenas de inteiros são resolvidas em aritmética
+exata (Bareiss para o determinante, Gauss-Jordan com ``Fraction`` para
+inversa, posto e sistemas), evitando resultados como ``-2.0000000000000004``.
+"""
+
+import base64
+import binascii
+import json
+from fractions import Fraction
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+import config
+
+Entrada = Union[str, List[Any], Dict[str, Any]]
+Exata = List[List[Fraction]]
+
+MODOS = ('auto', 'numerico', 'exato')
+
+# Tipos aceitos no buffer compacto (sempre little-endian)
+TIPOS_BUFFER = {
+    'float64': np.dtype('<f8'),
+    'float32': np.dtype('<f4'),
+    'int64': np.dtype('<i8'),
+    'int32': np.dtype('<i4'),
+}
+
+# Maior inteiro que um float64 representa sem perda
+_MAX_INTEIRO_EXATO = 2.0 ** 53
+
+# Logaritmo natural do maior float64
+_MAX_LOG_FLOAT = float(np.log(np.finfo(np.float64).max))
+
+
+def _validar_forma(forma: Sequence[int], nome: str, permitir_vetor: bool) -> Tuple[int, ...]:
+    """Confere número de dimensões, tamanhos e total de elementos."""
+    if len(forma) not in ((1, 2) if permitir_vetor else (2,)):
+        esperado = 'um vetor ou uma matriz' if permitir_vetor else 'uma matriz (lista de linhas)'
+        raise ValueError(f"'{nome}' deve ser {esperado}.")
+    if any(not isinstance(d, int) or isinstance(d, bool) or d < 1 for d in forma):
+        raise ValueError(f"'{nome}' tem dimensões inválidas: {list(forma)}.")
+    if max(forma) > config.MATRIZ_MAX_DIMENSAO:
+        raise ValueError(f"'{nome}' excede o limite de {config.MATRIZ_MAX_DIMENSAO} linhas ou colunas.")
+    total = 1
+    for d in forma:
+        total *= d
+    if total > config.MATRIZ_MAX_ELEMENTOS:
+        raise ValueError(f"'{nome}' excede o limite de {config.MATRIZ_MAX_ELEMENTOS} elementos.")
+    return tuple(forma)
+
+
+def _forma_aninhada(valor: List[Any], nome: str, permitir_vetor: bool) -> Tuple[int, ...]:
+    """Determina a forma de uma lista aninhada olhando só o comprimento das linhas."""
+    if not valor:
+        raise ValueError(f"'{nome}' está vazia.")
+    if not isinstance(valor[0], (list, tuple)):
+        return _validar_forma((len(valor),), nome, permitir_vetor)
+    colunas = len(valor[0])
+    for i, linha in enumerate(valor):
+        if not isinstance(linha, (list, tuple)) or len(linha) != colunas:
+            raise ValueError(f"'{nome}' não é retangular: a linha {i + 1} difere da primeira.")
+    return _validar_forma((len(valor), colunas), nome, permitir_vetor)
+
+
+def _ler_buffer(valor: Dict[str, Any], nome: str, permitir_vetor: bool) -> np.ndarray:
+    """Lê o formato compacto ``{"forma", "tipo", "dados"}``."""
+    forma = valor.get('forma')
+    if not isinstance(forma, (list, tuple)):
+        raise ValueError(f"'{nome}': o buffer precisa de 'forma', por exemplo [linhas, colunas].")
+    forma = _validar_forma(forma, nome, permitir_vetor)
+    tipo = TIPOS_BUFFER.get(valor.get('tipo', 'float64'))
+    if tipo is None:
+        raise ValueError(f"'{nome}': tipo de buffer inválido. Use um de {', '.join(TIPOS_BUFFER)}.")
+    total = int(np.prod(forma))
+    dados = valor.get('dados')
+
+    if isinstance(dados, str):
+        # O tamanho é conferido no texto, antes de decodificar
+        esperado = 4 * -(-total * tipo.itemsize // 3)
+        if len(dados) != esperado:
+            raise ValueError(f"'{nome}': o buffer não corresponde à forma {list(forma)} ({tipo.name}).")
+        try:
+            bruto = base64.b64decode(dados, validate=True)
+        except (binascii.Error, ValueError):
+            raise ValueError(f"'{nome}': dados em base64 inválidos.")
+        return np.frombuffer(bruto, dtype=tipo, count=total).reshape(forma)
+
+    if isinstance(dados, list):
+        if len(dados) != total:
+            raise ValueError(f"'{nome}': {len(dados)} valores não preenchem a forma {list(forma)}.")
+        return np.asarray(dados, dtype=tipo).reshape(forma)
+
+    raise ValueError(f"'{nome}': 'dados' deve ser uma lista plana ou texto em base64.")
+
+
+def _ler_texto(texto: str) -> Union[List[Any], Dict[str, Any]]:
+    """Aceita JSON ou linhas separadas por ';' (ou quebras de linha) com valores separados por espaço ou vírgula."""
+    texto = texto.strip()
+    if texto[:1] in '[{':
+        try:
+            return json.loads(texto)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e}")
+    linhas = [linha for linha in texto.replace('\n', ';').split(';') if linha.strip()]
+    return [linha.replace(',', ' ').split() for linha in linhas]
+
+
+def ler_matriz(valor: Entrada, nome: str = 'matriz', permitir_vetor: bool = False) -> np.ndarray:
+    """
+    Converte a entrada recebida em um array NumPy, validando as dimensões primeiro.
+
+    Args:
+        valor (Entrada): Lista aninhada, texto ou buffer compacto
+        nome (str): Nome do campo, usado nas mensagens de erro
+        permitir_vetor (bool): Aceita também um vetor (uma dimensão)
+
+    Returns:
+        np.ndarray: Array de uma ou duas dimensões com valores finitos
+    """
+    if isinstance(valor, str):
+        try:
+            valor = _ler_texto(valor)
+        except ValueError as e:
+            raise ValueError(f"'{nome}': {e}")
+
+    if isinstance(valor, dict):
+        array = _ler_buffer(valor, nome, permitir_vetor)
+    elif isinstance(valor, (list, tuple)):
+        forma = _forma_aninhada(valor, nome, permitir_vetor)
+        try:
+            array = np.asarray(valor)
+            if array.dtype.kind in 'OSU':
+                array = array.astype(float)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"'{nome}' contém valores não numéricos.")
+        if array.shape != forma:
+            raise ValueError(f"'{nome}' não é retangular.")
+    else:
+        raise ValueError(f"'{nome}' deve ser uma lista de linhas, um texto ou um buffer compacto.")
+
+    if array.dtype.kind not in 'iuf':
+        raise ValueError(f"'{nome}' contém valores não numéricos.")
+    if array.dtype.kind == 'f' and not np.isfinite(array).all():
+        raise ValueError(f"'{nome}' contém valores infinitos ou NaN.")
+    return array
+
+
+def _inteira(array: np.ndarray) -> bool:
+    if array.dtype.kind in 'iu':
+        return True
+    return bool(np.all(np.abs(array) < _MAX_INTEIRO_EXATO) and np.all(array == np.trunc(array)))
+
+
+def usar_modo_exato(modo: Optional[str], *arrays: np.ndarray) -> bool:
+    """
+    Decide entre aritmética exata e numérica.
+
+    Em ``auto`` o modo exato é usado quando todas as entradas são inteiras e
+    nenhuma dimensão passa de ``MATRIZ_EXATA_MAX_DIMENSAO``; em ``exato`` essas
+    condições são obrigatórias.
+    """
+    modo = (modo or 'auto').strip().lower()
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: '{modo}'. Use um de {', '.join(MODOS)}.")
+    if modo == 'numerico':
+        return False
+    inteiras = all(_inteira(a) for a in arrays)
+    pequenas = all(max(a.shape) <= config.MATRIZ_EXATA_MAX_DIMENSAO for a in arrays)
+    if modo == 'exato' and not inteiras:
+        raise ValueError('O modo exato aceita apenas matrizes de inteiros.')
+    if modo == 'exato' and not pequenas:
+        raise ValueError(f"O modo exato aceita até {config.MATRIZ_EXATA_MAX_DIMENSAO} linhas ou colunas.")
+    return inteiras and pequenas
+
+
+def _para_exata(array: np.ndarray) -> Exata:
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    return [[Fraction(int(x)) for x in linha] for linha in array.tolist()]
+
+
+def _valor_exato(valor: Fraction) -> Union[int, str]:
+    """Inteiros saem como número; frações como texto 'p/q'."""
+    return valor.numerator if valor.denominator == 1 else str(valor)
+
+
+def _saida_exata(linhas: Exata, vetor: bool = False) -> List[Any]:
+    if vetor:
+        return [_valor_exato(linha[0]) for linha in linhas]
+    return [[_valor_exato(x) for x in linha] for linha in linhas]
+
+
+def buffer_compacto(array: np.ndarray) -> Dict[str, Any]:
+    """Codifica o array no formato compacto (float64 little-endian em base64, ordem de linhas)."""
+    array = np.ascontiguousarray(array, dtype='<f8')
+    return {
+        'forma': list(array.shape),
+        'tipo': 'float64',
+        'dados': base64.b64encode(array.tobytes()).decode('ascii'),
+    }
+
+
+def saida_numerica(array: np.ndarray) -> Union[List[Any], Dict[str, Any]]:
+    """Listas aninhadas para resultados pequenos; buffer compacto acima de MATRIZ_SAIDA_COMPACTA."""
+    if array.size <= config.MATRIZ_SAIDA_COMPACTA:
+        return array.tolist()
+    return buffer_compacto(array)
+
+
+def _exigir_quadrada(array: np.ndarray, nome: str = 'matriz') -> None:
+    if array.ndim != 2 or array.shape[0] != array.shape[1]:
+        raise ValueError(f"'{nome}' deve ser quadrada; recebida {'x'.join(map(str, array.shape))}.")
+
+
+def _determinante_bareiss(linhas: Exata) -> Fraction:
+    """Determinante pelo algoritmo de Bareiss: eliminação sem frações, todas as divisões são exatas."""
+    a = [linha[:] for linha in linhas]
+    n = len(a)
+    sinal, anterior = 1, Fraction(1)
+    for k in range(n - 1):
+        if a[k][k] == 0:
+            troca = next((i for i in range(k + 1, n) if a[i][k] != 0), None)
+            if troca is None:
+                return Fraction(0)
+            a[k], a[troca] = a[troca], a[k]
+            sinal = -sinal
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                a[i][j] = (a[i][j] * a[k][k] - a[i][k] * a[k][j]) / anterior
+        anterior = a[k][k]
+    return sinal * a[-1][-1]
+
+
+def _escalonar(linhas: Exata, colunas: int) -> Tuple[Exata, int]:
+    """
+    Forma escalonada reduzida (Gauss-Jordan) sobre as primeiras ``colunas`` colunas.
+
+    Returns:
+        Tuple[Exata, int]: Matriz reduzida e número de pivôs encontrados
+    """
+    a = [linha[:] for linha in linhas]
+    pivo = 0
+    for coluna in range(colunas):
+        escolhida = next((i for i in range(pivo, len(a)) if a[i][coluna] != 0), None)
+        if escolhida is None:
+            continue
+        a[pivo], a[escolhida] = a[escolhida], a[pivo]
+        fator = a[pivo][coluna]
+        a[pivo] = [x / fator for x in a[pivo]]
+        for i in range(len(a)):
+            if i != pivo and a[i][coluna] != 0:
+                multiplo = a[i][coluna]
+                a[i] = [x - multiplo * y for x, y in zip(a[i], a[pivo])]
+        pivo += 1
+        if pivo == len(a):
+            break
+    return a, pivo
+
+
+def determinante(valor: Entrada, modo: Optional[str] = None) -> Union[int, float, str]:
+    """Determinante de uma matriz quadrada."""
+    a = ler_matriz(valor)
+    _exigir_quadrada(a)
+    if usar_modo_exato(modo, a):
+        return _valor_exato(_determinante_bareiss(_para_exata(a)))
+    # slogdet evita o estouro silencioso para infinito de det em matrizes grandes
+    sinal, logaritmo = np.linalg.slogdet(a)
+    if sinal == 0:
+        return 0.0
+    if logaritmo > _MAX_LOG_FLOAT:
+        raise ValueError(f"O determinante (cerca de 10^{logaritmo / np.log(10):.0f}) excede o intervalo de um float.")
+    return float(sinal * np.exp(logaritmo))
+
+
+def multiplicar(valor_a: Entrada, valor_b: Entrada,
+                modo: Optional[str] = None) -> Union[List[Any], Dict[str, Any]]:
+    """Produto A·B; B pode ser um vetor."""
+    a = ler_matriz(valor_a, 'matriz_a')
+    b = ler_matriz(valor_b, 'matriz_b', permitir_vetor=True)
+    if a.shape[1] != b.shape[0]:
+        raise ValueError(f"Dimensões incompatíveis: A é {a.shape[0]}x{a.shape[1]} e B tem {b.shape[0]} linhas.")
+    if a.shape[0] * (b.shape[1] if b.ndim == 2 else 1) > config.MATRIZ_MAX_ELEMENTOS:
+        raise ValueError(f"O produto excede o limite de {config.MATRIZ_MAX_ELEMENTOS} elementos.")
+    if usar_modo_exato(modo, a, b):
+        # Inteiros Python não transbordam, ao contrário do int64
+        produto = [[sum(x * y for x, y in zip(linha, coluna)) for coluna in zip(*_para_exata(b))]
+                   for linha in _para_exata(a)]
+        return _saida_exata(produto, vetor=b.ndim == 1)
+    return saida_numerica(np.matmul(a, b, dtype=float))
+
+
+def inversa(valor: Entrada, modo: Optional[str] = None) -> Union[List[Any], Dict[str, Any]]:
+    """Inversa de uma matriz quadrada não singular."""
+    a = ler_matriz(valor)
+    _exigir_quadrada(a)
+    n = a.shape[0]
+    if usar_modo_exato(modo, a):
+        identidade = [[Fraction(int(i == j)) for j in range(n)] for i in range(n)]
+        aumentada = [linha + extra for linha, extra in zip(_para_exata(a), identidade)]
+        reduzida, posto_a = _escalonar(aumentada, n)
+        if posto_a < n:
+            raise ValueError('A matriz é singular e não possui inversa.')
+        return _saida_exata([linha[n:] for linha in reduzida])
+    try:
+        return saida_numerica(np.linalg.inv(a))
+    except np.linalg.LinAlgError:
+        raise ValueError('A matriz é singular e não possui inversa.')
+
+
+def posto(valor: Entrada, modo: Optional[str] = None) -> int:
+    """Posto (número de linhas linearmente independentes)."""
+    a = ler_matriz(valor)
+    if usar_modo_exato(modo, a):
+        return _escalonar(_para_exata(a), a.shape[1])[1]
+    return int(np.linalg.matrix_rank(a))
+
+
+def resolver_sistema(valor_a: Entrada, valor_b: Entrada,
+                     modo: Optional[str] = None) -> Union[List[Any], Dict[str, Any]]:
+    """Solução de A·x = b para A quadrada; b pode ser um vetor ou uma matriz de vários lados direitos."""
+    a = ler_matriz(valor_a)
+    b = ler_matriz(valor_b, 'vetor_b', permitir_vetor=True)
+    _exigir_quadrada(a)
+    n = a.shape[0]
+    if b.shape[0] != n:
+        raise ValueError(f"'vetor_b' deve ter {n} linhas, uma por equação; recebidas {b.shape[0]}.")
+    if usar_modo_exato(modo, a, b):
+        aumentada = [linha + extra for linha, extra in zip(_para_exata(a), _para_exata(b))]
+        reduzida, posto_a = _escalonar(aumentada, n)
+        if posto_a < n:
+            raise ValueError('O sistema não tem solução única: a matriz dos coeficientes é singular.')
+        return _saida_exata([linha[n:] for linha in reduzida], vetor=b.ndim == 1)
+    try:
+        return saida_numerica(np.linalg.solve(a, b))
+    except np.linalg.LinAlgError:
+        raise ValueError('O sistema não tem solução única: a matriz dos coeficientes é singular.')
@@ -0,0 +1,190 @@
+"""
+Métricas de desempenho no formato texto do Prometheus.
+
+Contadores e histogramas simples, sem dependências externas, guardados em
+memória por processo (cada worker do gunicorn expõe os seus). Registrar uma
+observação custa um ``bisect`` e um incremento sob trava, baixo o bastante
+para ficar ligado em produção.
+
+Métricas registradas:
+
+- ``calclab_requisicoes_total`` e ``calclab_requisicao_segundos``: por rota,
+  método e status;
+- ``calclab_calculo_segundos``: por área, ``tipo_calculo`` e status;
+- ``calclab_db_consulta_segundos``: comandos SQL executados pelo pool do app;
+- ``calclab_chatbot_backend_segundos``: chamadas ao backend do chatbot.
+"""
+
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Container, Dict, Iterable, List, Sequence, Tuple
+
+# Limites (em segundos) dos baldes dos histogramas de latência
+LIMITES_PADRAO = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escapar(valor: str) -> str:
+    return str(valor).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _rotulos(nomes: Sequence[str], valores: Sequence[str], extra: str = '') -> str:
+    pares = [f'{nome}="{_escapar(valor)}"' for nome, valor in zip(nomes, valores)]
+    if extra:
+        pares.append(extra)
+    return '{' + ','.join(pares) + '}' if pares else ''
+
+
+class Contador:
+    """Contador monotônico com rótulos."""
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.rotulos = tuple(rotulos)
+        self._valores: Dict[Tuple[str, ...], float] = {}
+        self._trava = threading.Lock()
+
+    def incrementar(self, *valores: str, quantidade: float = 1.0) -> None:
+        with self._trava:
+            self._valores[valores] = self._valores.get(valores, 0.0) + quantidade
+
+    def exportar(self) -> List[str]:
+        linhas = [f'# HELP {self.nome} {self.ajuda}', f'# TYPE {self.nome} counter']
+        with self._trava:
+            itens = list(self._valores.items())
+        for valores, total in itens:
+            linhas.append(f'{self.nome}{_rotulos(self.rotulos, valores)} {total:g}')
+        return linhas
+
+
+class Histograma:
+    """Histograma cumulativo com rótulos, no modelo do Prometheus."""
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = (),
+                 limites: Sequence[float] = LIMITES_PADRAO):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.rotulos = tuple(rotulos)
+        self.limites = tuple(sorted(limites))
+        # Para cada combinação de rótulos: contagem por balde, soma e total
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._trava = threading.Lock()
+
+    def observar(self, valor: float, *valores: str) -> None:
+        balde = bisect_left(self.limites, valor)
+        with self._trava:
+            serie = self._series.get(valores)
+            if serie is None:
+                serie = self._series[valores] = [0] * (len(self.limites) + 1) + [0.0, 0]
+            serie[balde] += 1
+            serie[-2] += valor
+            serie[-1] += 1
+
+    def exportar(self) -> List[str]:
+        linhas = [f'# HELP {self.nome} {self.ajuda}', f'# TYPE {self.nome} histogram']
+        with self._trava:
+            series = [(valores, list(serie)) for valores, serie in self._series.items()]
+        for valores, serie in series:
+            acumulado = 0
+            for limite, quantidade in zip(self.limites + (float('inf'),), serie):
+                acumulado += quantidade
+                le = 'le="+Inf"' if limite == float('inf') else f'le="{limite:g}"'
+                linhas.append(f'{self.nome}_bucket{_rotulos(self.rotulos, valores, le)} {acumulado}')
+            linhas.append(f'{self.nome}_sum{_rotulos(self.rotulos, valores)} {serie[-2]:.6f}')
+            linhas.append(f'{self.nome}_count{_rotulos(self.rotulos, valores)} {serie[-1]}')
+        return linhas
+
+
+class RegistroMetricas:
+    """Conjunto de métricas exportadas juntas, mais coletores de valores instantâneos."""
+
+    def __init__(self):
+        self._metricas: List[Any] = []
+        self._coletores: List[Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]] = []
+
+    def registrar(self, metrica):
+        self._metricas.append(metrica)
+        return metrica
+
+    def coletor(self, funcao: Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]) -> None:
+        """Adiciona uma função que devolve (nome, tipo, ajuda, rótulos, valor) no momento da exportação."""
+        self._coletores.append(funcao)
+
+    def exportar(self) -> str:
+        """Texto no formato de exposição do Prometheus."""
+        linhas: List[str] = []
+        for metrica in self._metricas:
+            linhas.extend(metrica.exportar())
+        declaradas = set()
+        for coletor in self._coletores:
+            for nome, tipo, ajuda, rotulos, valor in coletor():
+                if nome not in declaradas:
+                    linhas += [f'# HELP {nome} {ajuda}', f'# TYPE {nome} {tipo}']
+                    declaradas.add(nome)
+                linhas.append(f'{nome}{_rotulos(list(rotulos), list(rotulos.values()))} {valor:g}')
+        return '\n'.join(linhas) + '\n'
+
+
+REGISTRO = RegistroMetricas()
+
+REQUISICOES = REGISTRO.registrar(Contador(
+    'calclab_requisicoes_total', 'Requisições HTTP atendidas.', ('rota', 'metodo', 'status')))
+LATENCIA_REQUISICAO = REGISTRO.registrar(Histograma(
+    'calclab_requisicao_segundos', 'Tempo de atendimento das requisições HTTP.', ('rota', 'metodo')))
+ERROS = REGISTRO.registrar(Contador(
+    'calclab_erros_total', 'Requisições HTTP que terminaram com status 4xx ou 5xx.', ('rota', 'status')))
+LATENCIA_CALCULO = REGISTRO.registrar(Histograma(
+    'calclab_calculo_segundos', 'Tempo de cada cálculo, incluindo o cache.', ('area', 'tipo_calculo', 'status')))
+LATENCIA_DB = REGISTRO.registrar(Histograma(
+    'calclab_db_consulta_segundos', 'Tempo de execução dos comandos SQL do app.', ('operacao',)))
+LATENCIA_CHATBOT = REGISTRO.registrar(Histograma(
+    'calclab_chatbot_backend_segundos', 'Tempo das chamadas ao backend do chatbot.', ('backend', 'resultado'),
+    limites=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0)))
+
+
+def medir_calculo(area: str, conhecidos: Container[str]) -> Callable:
+    """
+    Decorador que mede um dispatcher de cálculo por área e tipo.
+
+    Args:
+        area (str): Área do cálculo
+        conhecidos (Container[str]): Tipos de cálculo válidos; os demais viram 'desconhecido'
+            para não criar séries arbitrárias a partir da entrada do usuário
+    """
+    def decorador(processar: Callable[[Dict[str, Any]], Tuple[Dict[str, Any], int]]):
+        @wraps(processar)
+        def medido(dados: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+            inicio = time.perf_counter()
+            corpo, status = processar(dados)
+            tipo = dados.get('tipo_calculo')
+            tipo = tipo if isinstance(tipo, str) and tipo in conhecidos else 'desconhecido'
+            LATENCIA_CALCULO.observar(time.perf_counter() - inicio, area, tipo, str(status))
+            return corpo, status
+        return medido
+    return decorador
+
+
+def _operacao(sql: str) -> str:
+    palavra = sql.lstrip().split(None, 1)
+    return palavra[0].upper() if palavra else ''
+
+
+class ConexaoMedida(sqlite3.Connection):
+    """Conexão SQLite que registra o tempo de ``execute`` e ``executemany``."""
+
+    def execute(self, sql: str, *args: Any) -> sqlite3.Cursor:
+        inicio = time.perf_counter()
+        try:
+            return super().execute(sql, *args)
+        finally:
+            LATENCIA_DB.observar(time.perf_counter() - inicio, _operacao(sql))
+
+    def executemany(self, sql: str, *args: Any) -> sqlite3.Cursor:
+        inicio = time.perf_counter()
+        try:
+            return super().executemany(sql, *args)
+        finally:
+            LATENCIA_DB.observar(time.perf_counter() - inicio, _operacao(sql))
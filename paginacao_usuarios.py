@@ -0,0 +1,164 @@
+"""
+Listagem paginada de usuários para as páginas administrativas.
+
+Usa paginação por chave (keyset): o cursor guarda o valor da coluna de
+ordenação e o ``id`` do último registro exibido, e a próxima página começa com
+``WHERE (coluna, id) > (?, ?)``, aproveitando os índices em vez de pular
+linhas com OFFSET. A busca é por prefixo de ``nome_usuario`` ou ``email`` e as
+datas já saem formatadas do próprio SQLite.
+"""
+
+import base64
+import binascii
+import json
+import sqlite3
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+# Índices usados pela ordenação e pela busca
+INDICES = (
+    'CREATE INDEX IF NOT EXISTS idx_usuarios_created_at ON usuarios (created_at, id)',
+    'CREATE INDEX IF NOT EXISTS idx_usuarios_nome_nocase ON usuarios (nome_usuario COLLATE NOCASE)',
+    'CREATE INDEX IF NOT EXISTS idx_usuarios_email_nocase ON usuarios (email COLLATE NOCASE)',
+)
+
+# Colunas aceitas para ordenação (todas NOT NULL ou preenchidas por padrão)
+ORDENACOES = ('id', 'created_at', 'nome_usuario')
+
+# Expressões de data formatadas no SQL; valores fora do padrão são mantidos como estão
+COLUNAS_FORMATADAS = {
+    'created_at': "COALESCE(strftime('%d/%m/%Y %H:%M:%S', created_at, '-3 hours'), created_at)",
+    'data_nascimento': "COALESCE(strftime('%d/%m/%Y', data_nascimento), data_nascimento)",
+}
+
+
+# Tipo do valor guardado no cursor para cada ordenação
+_TIPOS_CURSOR = {'id': int, 'created_at': str, 'nome_usuario': str}
+
+
+class CursorInvalido(ValueError):
+    """Cursor de paginação malformado ou adulterado."""
+
+
+class PaginaUsuarios(NamedTuple):
+    """Uma página da listagem de usuários."""
+    usuarios: List[sqlite3.Row]
+    # Cursores para a página seguinte e a anterior (None quando não há)
+    proximo: Optional[str]
+    anterior: Optional[str]
+
+
+def criar_indices(db: sqlite3.Connection) -> None:
+    """Cria os índices da listagem, se ainda não existirem."""
+    for comando in INDICES:
+        db.execute(comando)
+
+
+def codificar_cursor(valor: Any, id_usuario: int) -> str:
+    """Codifica a posição (valor da ordenação, id) num cursor para a URL."""
+    bruto = json.dumps([valor, id_usuario], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(bruto).decode('ascii').rstrip('=')
+
+
+def _inteiro_sqlite(valor: Any) -> bool:
+    return isinstance(valor, int) and not isinstance(valor, bool) and -2 ** 63 <= valor < 2 ** 63
+
+
+def decodificar_cursor(cursor: Optional[str], ordem: str = 'id') -> Optional[Tuple[Any, int]]:
+    """
+    Decodifica um cursor; retorna None se ele estiver vazio.
+
+    Raises:
+        CursorInvalido: O cursor foi adulterado ou não corresponde à ordenação
+    """
+    if not cursor:
+        return None
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        posicao = json.loads(bruto)
+    except (binascii.Error, ValueError, RecursionError):
+        raise CursorInvalido("Cursor de paginação inválido.")
+    if not isinstance(posicao, list) or len(posicao) != 2:
+        raise CursorInvalido("Cursor de paginação inválido.")
+    valor, id_usuario = posicao
+    # Valores fora do tipo da coluna ou do intervalo do SQLite quebrariam a consulta
+    if not _inteiro_sqlite(id_usuario) or not isinstance(valor, _TIPOS_CURSOR[ordem]) or \
+            (ordem == 'id' and (not _inteiro_sqlite(valor) or valor != id_usuario)):
+        raise CursorInvalido("Cursor de paginação inválido.")
+    return valor, id_usuario
+
+
+def _escapar_like(texto: str) -> str:
+    return texto.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def listar_usuarios(db: sqlite3.Connection, colunas: Sequence[str], busca: str = '',
+                    ordem: str = 'id', descendente: bool = False, apos: Optional[str] = None,
+                    antes: Optional[str] = None, limite: int = 50) -> PaginaUsuarios:
+    """
+    Busca uma página de usuários.
+
+    Args:
+        db (sqlite3.Connection): Conexão com o banco
+        colunas (Sequence[str]): Colunas exibidas; datas conhecidas saem formatadas
+        busca (str): Prefixo procurado em nome_usuario ou email
+        ordem (str): Coluna de ordenação (ver ``ORDENACOES``)
+        descendente (bool): Ordena do maior para o menor
+        apos (Optional[str]): Cursor da página seguinte
+        antes (Optional[str]): Cursor da página anterior
+        limite (int): Usuários por página
+
+    Returns:
+        PaginaUsuarios: Usuários da página e cursores de navegação
+
+    Raises:
+        CursorInvalido: Um dos cursores foi adulterado
+    """
+    if ordem not in ORDENACOES:
+        raise ValueError(f"Ordenação '{ordem}' não suportada. Opções: {', '.join(ORDENACOES)}")
+
+    # Colunas qualificadas pela tabela: as datas formatadas reutilizam o nome original como alias
+    coluna = f'usuarios.{ordem}'
+    selecao = ['usuarios.id AS _cursor_id', f'{coluna} AS _cursor_valor']
+    selecao += [f'{COLUNAS_FORMATADAS[c]} AS {c}' if c in COLUNAS_FORMATADAS else c for c in colunas]
+
+    condicoes, parametros = [], []
+    if busca:
+        prefixo = _escapar_like(busca.strip()) + '%'
+        condicoes.append("(nome_usuario LIKE ? ESCAPE '\\' OR email LIKE ? ESCAPE '\\')")
+        parametros += [prefixo, prefixo]
+
+    # Voltar uma página é avançar na ordem inversa e depois desinverter o resultado
+    voltando = bool(antes) and not apos
+    posicao = decodificar_cursor(antes if voltando else apos, ordem)
+    crescente = descendente == voltando
+    if posicao is not None:
+        comparador = '>' if crescente else '<'
+        coluna_ordem = 'usuarios.id' if ordem == 'id' else f'({coluna}, usuarios.id)'
+        condicoes.append(f'{coluna_ordem} {comparador} ' + ('?' if ordem == 'id' else '(?, ?)'))
+        parametros += [posicao[1]] if ordem == 'id' else list(posicao)
+
+    direcao = 'ASC' if crescente else 'DESC'
+    ordenacao = f'usuarios.id {direcao}' if ordem == 'id' else f'{coluna} {direcao}, usuarios.id {direcao}'
+    sql = f"SELECT {', '.join(selecao)} FROM usuarios"
+    if condicoes:
+        sql += ' WHERE ' + ' AND '.join(condicoes)
+    sql += f' ORDER BY {ordenacao} LIMIT ?'
+
+    linhas = db.execute(sql, parametros + [limite + 1]).fetchall()
+    ha_mais = len(linhas) > limite
+    linhas = linhas[:limite]
+    if voltando:
+        linhas.reverse()
+
+    def cursor(linha: sqlite3.Row) -> str:
+        return codificar_cursor(linha['_cursor_valor'], linha['_cursor_id'])
+
+    if not linhas:
+        return PaginaUsuarios([], None, None)
+    if voltando:
+        proximo = cursor(linhas[-1])
+        anterior = cursor(linhas[0]) if ha_mais else None
+    else:
+        proximo = cursor(linhas[-1]) if ha_mais else None
+        anterior = cursor(linhas[0]) if posicao is not None else None
+    return PaginaUsuarios(linhas, proximo, anterior)
@@ -0,0 +1,185 @@
+"""
+Perfilamento opcional dos cálculos.
+
+Quando ativado, uma fração das chamadas aos dispatchers de cálculo roda sob o
+``cProfile`` e o resultado é gravado numa pasta, com rotação pelos mais
+recentes. Administradores também podem forçar o perfilamento de uma
+requisição pelo cabeçalho ``X-CalcLab-Profile: 1``.
+
+Formatos de saída:
+
+- ``prof``: arquivo do ``pstats``, para ``python -m pstats`` ou snakeviz;
+- ``colapsado``: pilhas colapsadas (``a;b;c microssegundos``), prontas para o
+  ``flamegraph.pl`` ou o speedscope.
+
+O nome de cada arquivo guarda o instante, a área, o tipo de cálculo e a
+duração, de modo que a listagem não precisa abrir os arquivos.
+"""
+
+import cProfile
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+FORMATOS = {'prof': '.prof', 'colapsado': '.txt'}
+
+# <instante em ms>-<pid>-<área>-<tipo>-<duração em µs>.<extensão>
+_PADRAO_NOME = re.compile(r'^(\d+)-(\d+)-(\w+)-(\w+)-(\d+)(\.prof|\.txt)$')
+
+Resposta = Tuple[Dict[str, Any], int]
+
+
+def _sanitizar(texto: Any) -> str:
+    return re.sub(r'\W', '_', str(texto or 'desconhecido'))[:60] or 'desconhecido'
+
+
+class _PilhasColapsadas:
+    """Função de ``sys.setprofile`` que acumula o tempo próprio de cada pilha de chamadas."""
+
+    def __init__(self):
+        self.pilha: List[str] = []
+        self.tempos: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self._ultimo = time.perf_counter()
+
+    def __call__(self, frame, evento: str, arg: Any) -> None:
+        agora = time.perf_counter()
+        if self.pilha:
+            self.tempos[tuple(self.pilha)] += agora - self._ultimo
+        if evento == 'call':
+            codigo = frame.f_code
+            self.pilha.append(f'{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})')
+        elif evento == 'c_call':
+            self.pilha.append(getattr(arg, '__qualname__', getattr(arg, '__name__', repr(arg))))
+        elif self.pilha and evento in ('return', 'c_return', 'c_exception'):
+            self.pilha.pop()
+        self._ultimo = time.perf_counter()
+
+    def linhas(self) -> List[str]:
+        return [
+            f"{';'.join(pilha)} {round(segundos * 1e6)}"
+            for pilha, segundos in self.tempos.items()
+            if round(segundos * 1e6) > 0
+        ]
+
+
+class Perfilador:
+    """Executa dispatchers de cálculo sob o profiler, por amostragem ou a pedido."""
+
+    def __init__(self, pasta: str, ativo: bool = False, amostragem: float = 0.01,
+                 manter: int = 200, formato: str = 'prof',
+                 solicitado: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            pasta (str): Pasta onde os perfis são gravados
+            ativo (bool): Liga a amostragem automática
+            amostragem (float): Fração das chamadas perfiladas quando ativo (0 a 1)
+            manter (int): Perfis mantidos na pasta; os mais antigos são apagados
+            formato (str): 'prof' ou 'colapsado'
+            solicitado (Optional[Callable[[], bool]]): Indica se a requisição atual pediu
+                perfilamento (ex.: cabeçalho enviado por um administrador)
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de perfil '{formato}' não suportado. Opções: {', '.join(FORMATOS)}")
+        self.pasta = pasta
+        self.ativo = ativo
+        self.amostragem = amostragem
+        self.manter = manter
+        self.formato = formato
+        self.solicitado = solicitado
+        self._trava = threading.Lock()
+
+    def deve_perfilar(self) -> bool:
+        """Decide se a chamada atual será perfilada."""
+        if self.solicitado is not None and self.solicitado():
+            return True
+        return self.ativo and random.random() < self.amostragem
+
+    def perfilar(self, area: str) -> Callable[[Callable[[Dict[str, Any]], Resposta]], Callable[[Dict[str, Any]], Resposta]]:
+        """
+        Decorador que perfila o dispatcher da área quando ``deve_perfilar`` permite.
+
+        Deve ficar abaixo do cache de resultados, para que só cálculos de fato
+        executados sejam perfilados.
+        """
+        def decorador(processar: Callable[[Dict[str, Any]], Resposta]) -> Callable[[Dict[str, Any]], Resposta]:
+            @wraps(processar)
+            def perfilado(dados: Dict[str, Any]) -> Resposta:
+                if not self.deve_perfilar():
+                    return processar(dados)
+                inicio = time.perf_counter()
+                if self.formato == 'prof':
+                    perfil = cProfile.Profile()
+                    resposta = perfil.runcall(processar, dados)
+                else:
+                    perfil = _PilhasColapsadas()
+                    anterior = sys.getprofile()
+                    sys.setprofile(perfil)
+                    try:
+                        resposta = processar(dados)
+                    finally:
+                        sys.setprofile(anterior)
+                duracao = time.perf_counter() - inicio
+                self._gravar(perfil, area, dados.get('tipo_calculo'), duracao)
+                return resposta
+            return perfilado
+        return decorador
+
+    def _gravar(self, perfil, area: str, tipo_calculo: Any, duracao: float) -> None:
+        os.makedirs(self.pasta, exist_ok=True)
+        nome = (f'{int(time.time() * 1000)}-{os.getpid()}-{_sanitizar(area)}-'
+                f'{_sanitizar(tipo_calculo)}-{round(duracao * 1e6)}{FORMATOS[self.formato]}')
+        caminho = os.path.join(self.pasta, nome)
+        if self.formato == 'prof':
+            perfil.dump_stats(caminho)
+        else:
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write('\n'.join(perfil.linhas()) + '\n')
+        self.aplicar_retencao()
+
+    def aplicar_retencao(self) -> None:
+        """Apaga os perfis mais antigos além de ``manter``."""
+        with self._trava:
+            for perfil in self.listar()[self.manter:]:
+                try:
+                    os.remove(os.path.join(self.pasta, perfil['arquivo']))
+                except FileNotFoundError:
+                    pass
+
+    def listar(self) -> List[Dict[str, Any]]:
+        """Perfis gravados, do mais recente para o mais antigo."""
+        if not os.path.isdir(self.pasta):
+            return []
+        perfis = []
+        for nome in os.listdir(self.pasta):
+            partes = _PADRAO_NOME.match(nome)
+            if partes is None:
+                continue
+            instante, pid, area, tipo_calculo, duracao, _ = partes.groups()
+            perfis.append({
+                'arquivo': nome,
+                'instante': int(instante) / 1000,
+                'data': time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(int(instante) / 1000)),
+                'pid': int(pid),
+                'area': area,
+                'tipo_calculo': tipo_calculo,
+                'duracao_ms': int(duracao) / 1000,
+            })
+        perfis.sort(key=lambda perfil: perfil['instante'], reverse=True)
+        return perfis
+
+    def mais_lentos(self, limite: int = 50) -> List[Dict[str, Any]]:
+        """Perfis mantidos na pasta, do mais lento para o mais rápido."""
+        return sorted(self.listar(), key=lambda perfil: perfil['duracao_ms'], reverse=True)[:limite]
+
+    def caminho(self, arquivo: str) -> Optional[str]:
+        """Caminho de um perfil gravado, ou None se o nome não for de um perfil."""
+        if _PADRAO_NOME.match(arquivo) is None:
+            return None
+        caminho = os.path.join(self.pasta, arquivo)
+        return caminho if os.path.isfile(caminho) else None
@@ -0,0 +1,197 @@
+"""
+Registro compilado das funções de cálculo.
+
+Cada módulo de cálculo (``calc_fisica``, ``calc_quimica``, ``calc_matematica``)
+monta o seu registro uma única vez, na importação. Cada entrada guarda a
+assinatura da função, quais campos são texto e a tabela que indica, para cada
+conjunto de valores conhecidos, qual é a incógnita. Assim uma requisição vai
+direto para a função certa sem reconstruir dicionários nem inspecionar nada.
+
+Cálculos declarados com ``Ramos`` têm uma função por incógnita: o registro
+chama o ramo da incógnita encontrada na tabela só com os valores conhecidos,
+sem que a função volte a contar os valores ausentes. A função com a assinatura
+completa continua existindo para as calculadoras Tk.
+"""
+
+import functools
+import inspect
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Type, Union
+
+Resultado = Tuple[Dict[str, Any], Dict[str, str]]
+
+# Anotações que indicam um campo de texto
+_ANOTACOES_TEXTO = (str, Optional[str])
+
+# Número de parâmetros -> (valores fornecidos, valor calculado), por extenso
+_ORDINAIS = {3: ('dois', 'terceiro'), 4: ('três', 'quarto'), 5: ('quatro', 'quinto')}
+
+
+class Ramos:
+    """
+    Soluções de um cálculo de incógnita única, uma função por incógnita.
+
+    Usado como decorador da função com a assinatura completa, que passa a
+    descobrir a incógnita pelo único valor None e delegar ao ramo dela.
+
+    Args:
+        rotulo (str): Prefixo das mensagens de erro do cálculo
+        ramos (Dict[str, Callable[..., Resultado]]): Incógnita -> função que recebe
+            os demais valores e retorna o resultado e as unidades
+        capturar (Tuple[Type[Exception], ...]): Exceções convertidas em ValueError com o rótulo
+    """
+
+    __slots__ = ('rotulo', 'ramos', 'capturar', 'mensagem_contagem')
+
+    def __init__(self, rotulo: str, ramos: Dict[str, Callable[..., Resultado]],
+                 capturar: Tuple[Type[Exception], ...] = (TypeError, ZeroDivisionError)):
+        self.rotulo = rotulo
+        self.ramos = ramos
+        self.capturar = capturar
+        fornecidos, calculado = _ORDINAIS.get(len(ramos), (str(len(ramos) - 1), 'restante'))
+        self.mensagem_contagem = f"Exatamente {fornecidos} valores devem ser fornecidos para calcular o {calculado}."
+
+    def resolver(self, incognita: str, conhecidos: Dict[str, Any]) -> Resultado:
+        """Calcula a incógnita a partir dos valores conhecidos."""
+        try:
+            return self.ramos[incognita](**conhecidos)
+        except self.capturar as e:
+            raise ValueError(f"{self.rotulo}: {str(e)}")
+
+    def resolver_completo(self, valores: Dict[str, Any]) -> Resultado:
+        """Recebe todos os parâmetros, com None na incógnita, e resolve pelo ramo dela."""
+        incognitas = [nome for nome, valor in valores.items() if valor is None]
+        if len(incognitas) != 1:
+            mensagem = self.mensagem_contagem
+            if issubclass(ValueError, self.capturar):
+                mensagem = f"{self.rotulo}: {mensagem}"
+            raise ValueError(mensagem)
+        conhecidos = {nome: valor for nome, valor in valores.items() if valor is not None}
+        return self.resolver(incognitas[0], conhecidos)
+
+    def __call__(self, funcao: Callable[..., Resultado]) -> Callable[..., Resultado]:
+        assinatura = inspect.signature(funcao)
+        faltando = set(self.ramos) ^ set(assinatura.parameters)
+        if faltando:
+            raise ValueError(f"Ramos de '{funcao.__name__}' não correspondem aos parâmetros: {', '.join(sorted(faltando))}")
+
+        @functools.wraps(funcao)
+        def completo(*args, **kwargs) -> Resultado:
+            argumentos = assinatura.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            return self.resolver_completo(argumentos.arguments)
+
+        completo.ramos = self
+        return completo
+
+
+class Calculo:
+    """Entrada do registro: uma função de cálculo e seus metadados pré-computados."""
+
+    __slots__ = ('nome', 'funcao', 'parametros', 'aceitos', 'campos_texto', 'incognitas', 'incognita_unica',
+                 'ramos')
+
+    def __init__(self, nome: str, funcao: Callable, campos_texto: Iterable[str] = (),
+                 incognita_unica: bool = False):
+        assinatura = inspect.signature(funcao)
+        self.nome = nome
+        self.funcao = funcao
+        self.parametros: Tuple[str, ...] = tuple(assinatura.parameters)
+        self.aceitos: FrozenSet[str] = frozenset(self.parametros)
+        # Campos de texto: anotados como str ou listados explicitamente
+        self.campos_texto: FrozenSet[str] = frozenset(
+            nome_param for nome_param, param in assinatura.parameters.items()
+            if param.annotation in _ANOTACOES_TEXTO or nome_param in campos_texto
+        )
+        # Conjunto de parâmetros conhecidos -> incógnita a calcular
+        self.incognitas: Dict[FrozenSet[str], str] = {self.aceitos - {p}: p for p in self.parametros}
+        self.incognita_unica = incognita_unica
+        # Funções declaradas com Ramos são chamadas direto no ramo da incógnita
+        self.ramos: Optional[Ramos] = getattr(funcao, 'ramos', None)
+
+    def incognita(self, conhecidos: Iterable[str]) -> Optional[str]:
+        """Retorna a incógnita correspondente aos valores conhecidos, se houver uma só."""
+        return self.incognitas.get(frozenset(conhecidos))
+
+    def converter(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Descarta valores vazios e converte os campos numéricos para float."""
+        valores = {}
+        for chave, valor in kwargs.items():
+            if valor is None or valor == '':
+                continue
+            if chave not in self.aceitos:
+                raise ValueError(f"Parâmetro '{chave}' não é aceito pelo cálculo '{self.nome}'.")
+            if chave in self.campos_texto:
+                valores[chave] = valor
+            else:
+                try:
+                    valores[chave] = float(valor)
+                except (TypeError, ValueError):
+                    raise ValueError(f"Valor inválido para {chave}: {valor}")
+        return valores
+
+
+class RegistroCalculos:
+    """Mapeamento imutável de tipo de cálculo para sua entrada compilada."""
+
+    def __init__(self, funcoes: Dict[str, Callable], campos_texto: Iterable[str] = (),
+                 incognita_unica: Union[bool, Iterable[str]] = ()):
+        campos_texto = frozenset(campos_texto)
+        # incognita_unica: cálculos que resolvem exatamente uma incógnita (True = todos)
+        if incognita_unica is True:
+            incognita_unica = funcoes
+        incognita_unica = frozenset(incognita_unica or ())
+        self._calculos: Dict[str, Calculo] = {
+            nome: Calculo(nome, funcao, campos_texto, nome in incognita_unica)
+            for nome, funcao in funcoes.items()
+        }
+
+    def __contains__(self, tipo_calculo: str) -> bool:
+        return tipo_calculo in self._calculos
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._calculos)
+
+    def __len__(self) -> int:
+        return len(self._calculos)
+
+    def __getitem__(self, tipo_calculo: str) -> Calculo:
+        return self._calculos[tipo_calculo]
+
+    def obter(self, tipo_calculo: str) -> Calculo:
+        """Retorna a entrada do cálculo ou lança ValueError se ele não existir."""
+        calculo = self._calculos.get(tipo_calculo)
+        if calculo is None:
+            raise ValueError(f"Tipo de cálculo '{tipo_calculo}' não encontrado.")
+        return calculo
+
+    def executar(self, tipo_calculo: str, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Converte as entradas e executa o cálculo registrado.
+
+        Args:
+            tipo_calculo (str): Tipo de cálculo a ser realizado
+            kwargs (Dict[str, Any]): Valores recebidos na requisição
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, str]]: Resultado do cálculo e suas unidades
+        """
+        calculo = self.obter(tipo_calculo)
+        valores = calculo.converter(kwargs)
+
+        try:
+            if calculo.ramos is not None or calculo.incognita_unica:
+                incognita = calculo.incognitas.get(frozenset(valores))
+                if incognita is None:
+                    faltando = len(calculo.parametros) - 1
+                    raise ValueError(f"Exatamente {faltando} valores devem ser fornecidos para calcular o restante.")
+                if calculo.ramos is not None:
+                    resultado, unidades = calculo.ramos.resolver(incognita, valores)
+                else:
+                    resultado, unidades = calculo.funcao(**valores)
+            else:
+                resultado, unidades = calculo.funcao(**valores)
+            if not isinstance(resultado, dict) or not isinstance(unidades, dict):
+                raise ValueError('Função de cálculo deve retornar dois dicionários.')
+            return resultado, unidades
+        except Exception as e:
+            raise ValueError(f"Erro ao executar cálculo: {str(e)}")
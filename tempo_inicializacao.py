@@ -0,0 +1,156 @@
+"""
+Relatório do tempo de inicialização do app.
+
+Importa o ``app`` num processo novo com ``python -X importtime`` e resume o
+tempo gasto por módulo: o total da partida, os módulos do projeto com seu
+tempo acumulado (incluindo o que cada um importa) e os pacotes que mais
+pesam pelo tempo próprio. Com ``--preaquecer`` a medição inclui o
+pré-aquecimento (``PREAQUECER=true``), para comparar as duas partidas.
+
+O processo roda numa pasta temporária, com o chatbot local e sem backups,
+para não criar arquivos no projeto.
+
+Uso:
+
+    python tempo_inicializacao.py
+    python tempo_inicializacao.py --preaquecer --limite 30 --saida inicializacao.json
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+DIRETORIO_PROJETO = os.path.dirname(os.path.abspath(__file__))
+
+_LINHA = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+_MARCADOR = 'TEMPO_TOTAL_MS='
+
+# Código executado no processo medido
+_PROGRAMA = (
+    'import sys, time\n'
+    'inicio = time.perf_counter()\n'
+    f'sys.path.insert(0, {DIRETORIO_PROJETO!r})\n'
+    'import app\n'
+    f'print({_MARCADOR!r} + str((time.perf_counter() - inicio) * 1000), flush=True)\n'
+)
+
+
+def _modulos_do_projeto() -> set:
+    return {nome[:-3] for nome in os.listdir(DIRETORIO_PROJETO) if nome.endswith('.py')}
+
+
+def interpretar_importtime(saida: str) -> List[Dict[str, Any]]:
+    """Converte a saída do ``-X importtime`` em registros (módulo, tempo próprio, acumulado, nível)."""
+    registros = []
+    for linha in saida.splitlines():
+        partes = _LINHA.match(linha)
+        if partes:
+            proprio, acumulado, recuo, modulo = partes.groups()
+            registros.append({
+                'modulo': modulo,
+                'proprio_ms': int(proprio) / 1000,
+                'acumulado_ms': int(acumulado) / 1000,
+                'nivel': len(recuo) // 2,
+            })
+    return registros
+
+
+def medir(preaquecer: bool = False) -> Dict[str, Any]:
+    """
+    Mede a importação do ``app`` num processo novo.
+
+    Args:
+        preaquecer (bool): Liga o pré-aquecimento durante a medição
+
+    Returns:
+        Dict[str, Any]: Tempo total e os módulos importados com seus tempos
+    """
+    pasta = tempfile.mkdtemp(prefix='calclab_inicio_')
+    ambiente = {
+        **os.environ,
+        'CHATBOT_BACKEND': os.environ.get('CHATBOT_BACKEND', 'local'),
+        'BACKUP_ATIVO': 'False',
+        'PREAQUECER': 'True' if preaquecer else 'False',
+    }
+    try:
+        processo = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _PROGRAMA],
+            cwd=pasta, env=ambiente, capture_output=True, text=True, check=False
+        )
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+    total = next((float(linha[len(_MARCADOR):]) for linha in processo.stdout.splitlines()
+                  if linha.startswith(_MARCADOR)), None)
+    if processo.returncode != 0 or total is None:
+        raise RuntimeError(f'A importação do app falhou:\n{processo.stderr[-2000:]}')
+    return {'total_ms': round(total, 1), 'modulos': interpretar_importtime(processo.stderr)}
+
+
+def resumir(medicao: Dict[str, Any], limite: int = 20) -> Dict[str, Any]:
+    """Agrupa a medição em módulos do projeto e pacotes externos."""
+    projeto = _modulos_do_projeto()
+    modulos = medicao['modulos']
+    # Módulos do projeto: tempo acumulado de cada um (inclui as dependências que ele trouxe)
+    do_projeto = sorted(
+        (m for m in modulos if m['modulo'] in projeto),
+        key=lambda m: m['acumulado_ms'], reverse=True
+    )
+    # Pacotes: soma dos tempos próprios de todos os submódulos
+    pacotes: Dict[str, float] = defaultdict(float)
+    for m in modulos:
+        raiz = m['modulo'].split('.')[0]
+        if raiz not in projeto:
+            pacotes[raiz] += m['proprio_ms']
+    return {
+        'total_ms': medicao['total_ms'],
+        'importacao_ms': round(sum(m['proprio_ms'] for m in modulos), 1),
+        'modulos_projeto': [
+            {'modulo': m['modulo'], 'acumulado_ms': m['acumulado_ms'], 'proprio_ms': m['proprio_ms']}
+            for m in do_projeto[:limite]
+        ],
+        'pacotes': [
+            {'pacote': nome, 'proprio_ms': round(ms, 1)}
+            for nome, ms in sorted(pacotes.items(), key=lambda item: item[1], reverse=True)[:limite]
+        ],
+    }
+
+
+def _imprimir(titulo: str, resumo: Dict[str, Any]) -> None:
+    print(f"\n{titulo}: {resumo['total_ms']:.1f} ms até o app ficar pronto "
+          f"({resumo['importacao_ms']:.1f} ms somando todas as importações, inclusive as do interpretador)")
+    print('\n  Módulos do projeto (acumulado / próprio):')
+    for m in resumo['modulos_projeto']:
+        print(f"    {m['modulo']:<28} {m['acumulado_ms']:>9.1f} ms {m['proprio_ms']:>9.1f} ms")
+    print('\n  Pacotes externos (tempo próprio somado):')
+    for p in resumo['pacotes']:
+        print(f"    {p['pacote']:<28} {p['proprio_ms']:>9.1f} ms")
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Tempo de inicialização do app por módulo.')
+    parser.add_argument('--preaquecer', action='store_true', help='Mede também a partida com PREAQUECER=true')
+    parser.add_argument('--limite', type=int, default=20, help='Itens listados em cada seção')
+    parser.add_argument('--saida', help='Arquivo JSON onde o relatório é gravado')
+    args = parser.parse_args(argumentos)
+
+    relatorio = {'partida': resumir(medir(), args.limite)}
+    _imprimir('Partida a frio', relatorio['partida'])
+    if args.preaquecer:
+        relatorio['preaquecida'] = resumir(medir(preaquecer=True), args.limite)
+        _imprimir('Partida com pré-aquecimento', relatorio['preaquecida'])
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Configuração comum dos testes: os módulos do CalcLab ficam na raiz do repositório."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Lidas pelo config na importação: sem rede, sem backups e sem pré-aquecimento
+os.environ.setdefault('CHATBOT_BACKEND', 'local')
+os.environ.setdefault('BACKUP_ATIVO', 'False')
+os.environ.setdefault('PREAQUECER', 'False')
+os.environ.setdefault('CACHE_TYPE', 'NullCache')
+# Balanceamentos só em memória; os testes que usam o SQLite apontam para uma pasta temporária
+os.environ.setdefault('BALANCEAMENTO_CACHE_BANCO', '')
+
+
+@pytest.fixture(scope='session')
+def app_flask(tmp_path_factory):
+    """App Flask rodando numa pasta temporária, onde ficam os bancos SQLite."""
+    pasta = tmp_path_factory.mktemp('calclab')
+    anterior = os.getcwd()
+    os.chdir(pasta)
+    try:
+        import app as modulo_app
+        modulo_app.app.config['TESTING'] = True
+        yield modulo_app.app
+    finally:
+        os.chdir(anterior)
+
+
+@pytest.fixture
+def cliente(app_flask):
+    return app_flask.test_client()
@@ -0,0 +1,59 @@
+"""Backup do SQLite: cópia, retenção e limpeza dos arquivos de uma cópia que falhou."""
+
+import gzip
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+import backup
+
+
+@pytest.fixture
+def banco(tmp_path):
+    caminho = str(tmp_path / 'calclab.db')
+    with sqlite3.connect(caminho) as db:
+        db.execute('CREATE TABLE t (x INTEGER)')
+        db.executemany('INSERT INTO t VALUES (?)', [(i,) for i in range(100)])
+    return caminho
+
+
+@pytest.mark.parametrize('comprimir', [False, True])
+def test_backup_copia_o_banco(banco, tmp_path, comprimir):
+    pasta = str(tmp_path / 'backups')
+    arquivo = backup.fazer_backup(banco, pasta, comprimir=comprimir)
+    assert backup.listar_backups(pasta) == [arquivo]
+    if comprimir:
+        copia = str(tmp_path / 'copia.db')
+        with gzip.open(arquivo, 'rb') as entrada, open(copia, 'wb') as saida:
+            shutil.copyfileobj(entrada, saida)
+        arquivo = copia
+    with sqlite3.connect(arquivo) as db:
+        assert db.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 100
+
+
+def test_retencao_mantem_os_mais_recentes(tmp_path):
+    pasta = tmp_path / 'backups'
+    pasta.mkdir()
+    for dia in range(1, 5):
+        (pasta / f'{backup.PREFIXO}2024010{dia}_000000.db').write_bytes(b'')
+    backup.aplicar_retencao(str(pasta), 2)
+    assert [os.path.basename(c) for c in backup.listar_backups(str(pasta))] == [
+        f'{backup.PREFIXO}20240103_000000.db', f'{backup.PREFIXO}20240104_000000.db'
+    ]
+
+
+@pytest.mark.parametrize('comprimir', [False, True])
+def test_falha_nao_deixa_arquivos_na_pasta(banco, tmp_path, monkeypatch, comprimir):
+    pasta = tmp_path / 'backups'
+
+    def falhar(*args, **kwargs):
+        raise OSError('disco cheio')
+
+    # Falha depois que o .tmp (e, comprimindo, o .gz) já foi criado
+    monkeypatch.setattr(backup.shutil, 'copyfileobj', falhar)
+    monkeypatch.setattr(backup.os, 'replace', falhar)
+    with pytest.raises(OSError, match='disco cheio'):
+        backup.fazer_backup(banco, str(pasta), comprimir=comprimir)
+    assert os.listdir(pasta) == []
@@ -0,0 +1,74 @@
+"""Balanceamento exato de equações químicas e seu cache por equação canônica."""
+
+import pytest
+
+import balanceador
+from balanceador import ErroBalanceamento, balancear, balancear_com_cache
+
+KMNO4 = (['KMnO4', 'HCl'], ['KCl', 'MnCl2', 'H2O', 'Cl2'])
+COBRE = (['Cu', 'HNO3'], ['Cu(NO3)2', 'NO', 'H2O'])
+
+
+@pytest.fixture(autouse=True)
+def cache_vazio(monkeypatch):
+    monkeypatch.setattr(balanceador, '_tabela', None)
+    balanceador.limpar_cache()
+    yield
+    balanceador.limpar_cache()
+
+
+def test_permanganato_e_acido_cloridrico():
+    assert balancear(*KMNO4) == [2, 16, 2, 2, 8, 5]
+
+
+def test_cobre_e_acido_nitrico():
+    assert balancear(*COBRE) == [3, 8, 3, 2, 4]
+
+
+def test_equacao_sem_balanceamento():
+    with pytest.raises(ErroBalanceamento, match='não pode ser balanceada'):
+        balancear(['CO'], ['CO2'])
+
+
+def test_elemento_em_um_so_lado():
+    with pytest.raises(ErroBalanceamento, match='apenas um lado'):
+        balancear(['H2', 'O2'], ['NaCl'])
+
+
+def test_solucoes_independentes():
+    # H2 + O2 -> H2O + H2O2 admite qualquer proporção entre água e peróxido
+    with pytest.raises(ErroBalanceamento, match='2 balanceamentos independentes'):
+        balancear(['H2', 'O2'], ['H2O', 'H2O2'])
+
+
+def test_formula_invalida_e_value_error():
+    with pytest.raises(ValueError):
+        balancear(['H2', 'O2'], ['H2O)'])
+
+
+def test_cache_acerta_com_compostos_em_outra_ordem(monkeypatch):
+    assert balancear_com_cache(*KMNO4) == [2, 16, 2, 2, 8, 5]
+
+    def nao_recalcular(*args):
+        raise AssertionError('a equação deveria vir do cache')
+    monkeypatch.setattr(balanceador, 'balancear', nao_recalcular)
+
+    assert balancear_com_cache(['HCl', 'KMnO4'], ['Cl2', 'H2O', 'MnCl2', 'KCl']) == [16, 2, 5, 8, 2, 2]
+    assert balanceador.estatisticas_cache()['acertos'] == 1
+
+
+def test_cache_sqlite_sobrevive_ao_cache_em_memoria(monkeypatch, tmp_path):
+    monkeypatch.setattr(balanceador, '_tabela', balanceador._TabelaBalanceamentos(str(tmp_path / 'balanceamentos.db')))
+    assert balancear_com_cache(*COBRE) == [3, 8, 3, 2, 4]
+    balanceador.limpar_cache()
+    monkeypatch.setattr(balanceador, 'balancear', lambda *args: pytest.fail('a equação deveria vir do SQLite'))
+    assert balancear_com_cache(['HNO3', 'Cu'], ['H2O', 'NO', 'Cu(NO3)2']) == [8, 3, 4, 2, 3]
+
+
+def test_balanceamento_pela_calculadora_de_quimica():
+    import calc_quimica
+    resultado, _ = calc_quimica.calculate_quimica(
+        'balanceamento', equacao_reagentes='Cu + HNO3', equacao_produtos='Cu(NO3)2 + NO + H2O')
+    assert resultado == {'equacao_balanceada': '3Cu + 8HNO3 → 3Cu(NO3)2 + 2NO + 4H2O'}
+    with pytest.raises(ValueError, match='Erro no Balanceamento'):
+        calc_quimica.calculate_quimica('balanceamento', equacao_reagentes='CO', equacao_produtos='CO2')
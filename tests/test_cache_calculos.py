@@ -0,0 +1,38 @@
+"""Cache dos resultados: chaves normalizadas e requisições com listas fora do cache."""
+
+from cache_calculos import ArmazenamentoMemoria, CacheCalculos
+
+
+def _cache_contando(**opcoes):
+    cache = CacheCalculos(ArmazenamentoMemoria(10, 0))
+    chamadas = []
+
+    @cache.memorizar('fisica', **opcoes)
+    def processar(dados):
+        chamadas.append(dados)
+        return {'resultado': len(chamadas)}, 200
+
+    return cache, processar, chamadas
+
+
+def test_entradas_equivalentes_usam_a_mesma_chave():
+    cache, processar, chamadas = _cache_contando()
+    assert processar({'tipo_calculo': 'velocidade_media', 'deslocamento': '2', 'tempo': 4}) == ({'resultado': 1}, 200)
+    assert processar({'tipo_calculo': 'velocidade_media', 'deslocamento': 2.0, 'tempo': ' 4 '}) == ({'resultado': 1}, 200)
+    assert len(chamadas) == 1
+    assert cache.acertos == 1
+
+
+def test_listas_nao_entram_no_cache():
+    cache, processar, chamadas = _cache_contando(ignorar_listas=True)
+    dados = {'tipo_calculo': 'velocidade_media', 'deslocamento': [10, 20], 'tempo': 2}
+    processar(dados)
+    processar(dados)
+    assert len(chamadas) == 2
+    assert cache.armazenamento.tamanho() == 0
+    assert (cache.acertos, cache.falhas) == (0, 0)
+    # Sem listas o cache continua valendo
+    processar({'tipo_calculo': 'velocidade_media', 'deslocamento': 10, 'tempo': 2})
+    processar({'tipo_calculo': 'velocidade_media', 'deslocamento': 10, 'tempo': 2})
+    assert len(chamadas) == 3
+    assert cache.armazenamento.tamanho() == 1
@@ -0,0 +1,106 @@
+"""Cálculos de física: registro por incógnita, assinatura completa e entradas em lista."""
+
+import math
+import random
+
+import pytest
+
+import calc_fisica
+from calc_fisica_vetorizado import FORMULAS
+
+
+def test_registro_e_assinatura_completa_usam_o_mesmo_ramo():
+    assert calc_fisica.calculate_fisica('velocidade_media', deslocamento='100', tempo='4') == \
+        ({'velocidade_media': 25.0}, {'velocidade_media': 'm/s'})
+    # Calculadoras Tk: argumentos posicionais, com None na incógnita
+    assert calc_fisica.velocidade_media(25.0, None, 4.0) == ({'deslocamento': 100.0}, {'deslocamento': 'm'})
+
+
+def test_erros_mantem_o_rotulo_do_calculo():
+    with pytest.raises(ValueError, match='^Tempo não pode ser zero'):
+        calc_fisica.velocidade_media(None, 10.0, 0.0)
+    with pytest.raises(ValueError, match='^Erro no cálculo do Aumento da Imagem: float division by zero'):
+        calc_fisica.aumento_da_imagem(None, 0.0, 2.0)
+    with pytest.raises(ValueError, match='Exatamente dois valores'):
+        calc_fisica.velocidade_media(None, None, 4.0)
+    with pytest.raises(ValueError, match='Exatamente 2 valores'):
+        calc_fisica.calculate_fisica('velocidade_media', tempo=4)
+
+
+@pytest.mark.parametrize('tipo,incognita', [(tipo, incognita) for tipo in FORMULAS for incognita in FORMULAS[tipo]])
+def test_escalar_e_lista_de_um_elemento_coincidem(tipo, incognita):
+    # Zeros e negativos aparecem com frequência para exercitar as validações dos dois caminhos
+    sorteio = random.Random(f'{tipo}:{incognita}')
+    for _ in range(200):
+        valores = {
+            parametro: sorteio.choice([0.0, 1.0, -2.0, 3.5, sorteio.uniform(-20, 20)])
+            for parametro in FORMULAS[tipo] if parametro != incognita
+        }
+        resultado, unidades, _ = calc_fisica.calculate_fisica_vetorizado(
+            tipo, **{parametro: [valor] for parametro, valor in valores.items()})
+        (chave, vetor), = resultado.items()
+        try:
+            escalar, unidades_escalar = calc_fisica.calculate_fisica(tipo, **valores)
+        except ValueError:
+            assert math.isnan(vetor[0]), valores
+            continue
+        assert list(escalar) == [chave], valores
+        assert unidades_escalar == unidades, valores
+        assert math.isclose(escalar[chave], vetor[0], rel_tol=1e-12, abs_tol=1e-300), valores
+
+
+def test_calculate_fisica_recusa_listas():
+    with pytest.raises(ValueError, match='calculate_fisica_vetorizado'):
+        calc_fisica.calculate_fisica('velocidade_media', deslocamento=[10, 20], tempo=2)
+
+
+def test_rota_fisica_aceita_listas_e_devolve_invalidos(cliente):
+    resposta = cliente.post('/fisica', json={
+        'tipo_calculo': 'velocidade_media', 'deslocamento': [10, 20, 30], 'tempo': [2, 4, 0]
+    })
+    assert resposta.status_code == 200
+    corpo = resposta.get_json()
+    assert corpo['resultado'] == {'velocidade_media': [5.0, 5.0, None]}
+    assert corpo['unidades'] == {'velocidade_media': 'm/s'}
+    assert list(corpo['invalidos'].values()) == [[False, False, True]]
+
+
+def test_rota_fisica_listas_invalidas_retornam_400(cliente):
+    incompativeis = cliente.post('/fisica', json={
+        'tipo_calculo': 'velocidade_media', 'deslocamento': [10, 20, 30], 'tempo': [2, 4]
+    })
+    assert incompativeis.status_code == 400
+    texto = cliente.post('/fisica', json={
+        'tipo_calculo': 'velocidade_media', 'deslocamento': ['dez'], 'tempo': 2
+    })
+    assert texto.status_code == 400
+
+
+@pytest.mark.parametrize('especificacao', [
+    {'inicio': 1, 'fim': 2, 'passos': 10 ** 9},
+    {'inicio': 1, 'fim': 1e6, 'passo': 1e-6},
+    {'inicio': 0, 'fim': 1e300, 'passo': 1e-300},
+])
+def test_varredura_grande_demais_e_recusada_antes_de_alocar(cliente, especificacao):
+    resposta = cliente.post('/fisica/varredura', json={
+        'tipo_calculo': 'velocidade_media', 'deslocamento': 100, 'varredura': {'tempo': especificacao}
+    })
+    assert resposta.status_code == 400
+    assert 'limite' in resposta.get_json()['error'] or 'pequeno demais' in resposta.get_json()['error']
+
+
+def test_varredura_em_grade_limita_o_produto_dos_eixos(cliente):
+    resposta = cliente.post('/fisica/varredura', json={
+        'tipo_calculo': 'velocidade_media',
+        'varredura': {'tempo': {'inicio': 1, 'fim': 2, 'passos': 200},
+                      'deslocamento': {'inicio': 0, 'fim': 10, 'passo': 0.1}}
+    })
+    assert resposta.status_code == 400
+    assert '20200 pontos' in resposta.get_json()['error']
+
+    resposta = cliente.post('/fisica/varredura', json={
+        'tipo_calculo': 'velocidade_media', 'deslocamento': 10,
+        'varredura': {'tempo': {'inicio': 1, 'fim': 2, 'passo': 0.25}}
+    })
+    assert resposta.status_code == 200
+    assert resposta.get_json()['eixos'][0]['valores'] == [1.0, 1.25, 1.5, 1.75, 2.0]
@@ -0,0 +1,69 @@
+import json
+import multiprocessing
+import sqlite3
+
+import pytest
+
+from historico_chat import HistoricoChat
+
+
+def _contar(banco):
+    return sqlite3.connect(banco).execute('SELECT COUNT(*) FROM chat_messages').fetchone()[0]
+
+
+@pytest.fixture
+def arquivos(tmp_path):
+    arquivo_json = tmp_path / 'chat_history.json'
+    arquivo_json.write_text(json.dumps({
+        'u1': [{'timestamp': f'2024-01-0{i + 1}', 'message': f'm{i}', 'response': 'r'} for i in range(3)],
+        'u2': [{'timestamp': '2024-02-01', 'message': 'x', 'response': 'y'}],
+    }), encoding='utf-8')
+    return str(tmp_path / 'historico.db'), str(arquivo_json)
+
+
+def test_migra_uma_vez_e_renomeia(arquivos):
+    banco, arquivo_json = arquivos
+    assert HistoricoChat(banco, arquivo_json).migrar() == 4
+    assert HistoricoChat(banco, arquivo_json).migrar() == 0
+    assert _contar(banco) == 4
+    assert [m['message'] for m in HistoricoChat(banco, arquivo_json).historico('u1')] == ['m0', 'm1', 'm2']
+
+
+def test_arquivo_recolocado_apos_migracao_nao_duplica(arquivos, tmp_path):
+    banco, arquivo_json = arquivos
+    conteudo = (tmp_path / 'chat_history.json').read_text(encoding='utf-8')
+    HistoricoChat(banco, arquivo_json).migrar()
+    # Ex.: o rename falhou ou o arquivo foi restaurado de um backup
+    (tmp_path / 'chat_history.json').write_text(conteudo, encoding='utf-8')
+    assert HistoricoChat(banco, arquivo_json).migrar() == 0
+    assert _contar(banco) == 4
+
+
+def test_arquivo_ilegivel_nao_e_renomeado(tmp_path):
+    arquivo_json = tmp_path / 'chat_history.json'
+    arquivo_json.write_text('{invalido', encoding='utf-8')
+    assert HistoricoChat(str(tmp_path / 'historico.db'), str(arquivo_json)).migrar() == 0
+    assert arquivo_json.exists()
+
+
+def _registrar_em_paralelo(barreira, banco, arquivo_json):
+    barreira.wait()
+    HistoricoChat(banco, arquivo_json).registrar('u1', 'oi', 'olá')
+
+
+def test_varios_processos_nao_duplicam_a_migracao(arquivos):
+    banco, arquivo_json = arquivos
+    processos_total = 4
+    barreira = multiprocessing.Barrier(processos_total)
+    processos = [
+        multiprocessing.Process(target=_registrar_em_paralelo, args=(barreira, banco, arquivo_json))
+        for _ in range(processos_total)
+    ]
+    for processo in processos:
+        processo.start()
+    for processo in processos:
+        processo.join(30)
+
+    assert [processo.exitcode for processo in processos] == [0] * processos_total
+    # 4 mensagens migradas + 1 registrada por processo
+    assert _contar(banco) == 4 + processos_total
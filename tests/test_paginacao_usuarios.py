@@ -0,0 +1,164 @@
+"""Listagem paginada de usuários: cursores em cada ordenação, busca por prefixo e cursores adulterados."""
+
+import base64
+import sqlite3
+
+import pytest
+
+from paginacao_usuarios import ORDENACOES, CursorInvalido, codificar_cursor, criar_indices, listar_usuarios
+
+COLUNAS = ['id', 'nome_usuario', 'email', 'created_at']
+
+# Datas repetidas e nomes repetidos para que o desempate pelo id seja exercitado
+USUARIOS = [
+    ('bruno', 'bruno@exemplo.com', '2024-01-01 10:00:00'),
+    ('ana', 'ana@exemplo.com', '2024-01-01 10:00:00'),
+    ('carla', 'carla@exemplo.com', '2024-01-02 08:30:00'),
+    ('ana', 'ana.2@exemplo.com', '2024-01-01 10:00:00'),
+    ('a_b', 'ab@exemplo.com', '2024-01-02 08:30:00'),
+    ('a%c', 'ac@exemplo.com', '2024-01-03 12:00:00'),
+    ('axb', 'axb@exemplo.com', '2024-01-01 10:00:00'),
+    ('ana', 'ana.3@exemplo.com', '2024-01-03 12:00:00'),
+    ('daniel', 'd_1@exemplo.com', '2024-01-02 08:30:00'),
+    ('bruno', 'bruno.2@exemplo.com', '2024-01-03 12:00:00'),
+    ('eva', 'dx1@exemplo.com', '2024-01-01 10:00:00'),
+]
+
+
+@pytest.fixture
+def db():
+    conexao = sqlite3.connect(':memory:')
+    conexao.row_factory = sqlite3.Row
+    # Mesmas colunas da tabela do app, sem o UNIQUE em nome_usuario: a listagem não depende dele
+    conexao.execute('''
+        CREATE TABLE usuarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome_usuario TEXT NOT NULL,
+            senha TEXT NOT NULL DEFAULT '',
+            email TEXT NOT NULL,
+            nome_completo TEXT,
+            data_nascimento TEXT,
+            serie TEXT,
+            materia_dificuldade TEXT,
+            is_admin INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conexao.executemany('INSERT INTO usuarios (nome_usuario, email, created_at) VALUES (?, ?, ?)', USUARIOS)
+    criar_indices(conexao)
+    yield conexao
+    conexao.close()
+
+
+def _esperado(ordem, descendente):
+    linhas = [(i + 1, *usuario) for i, usuario in enumerate(USUARIOS)]
+    coluna = {'id': 0, 'nome_usuario': 1, 'created_at': 3}[ordem]
+    ids = [linha[0] for linha in sorted(linhas, key=lambda linha: (linha[coluna], linha[0]))]
+    return ids[::-1] if descendente else ids
+
+
+def _ids(pagina):
+    return [usuario['id'] for usuario in pagina.usuarios]
+
+
+@pytest.mark.parametrize('limite', [1, 3, 4])
+@pytest.mark.parametrize('descendente', [False, True])
+@pytest.mark.parametrize('ordem', ORDENACOES)
+def test_avanca_e_volta_em_cada_ordenacao(db, ordem, descendente, limite):
+    opcoes = dict(ordem=ordem, descendente=descendente, limite=limite)
+
+    # Avança até a última página
+    paginas = [listar_usuarios(db, COLUNAS, **opcoes)]
+    assert paginas[0].anterior is None
+    while paginas[-1].proximo:
+        paginas.append(listar_usuarios(db, COLUNAS, apos=paginas[-1].proximo, **opcoes))
+    assert [i for pagina in paginas for i in _ids(pagina)] == _esperado(ordem, descendente)
+    assert all(len(_ids(pagina)) == limite for pagina in paginas[:-1])
+
+    # Volta da última até a primeira, reencontrando as mesmas páginas
+    voltando = [paginas[-1]]
+    while voltando[-1].anterior:
+        voltando.append(listar_usuarios(db, COLUNAS, antes=voltando[-1].anterior, **opcoes))
+    assert [_ids(pagina) for pagina in reversed(voltando)] == [_ids(pagina) for pagina in paginas]
+    # A primeira página alcançada voltando ainda sabe avançar
+    assert voltando[-1].proximo == paginas[0].proximo
+
+
+def test_datas_saem_formatadas(db):
+    pagina = listar_usuarios(db, COLUNAS, limite=1)
+    assert pagina.usuarios[0]['created_at'] == '01/01/2024 07:00:00'
+
+
+def test_busca_trata_curingas_como_texto(db):
+    def nomes(busca, **opcoes):
+        return [u['nome_usuario'] for u in listar_usuarios(db, COLUNAS, busca=busca, **opcoes).usuarios]
+
+    assert nomes('a_') == ['a_b']
+    assert nomes('a%') == ['a%c']
+    assert nomes('%') == []
+    # No e-mail, 'd_' não pode casar com 'dx1@...'
+    assert nomes('d_') == ['daniel']
+    assert sorted(nomes('a')) == ['a%c', 'a_b', 'ana', 'ana', 'ana', 'axb']
+
+
+def test_busca_com_paginacao(db):
+    primeira = listar_usuarios(db, COLUNAS, busca='an', ordem='created_at', limite=2)
+    segunda = listar_usuarios(db, COLUNAS, busca='an', ordem='created_at', limite=2, apos=primeira.proximo)
+    assert _ids(primeira) == [2, 4]
+    assert _ids(segunda) == [8]
+    assert segunda.proximo is None
+    assert _ids(listar_usuarios(db, COLUNAS, busca='an', ordem='created_at', limite=2, antes=segunda.anterior)) == [2, 4]
+
+
+def _b64(texto):
+    return base64.urlsafe_b64encode(texto.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+CURSORES_INVALIDOS = [
+    'isto não é base64',
+    '@@@@',
+    _b64('não é json'),
+    _b64('null'),
+    _b64('{"a": 1, "b": 2}'),
+    _b64('[1]'),
+    _b64('[1, 2, 3]'),
+    _b64('[[1], 2]'),
+    _b64('[1, "2"]'),
+    _b64('[true, true]'),
+    _b64('[1e999, 1]'),
+    _b64(f'[{2 ** 70}, {2 ** 70}]'),
+    _b64('[' * 100000 + ']' * 100000),
+]
+
+
+@pytest.mark.parametrize('cursor', CURSORES_INVALIDOS)
+@pytest.mark.parametrize('direcao', ['apos', 'antes'])
+def test_cursor_adulterado(db, cursor, direcao):
+    with pytest.raises(CursorInvalido):
+        listar_usuarios(db, COLUNAS, **{direcao: cursor})
+
+
+def test_cursor_de_outra_ordenacao(db):
+    pagina = listar_usuarios(db, COLUNAS, ordem='created_at', limite=2)
+    with pytest.raises(CursorInvalido):
+        listar_usuarios(db, COLUNAS, ordem='id', apos=pagina.proximo)
+    # O id de um cursor de 'id' deve coincidir com o valor
+    with pytest.raises(CursorInvalido):
+        listar_usuarios(db, COLUNAS, apos=codificar_cursor(5, 6))
+
+
+@pytest.fixture
+def cliente_admin(cliente):
+    with cliente.session_transaction() as sessao:
+        sessao['is_admin'] = True
+    return cliente
+
+
+@pytest.mark.parametrize('rota', ['/admin/usuarios', '/admin-secret-123/dashboard'])
+def test_rotas_respondem_400_a_cursor_adulterado(cliente_admin, rota):
+    assert cliente_admin.get(rota).status_code == 200
+    assert cliente_admin.get(rota, query_string={'apos': codificar_cursor(0, 0)}).status_code == 200
+    for cursor in ('lixo', _b64('[{"x": 1}, 1]'), _b64(f'[1, {2 ** 70}]')):
+        for direcao in ('apos', 'antes'):
+            resposta = cliente_admin.get(rota, query_string={direcao: cursor, 'ordem': 'created_at'})
+            assert resposta.status_code == 400, (cursor, direcao)